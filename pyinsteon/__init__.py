@@ -11,6 +11,7 @@ from .listener_exception_handler import ListenerExceptionHandler
 from .managers.device_link_manager import DeviceLinkManager
 from .managers.device_manager import DeviceManager
 from .managers.link_manager.default_links import async_add_default_links
+from .managers.link_manager.link_index import LinkIndex
 
 # pylint: disable=unused-import
 from .managers.x10_manager import async_x10_all_lights_off  # noqa: F401
@@ -22,9 +23,11 @@ from .utils import subscribe_topic
 
 _LOGGER_TOPICS = logging.getLogger("pyinsteon.topics")
 X10_RECEIVED_HANDLER = X10Received()
+_CONFIG_TASKS = set()
 
 devices = DeviceManager()
 link_manager = DeviceLinkManager(devices)
+link_index = LinkIndex(devices)
 subscribe_topic(async_add_default_links, ADD_DEFAULT_LINKS)
 
 
@@ -35,6 +38,7 @@ async def async_connect(
     username=None,
     password=None,
     hub_version=2,
+    modem_config=None,
     **kwargs,
 ):
     """Connect to the Insteon Modem.
@@ -46,6 +50,11 @@ async def async_connect(
         username: Hub v2 username
         password: Hub v2 password
         hub_version: Hub version (default=2)
+        modem_config: Cached modem flags as a dictionary of
+            `disable_auto_linking`, `monitor_mode`, `auto_led` and `deadman`.
+            The flags are loaded and read from the modem in the background.
+        fast_connect: Connect without fixed waits (default=False)
+        modem_id: Cached modem `DeviceId` used with `fast_connect`
 
     Returns an Insteon Modem (PLM or Hub).
 
@@ -64,7 +73,13 @@ async def async_connect(
         raise ConnectionError from err
     devices.modem = modem
     devices.id_manager.start()
-    await devices.modem.async_get_configuration()
+    if modem_config is None:
+        await devices.modem.async_get_configuration()
+    else:
+        devices.modem.load_configuration(**modem_config)
+        task = asyncio.create_task(devices.modem.async_get_configuration())
+        _CONFIG_TASKS.add(task)
+        task.add_done_callback(_CONFIG_TASKS.discard)
     return devices
 
 
@@ -74,7 +89,7 @@ async def async_close():
     for addr in devices:
         if devices[addr].is_battery:
             devices[addr].close()
-    devices.id_manager.close()
+    await devices.async_close()
     await asyncio.sleep(0.1)
 
 
@@ -4,7 +4,6 @@ The All-Link database contains database records that represent links to other
 Insteon devices that either respond to or control the current device.
 """
 
-import asyncio
 import logging
 
 from ..constants import ALDBStatus, EngineVersion, ReadWriteMode
@@ -13,6 +12,9 @@ from .aldb_base import ALDBBase
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of records to request past the last known record when the HWM is unknown
+TAIL_RECORDS = 10
+
 
 class ALDB(ALDBBase):
     """All-Link Database for a device."""
@@ -65,7 +67,6 @@ class ALDB(ALDBBase):
                 read_write_mode=mode,
             ):
                 self._add_record(rec)
-                await asyncio.sleep(0.1)
                 if self._read_write_mode == ReadWriteMode.UNKNOWN:
                     self._read_write_mode = mode
                 if self._is_loaded():
@@ -74,17 +75,21 @@ class ALDB(ALDBBase):
             await self._read_manager.async_stop()
 
         if not self._is_loaded() and num_recs != 0:
-            # Loading all records did not work so now we read individual missing records
-            next_record = self._calc_next_record()
-            while next_record:
-                async for rec in self._read_manager.async_read(
-                    mem_addr=next_record, num_recs=1
-                ):
-                    self._add_record(rec)
-                prev_record = next_record
-                next_record = self._calc_next_record()
-                if next_record == prev_record:
-                    # The ALDB did not return the requested record so stop
+            # Loading all records did not work so now we read the missing ranges
+            missing = self._calc_missing_records()
+            while missing:
+                for start, count in missing:
+                    try:
+                        async for rec in self._read_manager.async_read(
+                            mem_addr=start, num_recs=count, read_write_mode=mode
+                        ):
+                            self._add_record(rec)
+                    finally:
+                        await self._read_manager.async_stop()
+                prev_missing = missing
+                missing = self._calc_missing_records()
+                if missing == prev_missing:
+                    # The ALDB did not return the requested records so stop
                     break
 
         if (
@@ -129,20 +134,17 @@ class ALDB(ALDBBase):
         self._notify_change(record)
         return True
 
-    def _calc_next_record(self) -> int:
-        """Calculate the memory address of the next missing record."""
+    def _calc_missing_records(self):
+        """Return the missing record ranges as (mem_addr, num_recs) tuples."""
         if not self._records:
-            return self._mem_addr
-        last_addr = list(self)[-1]
-        if last_addr == self._mem_addr:
-            return last_addr - 8
-
-        for mem_addr in range(self._mem_addr, last_addr, -8):
-            try:
-                rec = self._records[mem_addr]
-                if mem_addr == last_addr and rec.is_high_water_mark:
-                    return None
-            except IndexError:
-                return mem_addr
-
-        return last_addr - 8
+            return [(self._mem_addr, 0)]
+        missing = []
+        prev_addr = self._mem_addr + 8
+        for mem_addr in sorted(self._records, reverse=True):
+            count = (prev_addr - mem_addr) // 8 - 1
+            if count > 0:
+                missing.append((prev_addr - 8, count))
+            prev_addr = mem_addr
+        if self.high_water_mark_mem_addr is None:
+            missing.append((prev_addr - 8, TAIL_RECORDS))
+        return missing
@@ -2,13 +2,14 @@
 
 from abc import ABC, abstractmethod
 import logging
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from ..address import Address
 from ..constants import ALDBStatus, EngineVersion, ReadWriteMode, ResponseStatus
 from ..managers.aldb_write_manager import ALDBWriteException, ALDBWriteManager
 from ..topics import ALDB_LINK_CHANGED, ALDB_STATUS_CHANGED, ENGINE_VERSION
 from ..utils import publish_topic, subscribe_topic, unsubscribe_topic
+from .aldb_image import ALDBImage, PackedRecords
 from .aldb_record import ALDBRecord, new_aldb_record_from_existing
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,7 +29,13 @@ HWM_RECORD = ALDBRecord(
 
 
 class ALDBBase(ABC):
-    """Represents a base class for a device All-Link database."""
+    """Represents a base class for a device All-Link database.
+
+    Set `record_storage` to `ALDBImage` to store records as a memory image
+    rather than as record objects.
+    """
+
+    record_storage = dict
 
     def __init__(
         self,
@@ -39,7 +46,8 @@ class ALDBBase(ABC):
     ):
         """Instantiate the ALL-Link Database object."""
         self._read_write_mode = ReadWriteMode.STANDARD
-        self._records = {}
+        self._saved_records = None
+        self._records = self._new_records()
         self._status = ALDBStatus.EMPTY
         self._version = version
 
@@ -84,6 +92,19 @@ class ALDBBase(ABC):
         for mem_addr in sorted(self._records, reverse=True):
             yield mem_addr, self._records[mem_addr]
 
+    def links(self) -> Dict[int, Tuple[Address, int, bool]]:
+        """Return the target, group and controller flag of each in use link.
+
+        Saved records are not decoded.
+        """
+        if self._saved_records is not None:
+            return self._saved_records.links()
+        return {
+            mem_addr: (rec.target, rec.group, rec.is_controller)
+            for mem_addr, rec in self._records.items()
+            if rec.is_in_use and not rec.is_high_water_mark
+        }
+
     @property
     def address(self) -> Address:
         """Return the address of the device."""
@@ -143,7 +164,7 @@ class ALDBBase(ABC):
         """
         for _, rec in self.items():
             self._notify_change(rec, force_delete=True)
-        self._records = {}
+        self._records = self._new_records()
         self._dirty_records = {}
 
     def clear_pending(self):
@@ -194,15 +215,23 @@ class ALDBBase(ABC):
     def load_saved_records(
         self, status: ALDBStatus, records: List[ALDBRecord], first_mem_addr: int = None
     ):
-        """Load All-Link records from a dictionary of saved records."""
+        """Load All-Link records from a dictionary of saved records.
+
+        `PackedRecords` are decoded the first time the records are accessed,
+        so no record changed notifications are sent for them.
+        """
         self.clear()
+        if isinstance(records, PackedRecords):
+            self._saved_records = records
+            records = {}
         for mem_addr in records:
             record = records[mem_addr]
             self._records[mem_addr] = record
             self._notify_change(record)
 
-        if self._is_loaded() and self._records:
-            self._mem_addr = max(self._records)
+        mem_addrs = self._high_water_marks()
+        if self._is_loaded() and mem_addrs:
+            self._mem_addr = max(mem_addrs)
             self._update_status(ALDBStatus.LOADED)
             return
 
@@ -331,16 +360,8 @@ class ALDBBase(ABC):
                         result = ResponseStatus.SUCCESS
 
             if result == ResponseStatus.SUCCESS:
-                curr_rec = self._records.get(rec_to_write.mem_addr)
-                # If we wrote to the high water mark, append a new HWM record
-                if curr_rec and curr_rec.is_high_water_mark:
-                    new_hwm_rec = new_aldb_record_from_existing(
-                        HWM_RECORD, mem_addr=curr_rec.mem_addr - 8
-                    )
-                    self._records[new_hwm_rec.mem_addr] = new_hwm_rec
-                self._records[rec_to_write.mem_addr] = rec_to_write
+                self._update_written_record(rec_to_write)
                 success += 1
-                self._notify_change(rec_to_write)
             else:
                 if rec.mem_addr == 0x0000:
                     next_new_dirty -= 1
@@ -368,6 +389,16 @@ class ALDBBase(ABC):
         ):
             raise ValueError("Must have at least one criteria")
 
+        if isinstance(self._records, ALDBImage):
+            yield from self._records.find(
+                group=group,
+                target=target,
+                data3=data3,
+                is_controller=is_controller,
+                in_use=in_use,
+            )
+            return
+
         test_rec = ALDBRecord(
             memory=None,
             controller=is_controller,
@@ -402,6 +433,46 @@ class ALDBBase(ABC):
                 f"{self._address.id}.{ALDB_STATUS_CHANGED}", status=self._status
             )
 
+    def _update_written_record(self, rec_to_write: ALDBRecord):
+        """Update the records with a record written to the device."""
+        curr_rec = self._records.get(rec_to_write.mem_addr)
+        # If we wrote to the high water mark, append a new HWM record
+        if curr_rec and curr_rec.is_high_water_mark:
+            new_hwm_rec = new_aldb_record_from_existing(
+                HWM_RECORD, mem_addr=curr_rec.mem_addr - 8
+            )
+            self._records[new_hwm_rec.mem_addr] = new_hwm_rec
+        self._records[rec_to_write.mem_addr] = rec_to_write
+        self._notify_change(rec_to_write)
+
+    @property
+    def _records(self):
+        """Return the record storage, decoding any saved records first."""
+        if self._saved_records is not None:
+            saved_records = self._saved_records
+            self._saved_records = None
+            for mem_addr, record in saved_records.items():
+                self._record_storage[mem_addr] = record
+        return self._record_storage
+
+    @_records.setter
+    def _records(self, records):
+        """Set the record storage."""
+        self._saved_records = None
+        self._record_storage = records
+
+    def _high_water_marks(self):
+        """Return if each record is the high water mark by memory address."""
+        if self._saved_records is not None:
+            return self._saved_records.high_water_marks()
+        return {
+            mem_addr: rec.is_high_water_mark for mem_addr, rec in self._records.items()
+        }
+
+    def _new_records(self):
+        """Return an empty record storage."""
+        return self.record_storage()
+
     def _notify_change(self, record, force_delete=False):
         deleted = True if force_delete else not record.is_in_use
         topic = f"{self._address.id}.{ALDB_LINK_CHANGED}"
@@ -471,14 +542,15 @@ class ALDBBase(ABC):
         has_last = False
         has_all = True
         prev_addr = 0x0000
-        for mem_addr in sorted(self._records, reverse=True):
+        high_water_marks = self._high_water_marks()
+        for mem_addr in sorted(high_water_marks, reverse=True):
             if mem_addr == self._mem_addr:
                 has_first = True
-            if self._records[mem_addr].is_high_water_mark:
+            if high_water_marks[mem_addr]:
                 has_last = True
             if prev_addr != 0x0000 and has_all:
                 has_all = (prev_addr - mem_addr) == 8
-            if len(self._records) == 1 and has_last and has_first:
+            if len(high_water_marks) == 1 and has_last and has_first:
                 # Empty ALDB; yes it is possible with some devices like motion
                 has_all = True
             prev_addr = mem_addr
@@ -0,0 +1,289 @@
+"""All-Link Database records stored as a device memory image.
+
+Records are stored in a `bytearray` with the same 8 byte layout the device
+uses in memory. An `ALDBRecord` is only created when a record is accessed,
+so an ALDB uses about 9 bytes per record rather than a full record object.
+The record returned is a copy, so later changes to the image do not change
+records held by the caller.
+
+`PackedRecords` reads saved records packed as the memory address followed
+by the 8 record bytes, such as a slice of a saved device snapshot.
+"""
+
+from collections.abc import Mapping, MutableMapping
+import struct
+from typing import Dict, Iterator, Tuple
+
+from ..address import Address
+from ..data_types.all_link_record_flags import AllLinkRecordFlags
+from .aldb_record import (
+    RECORD_LENGTH,
+    ALDBRecord,
+    aldb_record_from_bytes,
+    aldb_record_to_bytes,
+)
+
+IN_USE_FLAG = 0x80
+CONTROLLER_FLAG = 0x40
+GROUP = 1
+TARGET = 2
+DATA3 = 7
+PACKED_RECORD = struct.Struct(f"<H{RECORD_LENGTH}s")
+PACKED_DATA = 2
+
+
+class ALDBImage(MutableMapping):
+    """Mapping of memory address to ALDB record stored as a memory image.
+
+    Slots are numbered down from the highest memory address stored. Records
+    with a memory address that does not fall on a slot boundary are stored
+    as record objects.
+    """
+
+    __slots__ = ("_first_mem_addr", "_image", "_present", "_count", "_other")
+
+    def __init__(self, records: Dict[int, ALDBRecord] = None):
+        """Init the ALDBImage class."""
+        self._first_mem_addr = None
+        self._image = bytearray()
+        self._present = bytearray()
+        self._count = 0
+        self._other: Dict[int, ALDBRecord] = {}
+        for mem_addr, record in (records or {}).items():
+            self[mem_addr] = record
+
+    def __len__(self):
+        """Return the number of records."""
+        return self._count + len(self._other)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate through the memory addresses in descending order."""
+        slots = (
+            self._first_mem_addr - slot * RECORD_LENGTH
+            for slot, present in enumerate(self._present)
+            if present
+        )
+        if not self._other:
+            return slots
+        return iter(sorted([*slots, *self._other], reverse=True))
+
+    def __contains__(self, mem_addr):
+        """Return True if a record is stored at a memory address."""
+        slot = self._slot(mem_addr)
+        if slot is None:
+            return mem_addr in self._other
+        return slot < len(self._present) and bool(self._present[slot])
+
+    def __getitem__(self, mem_addr) -> ALDBRecord:
+        """Return the record at a memory address."""
+        slot = self._slot(mem_addr)
+        if slot is None:
+            return self._other[mem_addr]
+        if slot >= len(self._present) or not self._present[slot]:
+            raise KeyError(mem_addr)
+        offset = slot * RECORD_LENGTH
+        return aldb_record_from_bytes(
+            mem_addr, self._image[offset : offset + RECORD_LENGTH]
+        )
+
+    def __setitem__(self, mem_addr, record: ALDBRecord):
+        """Store a record at a memory address."""
+        if self._first_mem_addr is None:
+            self._first_mem_addr = mem_addr
+        elif (
+            mem_addr > self._first_mem_addr
+            and (mem_addr - self._first_mem_addr) % RECORD_LENGTH == 0
+        ):
+            self._extend_up(mem_addr)
+        slot = self._slot(mem_addr)
+        if slot is None:
+            self._other[mem_addr] = record
+            return
+        if slot >= len(self._present):
+            grow = slot + 1 - len(self._present)
+            self._present.extend(bytes(grow))
+            self._image.extend(bytes(grow * RECORD_LENGTH))
+        offset = slot * RECORD_LENGTH
+        self._image[offset : offset + RECORD_LENGTH] = aldb_record_to_bytes(record)
+        if not self._present[slot]:
+            self._present[slot] = 1
+            self._count += 1
+
+    def __delitem__(self, mem_addr):
+        """Remove the record at a memory address."""
+        slot = self._slot(mem_addr)
+        if slot is None:
+            del self._other[mem_addr]
+            return
+        if slot >= len(self._present) or not self._present[slot]:
+            raise KeyError(mem_addr)
+        self._present[slot] = 0
+        self._count -= 1
+        # Release the unused slots at the end of the image
+        last = len(self._present)
+        while last and not self._present[last - 1]:
+            last -= 1
+        del self._present[last:]
+        del self._image[last * RECORD_LENGTH :]
+
+    def __repr__(self):
+        """Return a representation of the records."""
+        return repr(dict(self.items()))
+
+    def copy(self) -> "ALDBImage":
+        """Return a copy of the records."""
+        image = ALDBImage()
+        image._first_mem_addr = self._first_mem_addr
+        image._image = bytearray(self._image)
+        image._present = bytearray(self._present)
+        image._count = self._count
+        image._other = dict(self._other)
+        return image
+
+    def find(
+        self,
+        group: int = None,
+        target: Address = None,
+        data3: int = None,
+        is_controller: bool = None,
+        in_use: bool = None,
+    ) -> Iterator[ALDBRecord]:
+        """Find the records matching the criteria in memory address order.
+
+        Matching follows `ALDBRecord` equality. Only matching records are
+        decoded.
+        """
+        if target is not None:
+            slots = self._find_target(bytes(Address(target)))
+        else:
+            slots = (slot for slot, present in enumerate(self._present) if present)
+        image = self._image
+        found = []
+        for slot in slots:
+            offset = slot * RECORD_LENGTH
+            flags = image[offset]
+            rec_controller = bool(flags & CONTROLLER_FLAG)
+            rec_group = image[offset + GROUP]
+            if (
+                (in_use is not None and bool(flags & IN_USE_FLAG) != in_use)
+                or (is_controller is not None and rec_controller != is_controller)
+                or (group is not None and rec_group != group)
+            ):
+                continue
+            if (
+                not rec_controller
+                and data3 is not None
+                and not (group == 0 and rec_group == 0)
+                and image[offset + DATA3] != data3
+            ):
+                continue
+            found.append(self._first_mem_addr - offset)
+
+        if self._other:
+            test_rec = ALDBRecord(
+                memory=None,
+                controller=is_controller,
+                group=group,
+                target=target,
+                data1=None,
+                data2=None,
+                data3=data3,
+            )
+            for mem_addr, rec in self._other.items():
+                if rec == test_rec and (in_use is None or rec.is_in_use == in_use):
+                    found.append(mem_addr)
+            found.sort(reverse=True)
+
+        for mem_addr in found:
+            yield self[mem_addr]
+
+    def _slot(self, mem_addr) -> int:
+        """Return the slot of a memory address or None if not on a slot."""
+        if self._first_mem_addr is None:
+            return None
+        offset = self._first_mem_addr - mem_addr
+        if offset < 0 or offset % RECORD_LENGTH:
+            return None
+        return offset // RECORD_LENGTH
+
+    def _extend_up(self, mem_addr: int):
+        """Add slots above the current first memory address."""
+        grow = (mem_addr - self._first_mem_addr) // RECORD_LENGTH
+        self._present[0:0] = bytes(grow)
+        self._image[0:0] = bytes(grow * RECORD_LENGTH)
+        self._first_mem_addr = mem_addr
+
+    def _find_target(self, target: bytes) -> Iterator[int]:
+        """Return the slots of the in use records that have a target address."""
+        image = self._image
+        present = self._present
+        pos = image.find(target, TARGET)
+        while pos != -1:
+            if (pos - TARGET) % RECORD_LENGTH == 0:
+                slot = pos // RECORD_LENGTH
+                if present[slot]:
+                    yield slot
+                pos = image.find(target, pos + RECORD_LENGTH)
+            else:
+                pos = image.find(target, pos + 1)
+
+
+class PackedRecords(Mapping):
+    """Read only mapping of memory address to packed ALDB record.
+
+    `buffer` is any bytes like object such as a `memoryview` slice of a saved
+    device snapshot. A record is only decoded when it is accessed.
+    """
+
+    __slots__ = ("_buffer", "_offsets")
+
+    def __init__(self, buffer):
+        """Init the PackedRecords class."""
+        self._buffer = buffer
+        self._offsets = None
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self._buffer) // PACKED_RECORD.size
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate through the memory addresses in the order they were packed."""
+        return iter(self._get_offsets())
+
+    def __getitem__(self, mem_addr) -> ALDBRecord:
+        """Return the record at a memory address."""
+        offset = self._get_offsets()[mem_addr]
+        _, data = PACKED_RECORD.unpack_from(self._buffer, offset)
+        return aldb_record_from_bytes(mem_addr, data)
+
+    def high_water_marks(self) -> Dict[int, bool]:
+        """Return if each record is the high water mark without decoding it."""
+        return {
+            mem_addr: AllLinkRecordFlags(self._buffer[offset + PACKED_DATA]).is_hwm
+            for mem_addr, offset in self._get_offsets().items()
+        }
+
+    def links(self) -> Dict[int, Tuple[Address, int, bool]]:
+        """Return the target, group and controller flag of each in use link.
+
+        Records are read without decoding them.
+        """
+        links = {}
+        for mem_addr, offset in self._get_offsets().items():
+            data = offset + PACKED_DATA
+            flags = AllLinkRecordFlags(self._buffer[data])
+            if not flags.is_in_use or flags.is_hwm:
+                continue
+            target = Address(bytes(self._buffer[data + TARGET : data + TARGET + 3]))
+            links[mem_addr] = (target, self._buffer[data + GROUP], flags.is_controller)
+        return links
+
+    def _get_offsets(self) -> Dict[int, int]:
+        """Return the buffer offset of each memory address."""
+        if self._offsets is None:
+            self._offsets = {}
+            for index in range(len(self)):
+                offset = index * PACKED_RECORD.size
+                mem_addr, _ = PACKED_RECORD.unpack_from(self._buffer, offset)
+                self._offsets[mem_addr] = offset
+        return self._offsets
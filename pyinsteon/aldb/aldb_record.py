@@ -2,11 +2,28 @@
 
 from ..address import Address
 from ..constants import AllLinkMode
+from ..data_types.all_link_record_flags import AllLinkRecordFlags
+
+RECORD_LENGTH = 8
 
 
 class ALDBRecord:
     """Represents an ALDB record."""
 
+    __slots__ = (
+        "_memory_location",
+        "_target",
+        "_group",
+        "_data1",
+        "_data2",
+        "_data3",
+        "_controller",
+        "_in_use",
+        "_high_water_mark",
+        "_bit5",
+        "_bit4",
+    )
+
     def __init__(
         self,
         memory: int,
@@ -293,3 +310,44 @@ def new_aldb_record_from_existing(rec: ALDBRecord, **kwargs):
         bit5=bit5_set,
         bit4=bit4_set,
     )
+
+
+def aldb_record_to_bytes(rec: ALDBRecord) -> bytes:
+    """Return the device memory bytes of an ALDB record.
+
+    Bytes are in memory order starting at `rec.mem_addr - 7` (the control
+    flags) and ending at `rec.mem_addr` (data3).
+    """
+    return bytes(
+        [
+            rec.control_flags,
+            rec.group,
+            rec.target.high,
+            rec.target.middle,
+            rec.target.low,
+            rec.data1,
+            rec.data2,
+            rec.data3,
+        ]
+    )
+
+
+def aldb_record_from_bytes(mem_addr: int, data: bytes) -> ALDBRecord:
+    """Create an ALDB record from device memory bytes.
+
+    `data` is in memory order as returned by `aldb_record_to_bytes`.
+    """
+    flags = AllLinkRecordFlags(data[0])
+    return ALDBRecord(
+        memory=mem_addr,
+        controller=flags.is_controller,
+        group=data[1],
+        target=Address(bytes(data[2:5])),
+        data1=data[5],
+        data2=data[6],
+        data3=data[7],
+        in_use=flags.is_in_use,
+        high_water_mark=flags.is_hwm,
+        bit4=flags.is_bit_4_set,
+        bit5=flags.is_bit_5_set,
+    )
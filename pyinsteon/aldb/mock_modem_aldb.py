@@ -87,7 +87,7 @@ class MockModemALDB(ALDBBase):
     async def _async_load_standard(self):
         """Load using get first and get next methods."""
         next_mem_addr = self.first_mem_addr
-        self._records = {}
+        self._records = self._new_records()
         async for rec in self._read_manager.async_load_standard():
             rec.mem_addr = next_mem_addr
             self._records[next_mem_addr] = rec
@@ -98,7 +98,7 @@ class MockModemALDB(ALDBBase):
         """Load using EEPROM read method."""
         _LOGGER.debug("Loading from EEPROM")
         next_mem_addr = self.first_mem_addr
-        self._records = {}
+        self._records = self._new_records()
         record = await self._read_manager.async_read_record(next_mem_addr)
         while record:
             self._records[record.mem_addr] = record
@@ -1,12 +1,14 @@
 """All-Link database for an Insteon Modem."""
 
 import logging
+from typing import Tuple
 
 from .. import pub
 from ..address import Address
-from ..constants import ALDBStatus, EngineVersion, ReadWriteMode
+from ..constants import ALDBStatus, EngineVersion, ReadWriteMode, ResponseStatus
 from ..managers.aldb_im_read_manager import ImReadManager
 from ..managers.aldb_im_write_manager import ImWriteManager
+from ..managers.aldb_write_manager import ALDBWriteException
 from ..topics import ALL_LINK_RECORD_RESPONSE
 from .aldb_base import ALDBBase
 
@@ -71,6 +73,61 @@ class ModemALDB(ALDBBase):
 
         return self._status
 
+    async def async_write(self, force=False) -> Tuple[int, int]:
+        """Write the dirty records to the modem.
+
+        The dirty records are planned into the fewest writes before they are
+        sent. For example, a deleted record and a new record are written to
+        the same memory address in one write.
+        """
+        if not self.is_loaded and not force:
+            _LOGGER.warning(
+                "ALDB must be loaded before it can be written Status: %s",
+                str(self._status),
+            )
+            return 0, len(self._dirty_records)
+
+        try:
+            planned_writes = self._plan_writes(self._dirty_records)
+        except ALDBWriteException as ex:
+            _LOGGER.warning("Unable to write the ALDB: %s", str(ex))
+            return 0, len(self._dirty_records)
+
+        dirty_records = self._dirty_records
+        self._dirty_records = {}
+        plan = []
+        success = 0
+        for rec_to_write, keys in planned_writes:
+            curr_rec = self._records.get(rec_to_write.mem_addr)
+            if curr_rec and curr_rec.is_exact_match(rec_to_write):
+                success += len(keys)
+            else:
+                plan.append((rec_to_write, keys))
+
+        try:
+            results = await self._write_manager.async_write_records(
+                [rec_to_write for rec_to_write, _ in plan], force
+            )
+        except ALDBWriteException:
+            results = [ResponseStatus.FAILURE] * len(plan)
+
+        failed = {}
+        next_new_dirty = 0
+        for (rec_to_write, keys), result in zip(plan, results):
+            if result == ResponseStatus.SUCCESS:
+                self._update_written_record(rec_to_write)
+                success += len(keys)
+                continue
+            for key in keys:
+                if key <= 0:
+                    next_new_dirty -= 1
+                    failed[next_new_dirty] = dirty_records[key]
+                else:
+                    failed[key] = dirty_records[key]
+
+        self._dirty_records = failed
+        return success, len(self._dirty_records)
+
     async def async_find_records(self, address: Address, group: int):
         """Find an All-Link record in the Modem ALDB."""
         async for rec in self._read_manager.async_find(address, group):
@@ -83,7 +140,7 @@ class ModemALDB(ALDBBase):
     async def _async_load_standard(self):
         """Load using get first and get next methods."""
         next_mem_addr = self.first_mem_addr
-        self._records = {}
+        self._records = self._new_records()
         async for rec in self._read_manager.async_load_standard():
             rec.mem_addr = next_mem_addr
             self._records[next_mem_addr] = rec
@@ -93,16 +150,61 @@ class ModemALDB(ALDBBase):
     async def _async_load_eeprom(self):
         """Load using EEPROM read method."""
         _LOGGER.debug("Loading from EEPROM")
-        next_mem_addr = self.first_mem_addr
-        self._records = {}
-        record = await self._read_manager.async_read_record(next_mem_addr)
-        while record:
+        self._records = self._new_records()
+        async for record in self._read_manager.async_load_eeprom():
             self._records[record.mem_addr] = record
             self._notify_change(record)
-            if record.is_high_water_mark:
-                return
-            record = await self._read_manager.async_read_record(next_mem_addr)
-            next_mem_addr -= 8
+
+    def _plan_writes(self, dirty_records):
+        """Plan the writes for a set of dirty records.
+
+        Returns a list of (record to write, dirty record keys) in write order.
+        """
+        plan = {}
+        for key in sorted((key for key in dirty_records if key > 0), reverse=True):
+            plan[key] = (dirty_records[key].copy(), [key])
+
+        for key in sorted((key for key in dirty_records if key <= 0), reverse=True):
+            rec_to_write = dirty_records[key].copy()
+            rec_to_write.mem_addr = self._plan_mem_addr(rec_to_write, plan)
+            keys = plan.get(rec_to_write.mem_addr, (None, []))[1]
+            plan[rec_to_write.mem_addr] = (rec_to_write, keys + [key])
+
+        order = sorted(plan, reverse=True)
+        if self._read_write_mode != ReadWriteMode.EEPROM:
+            # Deletes free records in the modem before adding new records
+            order.sort(key=lambda mem_addr: plan[mem_addr][0].is_in_use)
+        return [plan[mem_addr] for mem_addr in order]
+
+    def _plan_mem_addr(self, record, plan) -> int:
+        """Return the memory address to write a new record to."""
+        # Combine with a planned change to the same link
+        for mem_addr, (planned, _) in plan.items():
+            if planned == record:
+                return mem_addr
+
+        for existing in self.find(
+            target=record.target,
+            group=record.group,
+            is_controller=record.is_controller,
+            data3=record.data3,
+        ):
+            if existing.mem_addr not in plan:
+                return existing.mem_addr
+
+        if self._read_write_mode == ReadWriteMode.EEPROM:
+            # Reuse a record that is being deleted
+            for mem_addr, (planned, keys) in plan.items():
+                if not planned.is_in_use and min(keys) > 0:
+                    return mem_addr
+
+        for mem_addr in range(self._mem_addr, 0, -8):
+            curr_rec = self._records.get(mem_addr)
+            if mem_addr in plan:
+                continue
+            if curr_rec is None or not curr_rec.is_in_use:
+                return mem_addr
+        raise ALDBWriteException("The modem All-Link database is full.")
 
     def _is_loaded(self):
         """Calculate the AlDB load status."""
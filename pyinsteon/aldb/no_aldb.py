@@ -39,6 +39,10 @@ class NoALDB:
         """Return the ALDB items."""
         return {}
 
+    def links(self):
+        """Return the ALDB links."""
+        return {}
+
     @property
     def address(self):
         """Returnt the status of the device."""
@@ -1,18 +1,21 @@
 """Base device object."""
 
 import asyncio
-from functools import partial
 from inspect import getfullargspec
 import logging
+from time import monotonic
 
 from ..aldb.aldb_battery import ALDBBattery
 from ..constants import ResponseStatus
 from ..handlers.to_device.extended_set import ExtendedSetCommand
+from ..managers.fact_cache import ENGINE_VERSION, PRODUCT_ID
 from ..managers.link_manager.default_links import async_add_default_links
+from ..managers.timer_manager import timer_manager
+from ..managers.wake_manager import WakeCommandManager
 from ..utils import subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
-TIMEOUT = 2
+PING_WAIT = 60
 
 
 # pylint: disable=no-member
@@ -36,37 +39,41 @@ class BatteryDeviceBase:
             **kwargs,
         )
         self._is_battery = True
-        self._commands_queue = asyncio.Queue()
+        self._wake_commands = WakeCommandManager()
         self._aldb = ALDBBattery(address=address, run_command=self._run_on_wake)
         self._last_run = None
         self._keep_awake_cmd = ExtendedSetCommand(self._address, data1=0, data2=0x04)
         subscribe_topic(self._device_awake, self._address.id)
-        self._ping_task: asyncio.Task = None
+        self._ping_timer = None
+
+    @property
+    def wake_commands(self) -> WakeCommandManager:
+        """Return the commands waiting for the device to wake up."""
+        return self._wake_commands
 
     def _run_on_wake(self, command, retries=3, **kwargs):
-        cmd = partial(command, **kwargs)
-        self._commands_queue.put_nowait((cmd, retries))
-        if not self._ping_task or self._ping_task.done() or self._ping_task.cancelled():
-            self._ping_task = asyncio.ensure_future(self._ping_device())
-            self._ping_task.add_done_callback(self._clear_ping_task)
+        self._wake_commands.add(command, retries=retries, **kwargs)
+        if self._ping_timer is None:
+            self._ping_timer = timer_manager.call_later(0, self._async_ping_device)
+        elif not self._ping_timer.active:
+            self._ping_timer.rearm(0)
         return ResponseStatus.RUN_ON_WAKE
 
-    def _clear_ping_task(self, *args, **kwargs):
-        """Clear the ping task."""
-        self._ping_task = None
-
     def close(self):
         """Close the command listener."""
-        self._commands_queue.put_nowait((None, None))
+        self._wake_commands.clear()
+        if self._last_run is not None and not self._last_run.done():
+            self._last_run.cancel()
 
-    async def async_status(self, group=None):
+    async def async_status(self, group=None, max_age=None):
         """Get device status."""
         args = getfullargspec(super(BatteryDeviceBase, self).async_status)
+        kwargs = {}
         if "group" in args[0]:
-            return self._run_on_wake(
-                super(BatteryDeviceBase, self).async_status, group=group
-            )
-        return self._run_on_wake(super(BatteryDeviceBase, self).async_status)
+            kwargs["group"] = group
+        if "max_age" in args[0]:
+            kwargs["max_age"] = max_age
+        return self._run_on_wake(super(BatteryDeviceBase, self).async_status, **kwargs)
 
     async def async_read_op_flags(self):
         """Read the device operating flags."""
@@ -82,10 +89,12 @@ class BatteryDeviceBase:
             super(BatteryDeviceBase, self).async_read_ext_properties
         )
 
-    async def async_get_engine_version(self):
+    async def async_get_engine_version(self, force: bool = False):
         """Read the device engine version."""
+        if not force and self.fact_cache.is_fresh(ENGINE_VERSION):
+            return ResponseStatus.SUCCESS
         return self._run_on_wake(
-            super(BatteryDeviceBase, self).async_get_engine_version
+            super(BatteryDeviceBase, self).async_get_engine_version, force=force
         )
 
     async def async_add_default_links(self):
@@ -107,9 +116,13 @@ class BatteryDeviceBase:
             self.aldb.async_load = aldb_load_save
         return result
 
-    async def async_read_product_id(self):
+    async def async_read_product_id(self, force: bool = False):
         """Get the product ID."""
-        return self._run_on_wake(super(BatteryDeviceBase, self).async_read_product_id)
+        if not force and self.fact_cache.is_fresh(PRODUCT_ID):
+            return ResponseStatus.SUCCESS
+        return self._run_on_wake(
+            super(BatteryDeviceBase, self).async_read_product_id, force=force
+        )
 
     async def async_write_ext_properties(self):
         """Write the extended properties."""
@@ -121,24 +134,23 @@ class BatteryDeviceBase:
         """Keep the device awake to ensure commands are heard."""
         return await self._keep_awake_cmd.async_send(data3=awake_time, priority=1)
 
-    async def _ping_device(self):
-        """Ping the device every 60 seconds to see if it is awake."""
-        if self._commands_queue.empty():
+    async def _async_ping_device(self):
+        """Ping the device every PING_WAIT seconds to see if it is awake."""
+        if not self._wake_commands:
             return
-        while True:
-            result = await self.async_ping()
-            if result == ResponseStatus.SUCCESS:
-                self._ping_task = None
-                return
-            await asyncio.sleep(60)
+        # Keep the timer active while the ping is in progress
+        self._ping_timer.rearm(PING_WAIT)
+        result = await self.async_ping()
+        if result == ResponseStatus.SUCCESS:
+            self._ping_timer.cancel()
 
     def _device_awake(self, **kwargs):
         """Execute the commands that were requested while sleeping."""
 
-        if self._ping_task is not None and not self._ping_task.cancelled():
-            self._ping_task.cancel()
+        if self._ping_timer is not None:
+            self._ping_timer.cancel()
 
-        if self._commands_queue.empty():
+        if not self._wake_commands:
             return
         if self._last_run is None or self._last_run.done():
             _LOGGER.debug("We have commands to run so let's get to it")
@@ -157,21 +169,37 @@ class BatteryDeviceBase:
             await asyncio.sleep(3)
 
     async def _run_commands(self):
-        """Run the commands in queue."""
+        """Run the pending commands while the device is awake.
+
+        Commands run back to back. A keep awake command is only sent when the
+        next command is not expected to finish in the current wake window.
+        """
         retry_cmds = []
-        while True:
-            try:
-                await self.async_keep_awake()
-                command, retries = await asyncio.wait_for(
-                    self._commands_queue.get(), TIMEOUT
-                )
-                if command is None:
-                    return
-                result = await command()
-                if result != ResponseStatus.SUCCESS and retries:
-                    retry_cmds.append((command, retries - 1))
-            except asyncio.TimeoutError:
-                break
-
-        for cmd, retries in retry_cmds:
-            self._run_on_wake(cmd, retries)
+        awake_since = monotonic()
+        try:
+            while self._wake_commands:
+                batch = self._wake_commands.pop_batch()
+                try:
+                    while batch:
+                        elapsed = monotonic() - awake_since
+                        if elapsed + batch[0].cost > self._wake_commands.wake_window:
+                            await self.async_keep_awake()
+                            awake_since = monotonic()
+                        wake_cmd = batch[0]
+                        try:
+                            result = await wake_cmd.async_run()
+                        except Exception as ex:  # pylint: disable=broad-except
+                            _LOGGER.error(
+                                "Error running %s: %s", wake_cmd.name, str(ex)
+                            )
+                            result = ResponseStatus.FAILURE
+                        batch.pop(0)
+                        if result != ResponseStatus.SUCCESS:
+                            retry_cmds.append(wake_cmd)
+                finally:
+                    # Keep the commands not run if the batch is interrupted
+                    for wake_cmd in batch:
+                        self._wake_commands.restore(wake_cmd)
+        finally:
+            for wake_cmd in retry_cmds:
+                self._wake_commands.requeue(wake_cmd)
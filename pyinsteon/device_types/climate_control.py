@@ -93,7 +93,7 @@ class ClimateControl_Thermostat(Device):
         )
         self._aldb = ALDB(self._address, mem_addr=0x1FFF)
 
-    async def async_status(self, group=None):
+    async def async_status(self, group=None, max_age=None):
         """Get the status of the device."""
         return await self._managers[STATUS_COMMAND].async_status()
 
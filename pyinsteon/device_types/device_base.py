@@ -9,12 +9,26 @@ from ..address import Address
 from ..aldb.aldb import ALDB
 from ..config.extended_property import ExtendedProperty
 from ..config.operating_flag import OperatingFlag
-from ..constants import DeviceCategory, EngineVersion, PropertyType, ResponseStatus
+from ..constants import (
+    ALDBStatus,
+    DeviceCategory,
+    EngineVersion,
+    PropertyType,
+    ResponseStatus,
+)
 from ..default_link import DefaultLink
 from ..device_types.device_commands import STATUS_COMMAND
 from ..handlers.to_device.engine_version_request import EngineVersionRequest
 from ..handlers.to_device.ping import PingCommand
 from ..handlers.to_device.product_data_request import ProductDataRequestCommand
+from ..managers.fact_cache import (
+    ALDB as ALDB_FACT,
+    ENGINE_VERSION as ENGINE_VERSION_FACT,
+    EXT_PROPERTIES,
+    OP_FLAGS,
+    PRODUCT_ID,
+    FactCache,
+)
 from ..managers.get_set_ext_property_manager import GetSetExtendedPropertyManager
 from ..managers.get_set_op_flag_manager import GetSetOperatingFlagsManager
 from ..managers.link_manager.default_links import async_add_default_links
@@ -50,6 +64,7 @@ class Device(ABC):
         self._product_id = None
         self._is_battery = False
         self._engine_version = EngineVersion.UNKNOWN
+        self._fact_cache = FactCache()
 
         self._last_communication_received = datetime(1, 1, 1, 1, 1, 1)
         self._product_data_in_aldb = False
@@ -76,6 +91,7 @@ class Device(ABC):
         self._subscribe_to_handelers_and_managers()
         self._register_default_links()
         self._register_config()
+        self._aldb.subscribe_status_changed(self._aldb_status_changed)
 
     @property
     def address(self):
@@ -112,6 +128,21 @@ class Device(ABC):
         """Return the INSTEON product ID."""
         return self._product_id
 
+    @product_id.setter
+    def product_id(self, value: int):
+        """Set the INSTEON product ID."""
+        self._handle_product_data(value)
+
+    @property
+    def last_communication_received(self) -> datetime:
+        """Return the time a message was last received from the device."""
+        return self._last_communication_received
+
+    @last_communication_received.setter
+    def last_communication_received(self, value: datetime):
+        """Set the time a message was last received from the device."""
+        self._last_communication_received = value
+
     @property
     def id(self):
         """Return the ID of the device."""
@@ -147,6 +178,11 @@ class Device(ABC):
         """Return the configuration properties."""
         return self._config
 
+    @property
+    def fact_cache(self) -> FactCache:
+        """Return the cache of facts read from the device."""
+        return self._fact_cache
+
     @property
     def default_links(self):
         """Return the list of default links."""
@@ -172,15 +208,19 @@ class Device(ABC):
         if version in [EngineVersion.I2, EngineVersion.I2CS]:
             self._op_flags_manager.extended_write = True
         self._engine_version = version
+        if version == EngineVersion.UNKNOWN:
+            self._fact_cache.invalidate(ENGINE_VERSION_FACT)
+        else:
+            self._fact_cache.update(ENGINE_VERSION_FACT)
         publish_topic(
             f"{self._address.id}.{ENGINE_VERSION}", version=self._engine_version
         )
 
-    async def async_status(self, group=None):
+    async def async_status(self, group=None, max_age=None):
         """Get the status of the device."""
         return ResponseStatus.SUCCESS
 
-    async def async_read_config(self, read_aldb: bool = True):
+    async def async_read_config(self, read_aldb: bool = True, force: bool = False):
         """Get all configuration settings.
 
         This includes:
@@ -188,12 +228,23 @@ class Device(ABC):
         - Operating flags
         - Extended properties
         - All-Link Database records.
+
+        Settings that are fresh in `fact_cache` are not read unless `force` is
+        True.
         """
-        result_engine = await self.async_get_engine_version()
-        result_op_flags = await self.async_read_op_flags()
-        result_ext_prop = await self.async_read_ext_properties()
-        if read_aldb:
+        result_engine = await self.async_get_engine_version(force=force)
+        if force or not self._fact_cache.is_fresh(OP_FLAGS):
+            result_op_flags = await self.async_read_op_flags()
+        else:
+            result_op_flags = ResponseStatus.SUCCESS
+        if force or not self._fact_cache.is_fresh(EXT_PROPERTIES):
+            result_ext_prop = await self.async_read_ext_properties()
+        else:
+            result_ext_prop = ResponseStatus.SUCCESS
+        if read_aldb and (force or not self._fact_cache.is_fresh(ALDB_FACT)):
             result_aldb = await self._aldb.async_load()
+            if self._aldb.is_loaded:
+                self._fact_cache.update(ALDB_FACT)
         else:
             result_aldb = ResponseStatus.SUCCESS
         return multiple_status(
@@ -208,30 +259,48 @@ class Device(ABC):
 
     async def async_read_op_flags(self, group=None):
         """Read the device operating flags."""
-        return await self._op_flags_manager.async_read(group=group)
+        result = await self._op_flags_manager.async_read(group=group)
+        if group is None and result == ResponseStatus.SUCCESS:
+            self._fact_cache.update(OP_FLAGS)
+        return result
 
     async def async_write_op_flags(self):
         """Write the operating flags to the device."""
+        self._fact_cache.invalidate(OP_FLAGS)
         return await self._op_flags_manager.async_write()
 
     async def async_read_ext_properties(self, group=None):
         """Get the device extended properties."""
-        return await self._ext_property_manager.async_read(group=group)
+        result = await self._ext_property_manager.async_read(group=group)
+        if group is None and result == ResponseStatus.SUCCESS:
+            self._fact_cache.update(EXT_PROPERTIES)
+        return result
 
     async def async_write_ext_properties(self):
         """Write the extended properties."""
+        self._fact_cache.invalidate(EXT_PROPERTIES)
         return await self._ext_property_manager.async_write()
 
-    async def async_read_product_id(self):
-        """Get the product ID."""
+    async def async_read_product_id(self, force: bool = False):
+        """Get the product ID.
+
+        A known product ID is not read again unless `force` is True.
+        """
+        if not force and self._fact_cache.is_fresh(PRODUCT_ID):
+            return ResponseStatus.SUCCESS
         return await self._handlers["product_data_cmd"].async_send()
 
     async def async_add_default_links(self):
         """Add the default links betweent he modem and the device."""
         return await async_add_default_links(self)
 
-    async def async_get_engine_version(self):
-        """Read the device engine version."""
+    async def async_get_engine_version(self, force: bool = False):
+        """Read the device engine version.
+
+        A known engine version is not read again unless `force` is True.
+        """
+        if not force and self._fact_cache.is_fresh(ENGINE_VERSION_FACT):
+            return ResponseStatus.SUCCESS
         return await self._handlers["engine_version_cmd"].async_send()
 
     async def async_ping(self):
@@ -246,11 +315,11 @@ class Device(ABC):
         """Add all handlers to the device and register listeners."""
         self._handlers["product_data_cmd"] = ProductDataRequestCommand(self._address)
         self._handlers["engine_version_cmd"] = EngineVersionRequest(self._address)
-        self._managers[STATUS_COMMAND] = StatusManager(self._address)
+        self._managers[STATUS_COMMAND] = StatusManager(self._address, self._groups)
 
     def _subscribe_to_handelers_and_managers(self):
         """Subscribe groups and events to handlers and managers."""
-        self._handlers["product_data_cmd"] = ProductDataRequestCommand(self._address)
+        self._handlers["product_data_cmd"].subscribe(self._handle_product_data)
         self._handlers["engine_version_cmd"].subscribe(self._engine_version_received)
 
     def _register_default_links(self):
@@ -320,9 +389,22 @@ class Device(ABC):
         self._op_flags_manager.unsubscribe(name)
         self._operating_flags.pop(name)
 
-    def _handle_product_data(self, product_id, cat, subcat):
+    def _handle_product_data(self, product_id, cat=None, subcat=None):
         """Receive and set the product data information."""
         self._product_id = product_id
+        if product_id is None:
+            self._fact_cache.invalidate(PRODUCT_ID)
+        else:
+            self._fact_cache.update(PRODUCT_ID)
+
+    def _aldb_status_changed(self, status):
+        """Mark the All-Link Database to be read again if it is not loaded.
+
+        Records written by the library keep the ALDB loaded so they do not
+        make the ALDB stale.
+        """
+        if status != ALDBStatus.LOADED:
+            self._fact_cache.invalidate(ALDB_FACT)
 
     def _engine_version_received(self, engine_version):
         """Receive engine version response."""
@@ -330,6 +412,6 @@ class Device(ABC):
 
     def _product_data_received(self, product_id, cat, subcat):
         """Receive product data response."""
-        self._product_id = product_id
+        self._handle_product_data(product_id)
         self._cat = cat
         self._subcat = subcat
@@ -57,6 +57,7 @@ from ..handlers.to_device.night_mode_off import NightModeOffCommand
 from ..handlers.to_device.night_mode_on import NightModeOnCommand
 from ..managers.ext_prop_read_manager import ExtendedPropertyReadManager
 from ..managers.ext_prop_write_manager import ExtendedPropertyWriteManager
+from ..managers.fact_cache import EXT_PROPERTIES, OP_FLAGS
 from ..utils import multiple_status
 from .device_commands import MANUAL_CHANGE, OFF_AT_RAMP_RATE, ON_AT_RAMP_RATE
 from .on_off_responder_base import OnOffResponderBase
@@ -376,10 +377,14 @@ class I3Base:
             response = await mgr.async_send()
             responses.append(response)
             await asyncio.sleep(0.2)
-        return multiple_status(*responses)
+        result = multiple_status(*responses)
+        if result == ResponseStatus.SUCCESS:
+            self.fact_cache.update(EXT_PROPERTIES)
+        return result
 
     async def async_write_op_flags(self) -> ResponseStatus:
         """Write the operating flags to the device."""
+        self.fact_cache.invalidate(OP_FLAGS)
         responses = []
         if prop := self._operating_flags.get(NIGHT_MODE_ON):
             if prop.is_dirty:
@@ -391,6 +396,7 @@ class I3Base:
 
     async def async_write_ext_properties(self) -> ResponseStatus:
         """Write the extended properties."""
+        self.fact_cache.invalidate(EXT_PROPERTIES)
         responses = [ResponseStatus.SUCCESS]
         for cmd in self._managers[WRITE_MGRS]:
             if cmd.is_dirty:
@@ -600,7 +606,9 @@ class I3VariableResponderBase(I3Base, VariableResponderBase):
         super()._subscribe_to_handelers_and_managers()
         for group, group_prop in self._groups.items():
             if isinstance(group_prop, OnLevel):
-                self._handlers[group][MANUAL_CHANGE].subscribe(self.async_status)
+                self._handlers[group][MANUAL_CHANGE].subscribe(
+                    self._async_on_manual_change
+                )
                 # pylint: disable=cell-var-from-loop
                 self._handlers[group][OFF_AT_RAMP_RATE].subscribe(
                     lambda on_level, ramp_rate: self._handle_on_off_at_ramp_rate(
@@ -615,6 +623,10 @@ class I3VariableResponderBase(I3Base, VariableResponderBase):
                     force_strong_ref=True,
                 )
 
+    async def _async_on_manual_change(self, group=None):
+        """Respond to a manual change of the device."""
+        await self.async_status(group=group)
+
     def _handle_on_off_at_ramp_rate(self, group: int, on_level: int, ramp_rate: int):
         """Handle the on and off at ramp rate inbound broadcast messages."""
         self._groups[group].set_value(on_level)
@@ -17,6 +17,7 @@ from ..handlers.all_link_cleanup_failure_report import AllLinkCleanupFailureRepo
 from ..handlers.all_link_cleanup_status_report import AllLinkCleanupStatusReport
 from ..handlers.get_im_configuration import GetImConfigurationHandler
 from ..handlers.set_im_configuration import SetImConfigurationHandler
+from ..managers.fact_cache import ALDB
 from ..utils import multiple_status
 from .device_base import Device
 from .device_commands import GET_IM_CONFIG_COMMAND, SET_IM_CONFIG_COMMAND
@@ -109,6 +110,21 @@ class ModemBase(Device, metaclass=ABCMeta):
         """Get the modem flags."""
         return await self._handlers[GET_IM_CONFIG_COMMAND].async_send()
 
+    def load_configuration(
+        self,
+        disable_auto_linking: bool = None,
+        monitor_mode: bool = None,
+        auto_led: bool = None,
+        deadman: bool = None,
+    ):
+        """Load cached modem flags without reading them from the modem."""
+        self._update_flags(
+            disable_auto_linking=disable_auto_linking,
+            monitor_mode=monitor_mode,
+            auto_led=auto_led,
+            deadman=deadman,
+        )
+
     async def async_set_configuration(
         self,
         disable_auto_linking: bool = None,
@@ -134,11 +150,17 @@ class ModemBase(Device, metaclass=ABCMeta):
             deadman=deadman,
         )
 
-    async def async_read_config(self, read_aldb: bool = True):
-        """Read the modem configuration."""
+    async def async_read_config(self, read_aldb: bool = True, force: bool = False):
+        """Read the modem configuration.
+
+        The All-Link Database is not read if it is fresh in `fact_cache` unless
+        `force` is True.
+        """
         result_config = await self.async_get_configuration()
-        if read_aldb:
+        if read_aldb and (force or not self.fact_cache.is_fresh(ALDB)):
             result_aldb = await self.aldb.async_load()
+            if self.aldb.is_loaded:
+                self.fact_cache.update(ALDB)
         else:
             result_aldb = ResponseStatus.SUCCESS
         return multiple_status(result_config, result_aldb)
@@ -58,7 +58,7 @@ class OnOffControllerBase(Device):
     def _register_handlers_and_managers(self):
         super()._register_handlers_and_managers()
 
-        self._managers[STATUS_COMMAND] = StatusManager(self._address)
+        self._managers[STATUS_COMMAND] = StatusManager(self._address, self._groups)
         for group in self._buttons:
             if self._managers.get(group) is None:
                 self._managers[group] = {}
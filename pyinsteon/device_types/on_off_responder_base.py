@@ -69,12 +69,14 @@ class OnOffResponderBase(OnOffControllerBase):
         group = 1 if not group else group
         return await self._handlers[group][OFF_COMMAND].async_send()
 
-    async def async_status(self, group=None):
+    async def async_status(self, group=None, max_age=None):
         """Get the device status."""
         status_type: int | None = None
         if state_group := self._groups.get(group):
             status_type = state_group.status_type
-        return await self._managers[STATUS_COMMAND].async_status(status_type)
+        return await self._managers[STATUS_COMMAND].async_status(
+            status_type, max_age=max_age
+        )
 
     def _register_handlers_and_managers(self):
         super()._register_handlers_and_managers()
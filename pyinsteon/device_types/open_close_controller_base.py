@@ -49,7 +49,7 @@ class OpenCloseControllerBase(Device):
 
     def _register_handlers_and_managers(self):
         super()._register_handlers_and_managers()
-        self._managers[STATUS_COMMAND] = StatusManager(self._address)
+        self._managers[STATUS_COMMAND] = StatusManager(self._address, self._groups)
         self._managers[1] = OnLevelManager(self._address, 1)
 
     def _register_groups(self):
@@ -77,7 +77,7 @@ class OpenCloseResponderBase(OpenCloseControllerBase):
         command = OFF_FAST_COMMAND if fast else OFF_COMMAND
         return await self._handlers[group][command].async_send()
 
-    async def async_status(self, group=None):
+    async def async_status(self, group=None, max_age=None):
         """Get the status of the device state."""
         status_type: int | None = None
         if state_group := self._groups.get(group):
@@ -138,12 +138,14 @@ class SensorsActuators_IOLink(Device):
         """Turn off the relay."""
         return await self._handlers[RELAY_GROUP][OFF_COMMAND].async_send()
 
-    async def async_status(self, group=None):
+    async def async_status(self, group=None, max_age=None):
         """Get the device status."""
         status_type: int | None = None
         if state_group := self._groups.get(group):
             status_type = state_group.status_type
-        return await self._managers[STATUS_COMMAND].async_status(status_type)
+        return await self._managers[STATUS_COMMAND].async_status(
+            status_type, max_age=max_age
+        )
 
     def _register_op_flags_and_props(self):
         self._add_operating_flag(PROGRAM_LOCK_ON, 0, 0, 0, 1)
@@ -77,12 +77,14 @@ class VariableResponderBase(VariableControllerBase):
         command = OFF_FAST_COMMAND if fast else OFF_COMMAND
         return await self._handlers[group][command].async_send()
 
-    async def async_status(self, group=None):
+    async def async_status(self, group=None, max_age=None):
         """Get the device status."""
         status_type: int | None = None
         if state_group := self._groups.get(group):
             status_type = state_group.status_type
-        return await self._managers[STATUS_COMMAND].async_status(status_type)
+        return await self._managers[STATUS_COMMAND].async_status(
+            status_type, max_age=max_age
+        )
 
     def _register_handlers_and_managers(self):
         super()._register_handlers_and_managers()
@@ -116,11 +116,11 @@ class X10DeviceBase:
     def engine_version(self, value: EngineVersion):
         """Mock setter for the X10 engine version."""
 
-    async def async_status(self, group=None):
+    async def async_status(self, group=None, max_age=None):
         """Get the status of the device."""
         return ResponseStatus.SUCCESS
 
-    async def async_read_config(self, read_aldb: bool = True):
+    async def async_read_config(self, read_aldb: bool = True, force: bool = False):
         """Get all configuration settings.
 
         This command does nothing for X10 devices.
@@ -152,7 +152,7 @@ class X10DeviceBase:
         """Write the extended properties."""
         return ResponseStatus.SUCCESS
 
-    async def async_read_product_id(self):
+    async def async_read_product_id(self, force: bool = False):
         """Get the product ID."""
         return ResponseStatus.SUCCESS
 
@@ -160,7 +160,7 @@ class X10DeviceBase:
         """Add the default links betweent he modem and the device."""
         return ResponseStatus.SUCCESS
 
-    async def async_get_engine_version(self):
+    async def async_get_engine_version(self, force: bool = False):
         """Read the device engine version.
 
         This command does nothing in X10 devices.
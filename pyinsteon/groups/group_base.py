@@ -1,6 +1,7 @@
 """Base class for all group value entities."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from ..address import Address
 from ..subscriber_base import SubscriberBase
@@ -31,6 +32,8 @@ class GroupBase(SubscriberBase):
         self._is_reversed = False
         self._is_dimmable: bool = False
         self._status_type = status_type
+        self._last_update = None
+        self._is_stale = False
 
     @property
     def is_reversed(self) -> bool:
@@ -75,6 +78,7 @@ class GroupBase(SubscriberBase):
         """Set the value of the state."""
         try:
             value = self._type(value) if value is not None else None
+            self._value_updated()
             if self._value == value:
                 return
             self._value = value
@@ -89,11 +93,32 @@ class GroupBase(SubscriberBase):
             group=self._group,
         )
 
+    @property
+    def last_update(self) -> datetime:
+        """Return the time the value was last received or None if never."""
+        return self._last_update
+
+    @property
+    def is_stale(self) -> bool:
+        """Return if the value was restored and not yet received from the device."""
+        return self._is_stale
+
+    def load_value(self, value, last_update: datetime = None):
+        """Load a saved value that has not been received from the device."""
+        self.value = value
+        self._last_update = last_update
+        self._is_stale = True
+
     @property
     def status_type(self):
         """Return the status type to get the group state."""
         return self._status_type
 
+    def _value_updated(self):
+        """Record that the value was received."""
+        self._last_update = datetime.now()
+        self._is_stale = False
+
     @abstractmethod
     def set_value(self, **kwargs):
         """Set the value of the state from a Handler."""
@@ -37,6 +37,7 @@ class OnLevel(GroupBase):
             value = self._type(value) if value is not None else None
             if not self._is_dimmable and value:
                 value = 255
+            self._value_updated()
             if self._value == value:
                 return
             self._value = value
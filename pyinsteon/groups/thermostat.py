@@ -37,6 +37,7 @@ class Temperature(GroupBase):
         """Set the temperature value."""
         try:
             self._value = self._type(value) if value is not None else None
+            self._value_updated()
         except TypeError as ex:
             raise TypeError(
                 f"Error setting value of State {self._name}: Must be of type {self._type.__name__}"
@@ -109,6 +110,7 @@ class SystemMode(GroupBase):
             if value > 0x0F:
                 value = value >> 4
             self._value = self._type(value) if value is not None else None
+            self._value_updated()
         except TypeError as ex:
             raise TypeError(
                 f"Error setting value of State {self._name}: Must be of type {self._type.__name__}"
@@ -151,6 +153,7 @@ class FanMode(GroupBase):
             if value > 0x0F:
                 value = value & 0x0F
             self._value = self._type(value) if value is not None else None
+            self._value_updated()
         except TypeError as ex:
             raise TypeError(
                 f"Error setting value of State {self._name}: Must be of type {self._type.__name__}"
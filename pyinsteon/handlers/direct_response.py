@@ -0,0 +1,174 @@
+"""Match direct ACK and direct NAK responses to pending direct commands.
+
+A pending response is keyed by the device address, the command topic (the
+`cmd1` value of the command) and the response class. A direct response
+resolves the oldest matching pending response acknowledged by the modem, or
+the oldest matching pending response if the direct response arrives before
+the modem ACK. A direct response that matches no pending response is held
+for `UNCLAIMED_WAIT` seconds in case the modem ACK of a command not sent by
+the handler arrives after it.
+
+Response classes:
+    RESPONSE_DIRECT: The direct ACK or direct NAK echoes the command topic.
+    RESPONSE_STATUS: Any direct ACK is the response. A status response holds
+        the ALDB version in `cmd1` so it cannot be matched by topic.
+"""
+
+import asyncio
+from time import monotonic
+from typing import Callable, Dict, List, Tuple, Union
+
+from .. import pub
+from ..address import Address
+from ..constants import MessageFlagType, ResponseStatus
+from ..utils import subscribe_topic
+
+RESPONSE_DIRECT = "direct"
+RESPONSE_STATUS = "status"
+UNCLAIMED_WAIT = 0.5
+_DIRECT_ACK = str(MessageFlagType.DIRECT_ACK).lower()
+_DIRECT_NAK = str(MessageFlagType.DIRECT_NAK).lower()
+
+
+class PendingResponse:
+    """A direct command waiting for its direct response."""
+
+    def __init__(
+        self, address: Address, topic: str, response_class: str, callback: Callable
+    ):
+        """Init the PendingResponse class."""
+        self.address = address
+        self.topic = topic
+        self.response_class = response_class
+        self.callback = callback
+        self.acked = False
+        self.future = asyncio.get_running_loop().create_future()
+
+    @property
+    def is_active(self) -> bool:
+        """Return if the response can still be received."""
+        return not self.future.done() and not self.future.get_loop().is_closed()
+
+    def matches(self, topic: str, msg_type: str) -> bool:
+        """Return if a direct response message matches this pending response."""
+        if self.response_class == RESPONSE_STATUS and msg_type == _DIRECT_ACK:
+            return True
+        return topic == self.topic
+
+
+class DirectResponseCorrelator:
+    """Match direct ACK and direct NAK responses to pending direct commands."""
+
+    def __init__(self):
+        """Init the DirectResponseCorrelator class."""
+        self._pending: Dict[Address, List[PendingResponse]] = {}
+        self._unclaimed: Dict[Address, List[Tuple[float, str, str, dict]]] = {}
+
+    def add_address(self, address: Address):
+        """Listen for the direct responses from a device."""
+        address = Address(address)
+        if address not in self._pending:
+            self._pending[address] = []
+            self._unclaimed[address] = []
+            subscribe_topic(self._message_received, address.id)
+
+    def register(
+        self,
+        address: Address,
+        topic: str,
+        response_class: str,
+        callback: Callable,
+        acked: bool = False,
+    ) -> PendingResponse:
+        """Register a pending response.
+
+        The callback is called with the message type and the message fields
+        when the direct response is received and returns the response status.
+        A pending response registered after the modem ACK is resolved by a
+        matching unclaimed direct response.
+        """
+        address = Address(address)
+        pending = PendingResponse(address, topic, response_class, callback)
+        pending.acked = acked
+        self.add_address(address)
+        if acked:
+            unclaimed = self._recent_unclaimed(address)
+            for response in unclaimed:
+                _, msg_topic, msg_type, kwargs = response
+                if pending.matches(msg_topic, msg_type):
+                    unclaimed.remove(response)
+                    self._resolve(pending, msg_type, kwargs)
+                    return pending
+        self._pending[address].append(pending)
+        return pending
+
+    def unregister(self, pending: PendingResponse):
+        """Remove a pending response."""
+        address_pending = self._pending.get(pending.address, [])
+        if pending in address_pending:
+            address_pending.remove(pending)
+
+    def _owner(self, address, topic, msg_type) -> Union[PendingResponse, None]:
+        """Return the pending response a direct response belongs to."""
+        address_pending = self._pending.get(address, [])
+        address_pending[:] = [
+            pending for pending in address_pending if pending.is_active
+        ]
+        # Responses matching the command topic come before status responses
+        for response_class in [RESPONSE_DIRECT, RESPONSE_STATUS]:
+            candidates = [
+                pending
+                for pending in address_pending
+                if pending.response_class == response_class
+                and pending.matches(topic, msg_type)
+            ]
+            for pending in candidates:
+                if pending.acked:
+                    return pending
+            if candidates:
+                return candidates[0]
+        return None
+
+    def _message_received(self, topic=pub.AUTO_TOPIC, **kwargs):
+        """Resolve the pending response of a direct ACK or direct NAK."""
+        topic_tuple = topic.getNameTuple()
+        msg_type = topic_tuple[-1]
+        if msg_type not in [_DIRECT_ACK, _DIRECT_NAK] or len(topic_tuple) < 3:
+            return
+        try:
+            address = Address(topic_tuple[0])
+        except ValueError:
+            return
+        if address not in self._unclaimed:
+            return
+        msg_topic = ".".join(topic_tuple[1:-1])
+        pending = self._owner(address, msg_topic, msg_type)
+        if pending is None:
+            self._recent_unclaimed(address).append(
+                (monotonic(), msg_topic, msg_type, kwargs)
+            )
+            return
+        self.unregister(pending)
+        self._resolve(pending, msg_type, kwargs)
+
+    def _recent_unclaimed(self, address):
+        """Return the direct responses of a device received in the last `UNCLAIMED_WAIT` seconds."""
+        unclaimed = self._unclaimed[address]
+        unclaimed[:] = [
+            response
+            for response in unclaimed
+            if monotonic() - response[0] < UNCLAIMED_WAIT
+        ]
+        return unclaimed
+
+    @staticmethod
+    def _resolve(pending, msg_type, kwargs):
+        """Handle the direct response of a pending response."""
+        response = ResponseStatus.FAILURE
+        try:
+            response = pending.callback(msg_type, **kwargs)
+        finally:
+            pending.future.set_result(response)
+
+
+DIRECT_RESPONSES = DirectResponseCorrelator()
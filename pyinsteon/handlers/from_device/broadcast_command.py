@@ -1,11 +1,14 @@
 """Base class to handle Broadcast messages from devices."""
 
-from datetime import datetime
+from time import monotonic
 
 from .. import broadcast_handler
 from ...constants import MessageFlagType
 from ..inbound_base import InboundHandlerBase
 
+# The protocol drops hop repeats with the same windows before publishing
+# (see `protocol.message_dedup`). The handler check remains for topics
+# published without being decoded by the protocol.
 MIN_DUP = 0.7
 MAX_DUP = 2
 
@@ -22,7 +25,7 @@ class BroadcastCommandHandlerBase(InboundHandlerBase):
             group=group,
             message_type=MessageFlagType.ALL_LINK_BROADCAST,
         )
-        self._last_command = datetime(1, 1, 1)
+        self._last_command = None
         self._last_hops_left = None
         self._last_cmd2 = None
         self._last_userdata = None
@@ -39,12 +42,11 @@ class BroadcastCommandHandlerBase(InboundHandlerBase):
 
     def _is_first_message(self, cmd2, user_data, target, hops_left):
         """Test if the message is a duplicate."""
-        curr_time = datetime.now()
-        tdelta = curr_time - self._last_command
-        if tdelta.days > 0:
+        curr_time = monotonic()
+        if self._last_command is None:
             delta = 9999
         else:
-            delta = tdelta.seconds + tdelta.microseconds / 1000000
+            delta = curr_time - self._last_command
         self._last_command = curr_time
 
         if cmd2 != self._last_cmd2 or user_data != self._last_userdata:
@@ -7,6 +7,7 @@ import logging
 import async_timeout
 
 from ..constants import ResponseStatus
+from ..send_token import SEND_TOKEN, SendToken
 from ..utils import build_topic, publish_topic
 from .inbound_base import InboundHandlerBase
 
@@ -20,12 +21,14 @@ class OutboundHandlerBase(InboundHandlerBase):
     """Manage a message chain."""
 
     __meta__ = ABCMeta
+    _msg_timeout = MSG_TIME
 
     def __init__(self, topic, address=None, group=None, message_type=None):
         """Init the MessageManager."""
         self._message_response = asyncio.Queue()
         self._send_lock = asyncio.Lock()
         self._message_type = message_type
+        self._token = None
         super().__init__(topic, address=address, group=group, message_type=message_type)
         self._send_topic = build_topic(
             topic=self._topic,
@@ -42,6 +45,19 @@ class OutboundHandlerBase(InboundHandlerBase):
         """Message response queue to manage message status."""
         return self._message_response
 
+    @property
+    def msg_timeout(self) -> float:
+        """Return the seconds to wait for the modem to send the message."""
+        return self._msg_timeout
+
+    @msg_timeout.setter
+    def msg_timeout(self, value: float):
+        """Set the seconds to wait for the modem to send the message.
+
+        A message still queued after this time is dropped.
+        """
+        self._msg_timeout = value
+
     async def async_send(self, **kwargs):
         """Send the message and wait for a status."""
         async with self._send_lock:
@@ -54,14 +70,29 @@ class OutboundHandlerBase(InboundHandlerBase):
 
             self._nak_retries = NAK_RETRIES
             self._kwargs = kwargs
-            publish_topic(self._send_topic, **self._kwargs)
-
+            self._token = SendToken(self._msg_timeout)
             try:
-                async with async_timeout.timeout(MSG_TIME):
+                self._publish_send()
+                async with async_timeout.timeout(self._msg_timeout):
                     return await self._message_response.get()
             except asyncio.TimeoutError:
-                # Send a FAILURE message if this is running more than 180 seconds
+                # Send a FAILURE message if the message was not sent in time
                 return ResponseStatus.FAILURE
+            finally:
+                # Drop the message or its resends if they are still queued
+                self._token.cancel()
+
+    def _publish_send(self):
+        """Publish the send topic with the message token."""
+        self._publish_with_token(self._token, **self._kwargs)
+
+    def _publish_with_token(self, token: SendToken, **kwargs):
+        """Publish the send topic with a message token."""
+        context_token = SEND_TOKEN.set(token)
+        try:
+            publish_topic(self._send_topic, **kwargs)
+        finally:
+            SEND_TOKEN.reset(context_token)
 
     async def _async_handle_ack(self, **kwargs):
         """Handle the ACK processing."""
@@ -76,7 +107,9 @@ class OutboundHandlerBase(InboundHandlerBase):
                 NAK_RESEND_WAIT * (NAK_RETRIES - self._nak_retries) + NAK_RESEND_WAIT
             )
             await asyncio.sleep(sleep_duration)
-            publish_topic(self._send_topic, **self._kwargs)
+            if self._token is None or self._token.expired:
+                return
+            self._publish_send()
             self._nak_retries -= 1
             return
         await self._message_response.put(ResponseStatus.FAILURE)
@@ -5,84 +5,128 @@ import asyncio
 
 import async_timeout
 
-from .. import ack_handler, direct_ack_handler, direct_nak_handler, nak_handler
+from .. import ack_handler, nak_handler
 from ...constants import MessageFlagType, ResponseStatus
+from ..direct_response import DIRECT_RESPONSES, RESPONSE_DIRECT, PendingResponse
 from ..outbound_base import OutboundHandlerBase
+from ..transaction_manager import DEFAULT_PRIORITY, TRANSACTIONS, CommandSuperseded
 
 TIMEOUT = 6  # Wait time for device response
+STATE_MSG_TIME = 10  # Wait time for the modem to send an on or off command
+STATUS_MSG_TIME = 30  # Wait time for the modem to send a status request
+_DIRECT_ACK = str(MessageFlagType.DIRECT_ACK).lower()
+COALESCE_STATE = "state"
+COALESCE_STATUS = "status"
 
 
 class DirectCommandHandlerBase(OutboundHandlerBase):
-    """Abstract base class for outbound direct message handling."""
+    """Abstract base class for outbound direct message handling.
+
+    The direct ACK or direct NAK response is matched to the command by
+    `DIRECT_RESPONSES` whether it arrives before or after the modem ACK.
+    """
 
     __meta__ = ABCMeta
+    _coalesce = None
+    _priority = DEFAULT_PRIORITY
 
     def __init__(self, topic, address, group=None, message_type=MessageFlagType.DIRECT):
         """Init the DirectCommandHandlerBase class."""
-        self._response_lock = asyncio.Lock()
-        self._direct_response = asyncio.Queue()
+        self._pending: PendingResponse = None
+        self._response_class = RESPONSE_DIRECT
         super().__init__(topic, address=address, group=group, message_type=message_type)
-
-    @property
-    def response_lock(self) -> asyncio.Lock:
-        """Lock to manage the response between ACK and Direct ACK."""
-        return self._response_lock
+        DIRECT_RESPONSES.add_address(self._address)
 
     async def async_send(self, **kwargs):
-        """Send the command and wait for a direct_nak."""
+        """Send the command and wait for the direct ACK or direct NAK.
+
+        The command is sent when no other command to the device is waiting
+        for a response and an in-flight slot of `TRANSACTIONS` is available.
+        Waiting commands are started by `_priority`, the priority of the
+        command's message.
+        With `TRANSACTIONS.coalesce` enabled, a waiting command superseded by
+        a newer command with the same coalesce key returns the outcome of
+        the newer command.
+        """
+        try:
+            async with TRANSACTIONS.async_transaction(
+                self._address, self._coalesce_key(), self._priority
+            ) as outcome:
+                pending = self._register_pending()
+                self._pending = pending
+                try:
+                    response = await self._async_send_and_wait(pending, **kwargs)
+                finally:
+                    DIRECT_RESPONSES.unregister(pending)
+                    if self._pending is pending:
+                        self._pending = None
+                if outcome is not None:
+                    outcome.set_result(response)
+                return response
+        except CommandSuperseded as ex:
+            return await asyncio.shield(ex.outcome)
+
+    def _coalesce_key(self):
+        """Return the key of the waiting commands this command supersedes.
+
+        None if the command is always sent.
+        """
+        if self._coalesce is None:
+            return None
+        return (self._address, self._group, self._coalesce)
+
+    async def _async_send_and_wait(self, pending: PendingResponse, **kwargs):
+        """Send the command and wait for the pending direct response."""
         ack_response = await super().async_send(address=self._address, **kwargs)
-        if ack_response == ResponseStatus.SUCCESS:
-            try:
-                async with async_timeout.timeout(TIMEOUT + 0.1):
-                    return await self._message_response.get()
-            except asyncio.TimeoutError:
-                pass
-        return ResponseStatus.FAILURE
+        if ack_response != ResponseStatus.SUCCESS:
+            return ResponseStatus.FAILURE
+        try:
+            async with async_timeout.timeout(TIMEOUT):
+                return await asyncio.shield(pending.future)
+        except asyncio.TimeoutError:
+            return ResponseStatus.DEVICE_UNRESPONSIVE
 
     @ack_handler
     async def async_handle_ack(self, cmd1, cmd2, user_data):
         """Handle Direct Command ACK message."""
         await self._async_handle_ack()
-        try:
-            async with async_timeout.timeout(TIMEOUT):
-                async with self._response_lock:
-                    direct_response = await self._direct_response.get()
-                    await self._message_response.put(direct_response)
-        except asyncio.TimeoutError:
-            await self._message_response.put(ResponseStatus.DEVICE_UNRESPONSIVE)
+        pending = self._pending
+        if pending is None or pending.acked:
+            # The command was not sent by `async_send`
+            pending = self._register_pending(acked=True)
+            asyncio.get_running_loop().call_later(
+                TIMEOUT, DIRECT_RESPONSES.unregister, pending
+            )
+        pending.acked = True
 
     @nak_handler
     async def async_handle_nak(self, cmd1, cmd2, user_data):
         """Handle the NAK response from the modem."""
         await self._async_handle_nak()
 
-    @direct_nak_handler
-    async def async_handle_direct_nak(self, cmd1, cmd2, target, user_data, hops_left):
-        """Handle the message ACK."""
-        await asyncio.sleep(0.05)
+    def _register_pending(self, acked=False) -> PendingResponse:
+        """Register the pending direct response to the command."""
+        return DIRECT_RESPONSES.register(
+            self._address,
+            self._topic,
+            self._response_class,
+            self._handle_response,
+            acked=acked,
+        )
+
+    def _handle_response(self, msg_type, cmd1, cmd2, target, user_data, hops_left):
+        """Handle the direct ACK or direct NAK and return the response status."""
+        if msg_type == _DIRECT_ACK:
+            self._update_subscribers_on_direct_ack(
+                cmd1, cmd2, target, user_data, hops_left
+            )
+            return ResponseStatus.SUCCESS
         try:
             response = ResponseStatus(cmd2)
         except ValueError:
             response = ResponseStatus.FAILURE
-        if self._response_lock.locked():
-            await self._direct_response.put(response)
-            await asyncio.sleep(0.05)
-            self._update_subscribers_on_direct_nak(
-                cmd1, cmd2, target, user_data, hops_left
-            )
-            await asyncio.sleep(0.05)
-
-    @direct_ack_handler
-    async def async_handle_direct_ack(self, cmd1, cmd2, target, user_data, hops_left):
-        """Handle the direct ACK."""
-        # Need to make sure the ACK has time to aquire the lock
-        await asyncio.sleep(0.05)
-        if self._response_lock.locked():
-            await self._direct_response.put(ResponseStatus.SUCCESS)
-            self._update_subscribers_on_direct_ack(
-                cmd1, cmd2, target, user_data, hops_left
-            )
-            await asyncio.sleep(0.05)
+        self._update_subscribers_on_direct_nak(cmd1, cmd2, target, user_data, hops_left)
+        return response
 
     def _update_subscribers_on_direct_ack(
         self, cmd1, cmd2, target, user_data, hops_left
@@ -8,6 +8,8 @@ from .direct_command import DirectCommandHandlerBase
 class GetOperatingFlagsCommand(DirectCommandHandlerBase):
     """Handle sending a read request for ALDB records."""
 
+    _priority = 7
+
     def __init__(self, address: Address):
         """Init the GetOperatingFlagsCommand."""
         super().__init__(topic=GET_OPERATING_FLAGS, address=address)
@@ -1,12 +1,16 @@
 """Manage outbound ON command to a device."""
 
 from ...topics import OFF_FAST
-from .direct_command import DirectCommandHandlerBase
+from .direct_command import COALESCE_STATE, STATE_MSG_TIME, DirectCommandHandlerBase
 
 
 class OffFastCommand(DirectCommandHandlerBase):
     """Manage an outbound ON command to a device."""
 
+    _coalesce = COALESCE_STATE
+    _priority = 3
+    _msg_timeout = STATE_MSG_TIME
+
     def __init__(self, address, group):
         """Init the OnLevelCommand class."""
         super().__init__(topic=OFF_FAST, address=address, group=group)
@@ -1,12 +1,16 @@
 """Manage outbound ON command to a device."""
 
 from ...topics import ON_FAST
-from .direct_command import DirectCommandHandlerBase
+from .direct_command import COALESCE_STATE, STATE_MSG_TIME, DirectCommandHandlerBase
 
 
 class OnFastCommand(DirectCommandHandlerBase):
     """Manage an outbound ON command to a device."""
 
+    _coalesce = COALESCE_STATE
+    _priority = 3
+    _msg_timeout = STATE_MSG_TIME
+
     def __init__(self, address, group):
         """Init the OnFastCommand class."""
         super().__init__(topic=ON_FAST, address=address, group=group)
@@ -12,6 +12,8 @@ _LOGGER = logging.getLogger(__name__)
 class ReadALDBCommandHandler(DirectCommandHandlerBase):
     """Handle sending a read request for ALDB records."""
 
+    _priority = 10
+
     def __init__(self, address: Address):
         """Init the ReadALDBCommandHandler."""
         super().__init__(topic=EXTENDED_READ_WRITE_ALDB, address=address)
@@ -7,6 +7,8 @@ from .direct_command import DirectCommandHandlerBase
 class SetMsbCommand(DirectCommandHandlerBase):
     """Set most significant byte for peek/poke commands."""
 
+    _priority = 10
+
     def __init__(self, address):
         """Init the SetMsbCommand class."""
         super().__init__(topic=SET_ADDRESS_MSB, address=address)
@@ -1,21 +1,24 @@
 """Manage outbound ON command to a device."""
 
-import asyncio
-
-from .. import ack_handler, status_handler
-from ... import pub
-from ...constants import MessageFlagType, ResponseStatus
+from .. import ack_handler
+from ...constants import MessageFlagType
 from ...topics import STATUS_REQUEST
-from .direct_command import DirectCommandHandlerBase
+from ..direct_response import RESPONSE_STATUS
+from .direct_command import COALESCE_STATUS, STATUS_MSG_TIME, DirectCommandHandlerBase
 
 
 class StatusRequestCommand(DirectCommandHandlerBase):
     """Manage an outbound Status command to a device."""
 
+    _coalesce = COALESCE_STATUS
+    _priority = 7
+    _msg_timeout = STATUS_MSG_TIME
+
     def __init__(self, address, status_type: int = 0):
         """Init the OnLevelCommand class."""
         self._status_type = status_type
         super().__init__(topic=STATUS_REQUEST, address=address, group=None)
+        self._response_class = RESPONSE_STATUS
         self._subscriber_topic = f"handler.{self._address.id}.{self._status_type}.{STATUS_REQUEST}.{str(MessageFlagType.DIRECT).lower()}"
 
     @property
@@ -28,30 +31,21 @@ class StatusRequestCommand(DirectCommandHandlerBase):
         """Send the ON command async."""
         return await super().async_send(status_type=self._status_type)
 
+    def _coalesce_key(self):
+        """Return the key of the status requests this request merges with."""
+        return (self._address, self._status_type, self._coalesce)
+
     @ack_handler
     async def async_handle_ack(self, cmd1, cmd2, user_data):
         """Handle the message ACK."""
         if cmd2 == self._status_type:
             await super().async_handle_ack(cmd1=cmd1, cmd2=cmd2, user_data=user_data)
 
-    @status_handler
-    async def async_handle_direct_ack(self, topic=pub.AUTO_TOPIC, **kwargs):
-        """Handle the Status Request response direct ACK.
+    def _update_subscribers_on_direct_ack(
+        self, cmd1, cmd2, target, user_data, hops_left
+    ):
+        """Update subscribers with the status response.
 
-        This handler listens to all topics for a device therefore we need to
-        confirm the message is a status response.
+        Any direct ACK from the device is the status response.
         """
-        # Need to make sure the ACK has time to aquire the lock
-        await asyncio.sleep(0.06)
-        if not self._response_lock.locked():
-            return
-
-        msg_type = topic.name.split(".")[-1]
-        if msg_type != str(MessageFlagType.DIRECT_ACK):
-            return
-
-        self._direct_response.put_nowait(ResponseStatus.SUCCESS)
-
-        cmd1 = kwargs.get("cmd1")
-        cmd2 = kwargs.get("cmd2")
         self._call_subscribers(db_version=cmd1, status=cmd2)
@@ -12,6 +12,8 @@ _LOGGER = logging.getLogger(__name__)
 class WriteALDBCommandHandler(DirectCommandHandlerBase):
     """Handle sending a read request for ALDB records."""
 
+    _priority = 10
+
     def __init__(self, address: Address):
         """Init the WriteALDBCommandHandler."""
         super().__init__(topic=EXTENDED_READ_WRITE_ALDB, address=address)
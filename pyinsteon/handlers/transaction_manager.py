@@ -0,0 +1,193 @@
+"""Track the direct commands waiting for a device response.
+
+A direct command is in flight from the time it is sent until the device
+responds or the command times out. Commands to different devices are sent
+while other commands are in flight, up to `max_in_flight` commands.
+Interactive commands, with a priority of `INTERACTIVE_PRIORITY` or lower, are
+not limited by `max_in_flight`. Commands to the same device are sent one at a
+time in the order they are requested and waiting commands to different
+devices are started by priority then in the order they are requested.
+
+With `coalesce` enabled, a command waiting to be sent is superseded by a
+newer command with the same key, such as a state-setting command to the same
+device group. The superseded command is not sent and its caller receives the
+outcome of the newer command.
+"""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Hashable, Set, Tuple, Union
+
+from ..address import Address
+from ..constants import ResponseStatus
+
+MAX_IN_FLIGHT = 3
+DEFAULT_PRIORITY = 5
+# Matches the interactive traffic class of the modem message scheduler
+INTERACTIVE_PRIORITY = 3
+
+
+class CommandSuperseded(Exception):
+    """A waiting command was superseded by a newer command."""
+
+    def __init__(self, outcome: asyncio.Future):
+        """Init the CommandSuperseded class."""
+        super().__init__("Command superseded by a newer command")
+        self.outcome = outcome
+
+
+class TransactionManager:
+    """Track the direct commands waiting for a device response."""
+
+    def __init__(self, max_in_flight: int = MAX_IN_FLIGHT):
+        """Init the TransactionManager class."""
+        self._max_in_flight = max_in_flight
+        self._in_flight: Set[Address] = set()
+        self._waiters: Deque[Tuple[Address, asyncio.Future, Hashable, int]] = deque()
+        self._outcomes: Dict[Hashable, asyncio.Future] = {}
+        self._coalesce = False
+
+    @property
+    def max_in_flight(self) -> int:
+        """Return the maximum number of commands waiting for a device response."""
+        return self._max_in_flight
+
+    @max_in_flight.setter
+    def max_in_flight(self, value: int):
+        """Set the maximum number of commands waiting for a device response."""
+        self._max_in_flight = max(1, int(value))
+        self._start_waiters()
+
+    @property
+    def coalesce(self) -> bool:
+        """Return if waiting commands are superseded by newer commands."""
+        return self._coalesce
+
+    @coalesce.setter
+    def coalesce(self, value: bool):
+        """Set if waiting commands are superseded by newer commands."""
+        self._coalesce = bool(value)
+
+    @property
+    def in_flight(self) -> Set[Address]:
+        """Return the addresses of the devices with a command in flight."""
+        return self._in_flight
+
+    @asynccontextmanager
+    async def async_transaction(
+        self,
+        address: Address,
+        key: Hashable = None,
+        priority: int = DEFAULT_PRIORITY,
+    ):
+        """Wait for the device and an in-flight slot to be available.
+
+        Waiting commands with a lower `priority` are started first. With
+        `coalesce` enabled and a `key`, yields the future the command sets its
+        outcome on for the commands it superseded. A superseded command raises
+        `CommandSuperseded`.
+        """
+        address = Address(address)
+        if not self._coalesce:
+            key = None
+        await self._async_acquire(address, key, priority)
+        outcome = self._outcomes.pop(key, None) if key is not None else None
+        try:
+            yield outcome
+        finally:
+            self._release(address)
+            if outcome is not None and not outcome.done():
+                outcome.set_result(ResponseStatus.FAILURE)
+
+    def _can_start(self, address: Address, priority: int) -> bool:
+        """Return if a command to a device can be sent now."""
+        return address not in self._in_flight and (
+            priority <= INTERACTIVE_PRIORITY
+            or len(self._in_flight) < self._max_in_flight
+        )
+
+    async def _async_acquire(
+        self, address: Address, key: Union[Hashable, None], priority: int
+    ):
+        """Wait until a command to a device can be sent."""
+        self._remove_closed_waiters()
+        if self._can_start(address, priority) and not any(
+            waiter[0] == address for waiter in self._waiters
+        ):
+            self._in_flight.add(address)
+            return
+
+        if key is not None:
+            self._supersede(key)
+        future = asyncio.get_running_loop().create_future()
+        waiter = (address, future, key, priority)
+        self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._release_outcome(key)
+            elif (
+                future.done() and not future.cancelled() and future.exception() is None
+            ):
+                self._release(address)
+            raise
+
+    def _release(self, address: Address):
+        """Mark the command to a device as complete."""
+        self._in_flight.discard(address)
+        self._start_waiters()
+
+    def _start_waiters(self):
+        """Start the waiting commands by priority when they can be sent.
+
+        Only the first waiting command to each device can be started.
+        """
+        self._remove_closed_waiters()
+        first_waiters = {}
+        for waiter in list(self._waiters):
+            if waiter[1].done():
+                self._waiters.remove(waiter)
+                continue
+            first_waiters.setdefault(waiter[0], waiter)
+        for waiter in sorted(first_waiters.values(), key=lambda waiter: waiter[3]):
+            address, future, _, priority = waiter
+            if not self._can_start(address, priority):
+                continue
+            self._waiters.remove(waiter)
+            self._in_flight.add(address)
+            future.set_result(None)
+
+    def _supersede(self, key: Hashable):
+        """Supersede the waiting commands with the same key."""
+        outcome = self._outcomes.get(key)
+        if outcome is None or outcome.get_loop().is_closed():
+            outcome = asyncio.get_running_loop().create_future()
+            self._outcomes[key] = outcome
+        for waiter in list(self._waiters):
+            _, future, waiter_key, _ = waiter
+            if waiter_key == key and not future.done():
+                self._waiters.remove(waiter)
+                future.set_exception(CommandSuperseded(outcome))
+
+    def _release_outcome(self, key: Union[Hashable, None]):
+        """Fail the outcome of superseded commands when no command is waiting."""
+        if key is None or any(waiter[2] == key for waiter in self._waiters):
+            return
+        outcome = self._outcomes.pop(key, None)
+        if outcome is not None and not outcome.done():
+            outcome.set_result(ResponseStatus.FAILURE)
+
+    def _remove_closed_waiters(self):
+        """Remove the waiters of a closed event loop."""
+        for waiter in list(self._waiters):
+            if waiter[1].get_loop().is_closed():
+                self._waiters.remove(waiter)
+        for key, outcome in list(self._outcomes.items()):
+            if outcome.get_loop().is_closed():
+                self._outcomes.pop(key)
+
+
+TRANSACTIONS = TransactionManager()
@@ -1,15 +1,21 @@
 """Modem command to get next ALDB record."""
 
+import asyncio
 import logging
+from typing import Dict
+
+import async_timeout
 
 from . import ack_handler, nak_handler
 from ..address import Address
 from ..constants import ResponseStatus
 from ..data_types.all_link_record_flags import AllLinkRecordFlags
+from ..send_token import SendToken
 from ..topics import WRITE_EEPROM
 from .outbound_base import OutboundHandlerBase
 
 _LOGGER = logging.getLogger(__name__)
+WRITE_TIMEOUT = 3
 
 
 class WriteEepromHandler(OutboundHandlerBase):
@@ -17,6 +23,7 @@ class WriteEepromHandler(OutboundHandlerBase):
 
     def __init__(self):
         """Init the ReadEepromHandler class."""
+        self._pending_writes: Dict[int, asyncio.Future] = {}
         super().__init__(topic=WRITE_EEPROM)
         _LOGGER.debug("Setup WriteEepromHandler")
 
@@ -36,6 +43,71 @@ class WriteEepromHandler(OutboundHandlerBase):
         bit4: bool,
     ):
         """Send the Write to EEPROM message."""
+        return await super().async_send(
+            **self._message_kwargs(
+                mem_addr=mem_addr,
+                in_use=in_use,
+                high_water_mark=high_water_mark,
+                controller=controller,
+                group=group,
+                target=target,
+                data1=data1,
+                data2=data2,
+                data3=data3,
+                bit5=bit5,
+                bit4=bit4,
+            )
+        )
+
+    async def async_write(self, mem_addr: int, **kwargs) -> ResponseStatus:
+        """Send the Write to EEPROM message matched to its ACK by memory address.
+
+        Unlike `async_send`, writes to different memory addresses wait for
+        their ACK at the same time. The ACK is expected within `WRITE_TIMEOUT`
+        of the message being written to the modem. A message still queued
+        after `msg_timeout` is dropped.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        ack_timer = None
+
+        def _start_ack_timeout():
+            nonlocal ack_timer
+            ack_timer = loop.call_later(WRITE_TIMEOUT, _set_failure, future)
+
+        token = SendToken(self._msg_timeout, on_sent=_start_ack_timeout)
+        self._pending_writes[mem_addr] = future
+        try:
+            self._publish_with_token(
+                token, **self._message_kwargs(mem_addr=mem_addr, **kwargs)
+            )
+            async with async_timeout.timeout(self._msg_timeout + WRITE_TIMEOUT):
+                return await future
+        except asyncio.TimeoutError:
+            return ResponseStatus.FAILURE
+        finally:
+            # Drop the message if it is still queued
+            token.cancel()
+            if ack_timer is not None:
+                ack_timer.cancel()
+            if self._pending_writes.get(mem_addr) is future:
+                self._pending_writes.pop(mem_addr)
+
+    @staticmethod
+    def _message_kwargs(
+        mem_addr: int,
+        in_use: bool,
+        high_water_mark: bool,
+        controller: bool,
+        group: int,
+        target: Address,
+        data1: int,
+        data2: int,
+        data3: int,
+        bit5: bool,
+        bit4: bool,
+    ):
+        """Return the Write to EEPROM message arguments."""
         mem_array = mem_addr.to_bytes(2, "big")
         flags = AllLinkRecordFlags.create(
             in_use=in_use,
@@ -44,16 +116,24 @@ class WriteEepromHandler(OutboundHandlerBase):
             bit5=bit5,
             bit4=bit4,
         )
-        return await super().async_send(
-            mem_hi=mem_array[0],
-            mem_low=mem_array[1] - 7,
-            flags=flags,
-            group=group,
-            target=target,
-            data1=data1,
-            data2=data2,
-            data3=data3,
-        )
+        return {
+            "mem_hi": mem_array[0],
+            "mem_low": mem_array[1] - 7,
+            "flags": flags,
+            "group": group,
+            "target": target,
+            "data1": data1,
+            "data2": data2,
+            "data3": data3,
+        }
+
+    def _resolve_write(self, mem_addr: int, response: ResponseStatus) -> bool:
+        """Resolve the pending write to a memory address."""
+        future = self._pending_writes.get(mem_addr)
+        if future is None or future.done():
+            return False
+        future.set_result(response)
+        return True
 
     @ack_handler
     async def async_handle_ack(
@@ -67,7 +147,11 @@ class WriteEepromHandler(OutboundHandlerBase):
         data3: int,
     ):
         """Send the Read from EEPROM message."""
-        await self._async_handle_ack()
+        if self._resolve_write(mem_addr, ResponseStatus.SUCCESS):
+            return
+        # An ACK to a write that is no longer waiting is dropped
+        if self._send_lock.locked():
+            await self._async_handle_ack()
 
     @nak_handler
     async def async_handle_nak(
@@ -81,4 +165,13 @@ class WriteEepromHandler(OutboundHandlerBase):
         data3: int,
     ):
         """Receive the NAK message and return False."""
-        await self._message_response.put(ResponseStatus.FAILURE)
+        if self._resolve_write(mem_addr, ResponseStatus.FAILURE):
+            return
+        if self._send_lock.locked():
+            await self._message_response.put(ResponseStatus.FAILURE)
+
+
+def _set_failure(future: asyncio.Future):
+    """Fail a write that was not acknowledged in time."""
+    if not future.done():
+        future.set_result(ResponseStatus.FAILURE)
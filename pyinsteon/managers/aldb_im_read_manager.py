@@ -19,6 +19,9 @@ from ..topics import ALL_LINK_RECORD_RESPONSE
 
 _LOGGER = logging.getLogger(__name__)
 TIMEOUT = 2
+# Number of EEPROM reads waiting for a record at one time
+EEPROM_WINDOW = 4
+EEPROM_RETRIES = 5
 
 
 class ImReadManager:
@@ -40,6 +43,8 @@ class ImReadManager:
         self._retries = 0
         self._load_lock = asyncio.Lock()
         self._record_queue = asyncio.Queue()
+        self._eeprom_records = None
+        self._eeprom_event = asyncio.Event()
 
     async def async_load_standard(self):
         """Load the Insteon Modem ALDB using standard method."""
@@ -54,18 +59,71 @@ class ImReadManager:
 
     async def async_load_eeprom(self):
         """Load the Insteon modem ALDB using EEPROM reads."""
-        self._clear_read_queue()
-        next_mem_addr = self._aldb.first_mem_addr
-        record = await self.async_read_record(next_mem_addr)
-        if record:
-            yield record
-        else:
-            return
-        for record in await self.async_read_record(next_mem_addr):
+        async for record in self.async_read_records(self._aldb.first_mem_addr):
             yield record
-            if record.is_high_water_mark:
-                return
-            next_mem_addr -= 8
+
+    async def async_read_records(self, mem_addr: int, window: int = EEPROM_WINDOW):
+        """Read records from EEPROM starting at `mem_addr` down to the HWM.
+
+        Up to `window` reads are waiting for a record at one time. Records are
+        returned in memory address order. Reads that do not return a record
+        are requested again.
+        """
+        self._eeprom_records = {}
+        self._eeprom_event.clear()
+        cmd = ReadEepromHandler()
+        loop = asyncio.get_event_loop()
+        next_send = mem_addr
+        next_yield = mem_addr
+        in_flight = {}
+        retries = {}
+        try:
+            while True:
+                # Return the records received so far in memory address order
+                while next_yield in self._eeprom_records:
+                    record = self._eeprom_records.pop(next_yield)
+                    in_flight.pop(next_yield, None)
+                    yield record
+                    if record.is_high_water_mark:
+                        return
+                    next_yield -= 8
+
+                # Keep the window of reads full until the HWM is found
+                hwm_mem_addr = self._eeprom_hwm()
+                while len(in_flight) < window and next_send > 0 and not hwm_mem_addr:
+                    if not await self._async_send_read(cmd, next_send, retries):
+                        return
+                    in_flight[next_send] = loop.time()
+                    next_send -= 8
+                    hwm_mem_addr = self._eeprom_hwm()
+
+                if next_yield in self._eeprom_records:
+                    continue
+                if not in_flight:
+                    return
+
+                try:
+                    async with async_timeout.timeout(TIMEOUT):
+                        await self._eeprom_event.wait()
+                except asyncio.TimeoutError:
+                    pass
+                self._eeprom_event.clear()
+
+                now = loop.time()
+                for read_addr in sorted(in_flight, reverse=True):
+                    if read_addr in self._eeprom_records:
+                        continue
+                    if now - in_flight[read_addr] < TIMEOUT:
+                        continue
+                    if hwm_mem_addr and read_addr < hwm_mem_addr:
+                        in_flight.pop(read_addr)
+                        continue
+                    _LOGGER.debug("Requesting missing record: 0x%04x", read_addr)
+                    if not await self._async_send_read(cmd, read_addr, retries):
+                        return
+                    in_flight[read_addr] = loop.time()
+        finally:
+            self._eeprom_records = None
 
     async def async_get_first_all_link_record(self):
         """Get the first All-Link database record."""
@@ -132,6 +190,26 @@ class ImReadManager:
                     return None
             await asyncio.sleep(0.5)
 
+    def _eeprom_hwm(self):
+        """Return the memory address of the HWM if it has been read."""
+        hwm_addrs = [
+            mem_addr
+            for mem_addr, record in self._eeprom_records.items()
+            if record.is_high_water_mark
+        ]
+        return max(hwm_addrs) if hwm_addrs else None
+
+    @staticmethod
+    async def _async_send_read(cmd, mem_addr, retries) -> bool:
+        """Send an EEPROM read and return True if the modem accepted it."""
+        while retries.get(mem_addr, 0) < EEPROM_RETRIES:
+            retries[mem_addr] = retries.get(mem_addr, 0) + 1
+            response = await cmd.async_send(mem_addr=mem_addr)
+            if response == ResponseStatus.SUCCESS:
+                return True
+        _LOGGER.debug("Unable to read EEPROM record: 0x%04x", mem_addr)
+        return False
+
     async def async_confirm_eeprom_read(self) -> int:
         """Confirm the first memory address is readable with an EEPROM read.
 
@@ -245,6 +323,10 @@ class ImReadManager:
             bit5=bit5,
             bit4=bit4,
         )
+        if self._eeprom_records is not None:
+            self._eeprom_records[mem_addr] = record
+            self._eeprom_event.set()
+            return
         self._record_queue.put_nowait(record)
 
     async def _find_next_records(self, target, group):
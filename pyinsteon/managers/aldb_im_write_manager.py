@@ -1,7 +1,8 @@
 """Manage the ALDB write process for an Insteon Modem."""
 
+import asyncio
 import logging
-from typing import Tuple
+from typing import List, Tuple
 
 from ..aldb.aldb_record import ALDBRecord
 from ..constants import ManageAllLinkRecordAction, ReadWriteMode, ResponseStatus
@@ -11,6 +12,8 @@ from .aldb_write_manager import ALDBWriteException
 
 _LOGGER = logging.getLogger(__name__)
 MAX_RETRIES = 5
+# Number of EEPROM writes waiting for an ACK at one time
+EEPROM_WINDOW = 4
 
 
 class ImWriteManager:
@@ -19,6 +22,7 @@ class ImWriteManager:
     def __init__(self, aldb):
         """Init the ImWriteManager."""
         self._write_cmd = ManageAllLinkRecordCommand()
+        self._write_eeprom_cmd = WriteEepromHandler()
         self._aldb = aldb
 
     @property
@@ -43,13 +47,62 @@ class ImWriteManager:
 
         return await self._async_write_change_standard(record)
 
+    async def async_write_records(
+        self, records: List[ALDBRecord], force=False, window: int = EEPROM_WINDOW
+    ) -> List[ResponseStatus]:
+        """Write a set of records to the ALDB in order.
+
+        Returns the result of each write. In EEPROM mode up to `window`
+        writes wait for their ACK at one time since the ACK echoes the memory
+        address. Standard mode writes find records by target and group so
+        each write is sent after the prior write completes.
+        """
+        if not self.can_write and not force:
+            raise ALDBWriteException(
+                "All-Link databased must be loaded before writing."
+            )
+        if self._aldb.read_write_mode == ReadWriteMode.EEPROM:
+            return await self._async_write_eeprom_window(records, window)
+        results = []
+        for record in records:
+            results.append(await self.async_write(record, force=True))
+        return results
+
+    async def _async_write_eeprom_window(
+        self, records: List[ALDBRecord], window: int
+    ) -> List[ResponseStatus]:
+        """Write records to EEPROM with up to `window` writes waiting for an ACK."""
+        slots = asyncio.Semaphore(window)
+
+        async def _async_write(record):
+            async with slots:
+                retries = MAX_RETRIES
+                result = ResponseStatus.UNSENT
+                while retries and result != ResponseStatus.SUCCESS:
+                    result = await self._write_eeprom_cmd.async_write(
+                        mem_addr=record.mem_addr,
+                        controller=record.is_controller,
+                        group=record.group,
+                        target=record.target,
+                        data1=record.data1,
+                        data2=record.data2,
+                        data3=record.data3,
+                        in_use=record.is_in_use,
+                        high_water_mark=record.is_high_water_mark,
+                        bit5=record.is_bit5_set,
+                        bit4=record.is_bit4_set,
+                    )
+                    retries -= 1
+                return result
+
+        return list(await asyncio.gather(*[_async_write(rec) for rec in records]))
+
     async def async_write_record(self, record: ALDBRecord):
         """Write to EEPROM."""
-        cmd = WriteEepromHandler()
-        retries = 5
+        retries = MAX_RETRIES
         result = ResponseStatus.UNSENT
         while retries and result != ResponseStatus.SUCCESS:
-            result = await cmd.async_send(
+            result = await self._write_eeprom_cmd.async_send(
                 mem_addr=record.mem_addr,
                 controller=record.is_controller,
                 group=record.group,
@@ -94,18 +147,17 @@ class ImWriteManager:
         self, record
     ) -> Tuple[ResponseStatus, ALDBRecord]:
         """Write a deleted record."""
-        matching_recs = await self._aldb.async_find_records(
-            target=record.target, group=record.group
-        )
         rec_to_delete = None
-        for rec in matching_recs:
-            if rec.is_controller == record.is_controller:
+        async for rec in self._aldb.async_find_records(record.target, record.group):
+            if rec is not None and rec.is_controller == record.is_controller:
                 rec_to_delete = rec
                 break
         if rec_to_delete:
-            return self._async_write_record_standard(
-                rec_to_delete, ManageAllLinkRecordAction.DELETE_FIRST
+            return await self._async_write_record_standard(
+                ManageAllLinkRecordAction.DELETE_FIRST, rec_to_delete
             )
+        # The record is not in the modem so it is already deleted
+        return ResponseStatus.SUCCESS
 
     async def _async_write_record_standard(
         self, action, record
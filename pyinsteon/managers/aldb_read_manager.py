@@ -2,13 +2,13 @@
 
 import asyncio
 import logging
+from time import monotonic
 
 import async_timeout
 
 from ..address import Address
-from ..aldb.aldb_record import ALDBRecord
+from ..aldb.aldb_record import RECORD_LENGTH, ALDBRecord, aldb_record_from_bytes
 from ..constants import ALDBStatus, ReadWriteMode, ResponseStatus
-from ..data_types.all_link_record_flags import AllLinkRecordFlags
 from ..handlers.from_device.receive_aldb_record import ReceiveALDBRecordHandler
 from ..handlers.to_device.read_aldb import ReadALDBCommandHandler
 from ..managers.peek_poke_manager import get_peek_poke_manager
@@ -17,7 +17,13 @@ from ..utils import subscribe_topic
 
 RETRIES_ALL_MAX = 5
 RETRIES_ONE_MAX = 20
+# Maximum and minimum time to wait for a record
 TIMER_RECORD = 10
+TIMER_RECORD_MIN = 3
+# The record timeout is this multiple of the observed record latency
+TIMER_RECORD_FACTOR = 4
+# Weight of the newest latency sample in the average
+LATENCY_WEIGHT = 0.25
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -35,6 +41,7 @@ class ALDBReadManager:
         self._first_record = first_record
         self._record_queue = asyncio.Queue()
         self._continue = True
+        self._record_latency = None
 
         self._read_handler = ReadALDBCommandHandler(self._address)
         self._record_handler = ReceiveALDBRecordHandler(self._address)
@@ -53,7 +60,12 @@ class ALDBReadManager:
         num_recs: int = 0,
         read_write_mode=ReadWriteMode.STANDARD,
     ):
-        """Return an iterator of All-Link Database records."""
+        """Return an iterator of All-Link Database records.
+
+        If `num_recs` is greater than 1, up to `num_recs` records are read
+        starting at `mem_addr`. If `mem_addr` and `num_recs` are 0 all
+        records are read.
+        """
         _LOGGER.debug(
             "%s: Read memory %04x and %d records",
             str(self._address),
@@ -71,24 +83,44 @@ class ALDBReadManager:
             read_one_method = self._read_one
 
         if _is_multiple_records(mem_addr, num_recs):
-            async for record in read_all_method():
+            async for record in read_all_method(mem_addr, num_recs):
                 _LOGGER.debug("Read manager returning: %s", str(record))
                 yield record
-                await asyncio.sleep(0.05)
         else:
             record = await read_one_method(mem_addr)
             if record is not None:
                 _LOGGER.debug("Read manager returning: %s", str(record))
                 yield record
-                await asyncio.sleep(0.05)
 
         _LOGGER.debug("Read manager completed")
 
+    @property
+    def record_timeout(self) -> float:
+        """Return the time to wait for the next record.
+
+        The timeout adapts to the record latency observed from the device.
+        """
+        if self._record_latency is None:
+            return TIMER_RECORD
+        return min(
+            TIMER_RECORD,
+            max(TIMER_RECORD_MIN, TIMER_RECORD_FACTOR * self._record_latency),
+        )
+
     async def async_stop(self):
         """Stop the reading process."""
         self._continue = False
         await self._record_queue.put(None)
-        await asyncio.sleep(0.01)
+
+    def _update_latency(self, start_time):
+        """Update the observed record latency."""
+        latency = monotonic() - start_time
+        if self._record_latency is None:
+            self._record_latency = latency
+        else:
+            self._record_latency = (
+                1 - LATENCY_WEIGHT
+            ) * self._record_latency + LATENCY_WEIGHT * latency
 
     async def _read_one(self, mem_addr):
         """Read one record."""
@@ -109,50 +141,50 @@ class ALDBReadManager:
                     response,
                 )
                 return None
+            start_time = monotonic()
             try:
-                async with async_timeout.timeout(TIMER_RECORD):
+                async with async_timeout.timeout(self.record_timeout):
                     record = await self._record_queue.get()
                     if (
                         record is not None
                         and record.mem_addr == mem_addr
                         or mem_addr == 0x0000
                     ):
+                        self._update_latency(start_time)
                         _LOGGER.debug("_read_one returning record: %s", str(record))
                         return record
                     _LOGGER.debug("_read_one not returning record: %s", str(record))
             except asyncio.TimeoutError:
                 retries -= 1
-            await asyncio.sleep(0.1)
         _LOGGER.debug("_read_one completed")
         return None
 
     async def _read_one_peek(self, mem_addr):
-        """Read one record using peek commands."""
+        """Read one record using peek commands.
+
+        Bytes already received are kept between retries so only the missing
+        bytes are peeked again.
+        """
         mem_addr = self._first_record if mem_addr == 0 else mem_addr
+        first_addr = mem_addr - RECORD_LENGTH + 1
+        record = {}
         retries = RETRIES_ONE_MAX
         while retries:
-            record = bytearray()
-            for curr_byte in range(0, 8):
-                value = await self._async_peek(mem_addr=mem_addr - curr_byte)
+            for curr_addr in range(mem_addr, first_addr - 1, -1):
+                if curr_addr in record:
+                    continue
+                value = await self._async_peek(mem_addr=curr_addr)
                 if value is None:
                     break
                 if value == -1:
                     return None
-                record.append(value)
-            if len(record) == 8:
-                flags = AllLinkRecordFlags(record[7])
-                aldb_record = ALDBRecord(
-                    memory=mem_addr,
-                    controller=flags.is_controller,
-                    group=record[6],
-                    target=Address(bytearray([record[5], record[4], record[3]])),
-                    data1=record[2],
-                    data2=record[1],
-                    data3=record[0],
-                    in_use=flags.is_in_use,
-                    high_water_mark=flags.is_hwm,
-                    bit4=flags.is_bit_4_set,
-                    bit5=flags.is_bit_5_set,
+                record[curr_addr] = value
+            if len(record) == RECORD_LENGTH:
+                aldb_record = aldb_record_from_bytes(
+                    mem_addr,
+                    bytes(
+                        record[first_addr + offset] for offset in range(RECORD_LENGTH)
+                    ),
                 )
                 _LOGGER.info(str(aldb_record))
                 return aldb_record
@@ -200,13 +232,17 @@ class ALDBReadManager:
             _LOGGER.debug("Retrying byte at 0x%04X", mem_addr)
         return None
 
-    async def _read_all(self):
-        """Read all records."""
+    async def _read_all(self, mem_addr=0, num_recs=0):
+        """Read all records or `num_recs` records starting at `mem_addr`.
+
+        Each record is returned as soon as it arrives. If the device stops
+        sending records, the read restarts from the last record received.
+        """
         retries = RETRIES_ALL_MAX
-        mem_addr = 0
+        remaining = num_recs
         while retries and self._continue:
             response = await self._read_handler.async_send(
-                mem_addr=mem_addr, num_recs=0
+                mem_addr=mem_addr, num_recs=remaining
             )
             if response in [
                 ResponseStatus.DIRECT_NAK_ALDB,
@@ -220,37 +256,47 @@ class ALDBReadManager:
                     response,
                 )
                 return
+            start_time = monotonic()
             try:
                 while self._continue:
-                    async with async_timeout.timeout(TIMER_RECORD):
+                    async with async_timeout.timeout(self.record_timeout):
                         record: ALDBRecord = await self._record_queue.get()
-                        if record is None:
-                            _LOGGER.debug("_read_all completed")
+                    if record is None:
+                        _LOGGER.debug("_read_all completed")
+                        return
+                    self._update_latency(start_time)
+                    start_time = monotonic()
+                    _LOGGER.debug("_read_all returning record: %s", str(record))
+                    if record.is_high_water_mark:
+                        mem_addr = 0
+                    else:
+                        mem_addr = record.mem_addr
+                    yield record
+                    if num_recs:
+                        remaining -= 1
+                        if not remaining or record.is_high_water_mark:
                             return
-                        _LOGGER.debug("_read_all returning record: %s", str(record))
-                        if record.is_high_water_mark:
-                            mem_addr = 0
-                        else:
-                            mem_addr = record.mem_addr
-                        yield record
-                        await asyncio.sleep(0.05)
+                    start_time = monotonic()
             except asyncio.TimeoutError:
                 retries -= 1
 
         _LOGGER.debug("_read_all completed")
 
-    async def _read_all_peek(self):
-        """Read all ALDB records using peek commands."""
-        next_record = self._first_record
+    async def _read_all_peek(self, mem_addr=0, num_recs=0):
+        """Read all or `num_recs` ALDB records using peek commands."""
+        next_record = self._first_record if mem_addr == 0 else mem_addr
+        remaining = num_recs
         while self._continue:
             record = await self._read_one_peek(next_record)
             if record is None:
                 return
             yield record
-            await asyncio.sleep(0.05)
             if record.is_high_water_mark:
                 return
-            await asyncio.sleep(0.06)  # let the ALDB catch up to changes
+            if num_recs:
+                remaining -= 1
+                if not remaining:
+                    return
             next_record = next_record - 8
 
     async def _receive_record(
@@ -3,7 +3,7 @@
 import asyncio
 from typing import Tuple
 
-from ..aldb.aldb_record import ALDBRecord
+from ..aldb.aldb_record import RECORD_LENGTH, ALDBRecord, aldb_record_to_bytes
 from ..constants import ReadWriteMode, ResponseStatus
 from ..handlers.to_device.write_aldb import WriteALDBCommandHandler
 from ..managers.peek_poke_manager import get_peek_poke_manager
@@ -67,25 +67,21 @@ class ALDBWriteManager:
         return result
 
     async def _poke_record(self, record: ALDBRecord):
-        """Write the record using poke commands."""
-
-        rec_bytes = bytearray(
-            [
-                record.data3,
-                record.data2,
-                record.data1,
-                record.target.low,
-                record.target.middle,
-                record.target.high,
-                record.group,
-                record.control_flags,
-            ]
-        )
-        mem_addr = record.mem_addr
-        for curr_byte in range(0, 8):
-            result = await self._async_write_byte(
-                mem_addr - curr_byte, rec_bytes[curr_byte]
-            )
+        """Write the record using poke commands.
+
+        Only the bytes that differ from the device memory image are written.
+        Bytes are written from the highest memory address down so bytes
+        sharing the same MSB are written together and the control flags byte
+        is written last.
+        """
+        rec_bytes = aldb_record_to_bytes(record)
+        first_addr = record.mem_addr - RECORD_LENGTH + 1
+        memory = self._poke_manager.memory
+        for offset in range(RECORD_LENGTH - 1, -1, -1):
+            mem_addr = first_addr + offset
+            if memory.get(mem_addr) == rec_bytes[offset]:
+                continue
+            result = await self._async_write_byte(mem_addr, rec_bytes[offset])
             if result != ResponseStatus.SUCCESS:
                 return result
         return ResponseStatus.SUCCESS
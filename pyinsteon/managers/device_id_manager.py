@@ -19,11 +19,15 @@ from ..handlers.to_device.id_request import IdRequestCommand
 from ..handlers.to_device.ping import PingCommand
 from ..subscriber_base import SubscriberBase
 from ..utils import subscribe_topic, unsubscribe_topic
+from .timer_manager import timer_manager
 
 _LOGGER = logging.getLogger(__name__)
 MAX_RETRIES = 5
 RETRY_PAUSE = 2
 PING_DELAY = 20
+PING_WAIT = 60
+# 1.5 days. If a devices does not respond in this time it is dead
+PING_RETRIES = 24 * 60 * 1.5
 
 
 DeviceId = namedtuple("DeviceId", "address cat subcat firmware")  # product_id')
@@ -57,7 +61,8 @@ class DeviceIdManager(SubscriberBase):
         self._id_device_lock = asyncio.Lock()
         self._all_link_complete = AllLinkCompletedHandler()
         self._all_link_complete.subscribe(self._all_link_complete_received)
-        self._ping_tasks = {}
+        self._ping_timers = {}
+        self._ping_retries = {}
 
     def __getitem__(self, address):
         """Return the unknown device list."""
@@ -83,8 +88,8 @@ class DeviceIdManager(SubscriberBase):
         """Close the ID listener."""
         if self._awake_devices_queue is not None:
             self._awake_devices_queue.put_nowait(None)
-        for _, task in self._ping_tasks.items():
-            task.cancel()
+        for address in list(self._ping_timers):
+            self._stop_ping(address)
 
     def append(self, address: Address, refresh=False):
         """Append a device address to the list."""
@@ -100,9 +105,11 @@ class DeviceIdManager(SubscriberBase):
             self._device_ids[address] = DeviceId(address, None, None, None)
             if address not in self._unknown_devices:
                 self._unknown_devices.append(address)
-            if address not in self._ping_tasks:
-                task = asyncio.ensure_future(self._ping_device(address))
-                self._ping_tasks[address] = task
+            if address not in self._ping_timers:
+                self._ping_retries[address] = PING_RETRIES
+                self._ping_timers[address] = timer_manager.call_later(
+                    PING_WAIT, self._async_ping_device, address
+                )
             subscribe_topic(self._device_awake, address.id)
 
     def set_device_id(
@@ -122,8 +129,7 @@ class DeviceIdManager(SubscriberBase):
         if address in self._unknown_devices:
             self._unknown_devices.remove(address)
         unsubscribe_topic(self._device_awake, address.id)
-        if address in self._ping_tasks:
-            self._ping_tasks[address].cancel()
+        self._stop_ping(address)
 
         device_id = DeviceId(address, cat, subcat, firmware)
         self._device_ids[address] = device_id
@@ -219,8 +225,7 @@ class DeviceIdManager(SubscriberBase):
                 subscribe_topic(self._device_awake, address.id)
             elif device_id is None:
                 unsubscribe_topic(self._device_awake, address.id)
-                if address in self._ping_tasks:
-                    self._ping_tasks[address].cancel()
+                self._stop_ping(address)
                 break
 
     def _device_awake(self, topic=pub.AUTO_TOPIC, **kwargs):
@@ -255,34 +260,45 @@ class DeviceIdManager(SubscriberBase):
         """Receive All-Link complete message."""
         self._id_response(target, cat, subcat, firmware, group, link_mode)
 
-    async def _ping_device(self, address):
-        """Ping the device until awake."""
-        cmd = PingCommand(address)
-        response = None
-        retry_wait = 60
-        retries = (
-            24 * 60 * 1.5
-        )  # 1.5 days. If a devices does not respond in this time it is dead
-        try:
-            while retries and response != ResponseStatus.SUCCESS:
-                device_id = self._device_ids.get(address)
-                if device_id is not None and device_id.cat is not None:
-                    return
-                await asyncio.sleep(retry_wait)
-                response = await cmd.async_send()
-                if response in [
-                    ResponseStatus.DIRECT_NAK_ALDB,
-                    ResponseStatus.DIRECT_NAK_CHECK_SUM,
-                    ResponseStatus.DIRECT_NAK_INVALID_COMMAND,
-                    ResponseStatus.DIRECT_NAK_NO_LOAD,
-                ]:
-                    _LOGGER.warning(
-                        "Device %s rejected an ID request with error: %s (%r)",
-                        str(address),
-                        response,
-                        response,
-                    )
-                    return
-                retries -= 1
-        except asyncio.CancelledError:
+    async def _async_ping_device(self, address):
+        """Ping the device to see if it is awake.
+
+        The ping is repeated every PING_WAIT seconds until the device responds.
+        """
+        timer = self._ping_timers.get(address)
+        device_id = self._device_ids.get(address)
+        retries = self._ping_retries.get(address, 0)
+        if (
+            timer is None
+            or not retries
+            or (device_id is not None and device_id.cat is not None)
+        ):
+            self._stop_ping(address)
             return
+
+        # Keep the timer active while the ping is in progress
+        self._ping_retries[address] = retries - 1
+        timer.rearm(PING_WAIT)
+        response = await PingCommand(address).async_send()
+        if response == ResponseStatus.SUCCESS:
+            self._stop_ping(address)
+        elif response in [
+            ResponseStatus.DIRECT_NAK_ALDB,
+            ResponseStatus.DIRECT_NAK_CHECK_SUM,
+            ResponseStatus.DIRECT_NAK_INVALID_COMMAND,
+            ResponseStatus.DIRECT_NAK_NO_LOAD,
+        ]:
+            _LOGGER.warning(
+                "Device %s rejected an ID request with error: %s (%r)",
+                str(address),
+                response,
+                response,
+            )
+            self._stop_ping(address)
+
+    def _stop_ping(self, address):
+        """Stop pinging a device."""
+        timer = self._ping_timers.pop(address, None)
+        self._ping_retries.pop(address, None)
+        if timer is not None:
+            timer.cancel()
@@ -1,7 +1,8 @@
 """Manages links between devices to identify device state of responders."""
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import timedelta
+from time import monotonic
 from typing import Dict, Tuple, Union
 
 import voluptuous as vol
@@ -110,7 +111,7 @@ class DeviceLinkManager:
         # The _last_command property holds the last command to change a device group
         # If the last command is the same as the current command, do nothing.
         # Otherwise we send a status request
-        self._last_command: Dict[Address, Dict[int, Tuple[str, datetime]]] = {}
+        self._last_command: Dict[Address, Dict[int, Tuple[str, float]]] = {}
 
     @property
     def links(
@@ -170,14 +171,14 @@ class DeviceLinkManager:
         if deleted:
             self._remove_link(record=record, controller=controller)
         else:
-            self._add_link(record=record, controller=controller, responder=responder)
+            self._add_link(record.group, controller=controller, responder=responder)
 
-    def _add_link(self, record, controller, responder):
+    def _add_link(self, group, controller, responder):
         """Add a link to the controller/responder list."""
-        if self._is_standard_modem_link(controller, responder, record.group):
+        if self._is_standard_modem_link(controller, responder, group):
             return
         # Listen for the controller group topic and check known responders.
-        subscribe_topic(self._async_check_responders, f"{controller.id}.{record.group}")
+        subscribe_topic(self._async_check_responders, f"{controller.id}.{group}")
 
     def _remove_link(self, record, controller):
         """Remove a controller or responder link from the controller/responder list."""
@@ -204,9 +205,11 @@ class DeviceLinkManager:
                     )
                     return
             device.aldb.subscribe_record_changed(self._link_changed)
-            for _, record in device.aldb.items():
-                if record.is_in_use:
-                    self._link_changed(record=record, sender=address, deleted=False)
+            for target, group, is_controller in device.aldb.links().values():
+                if is_controller:
+                    self._add_link(group, controller=device.address, responder=target)
+                else:
+                    self._add_link(group, controller=target, responder=device.address)
 
     async def _async_check_responders(self, topic=pub.AUTO_TOPIC, **kwargs) -> None:
         controller, group, command, msg_type = _topic_to_addr_group(topic)
@@ -251,16 +254,19 @@ class DeviceLinkManager:
         return False
 
     def _is_duplicate_message(self, controller: Address, group: int, command: str):
-        """Test if this is the duplicate message to notify of a change.
+        """Test if the responders were checked for this command recently.
 
-        This method is intended to reduce the number of status request changes to responders.
+        This is not a message repeat filter. The broadcast and the cleanup
+        messages of one command have different message types so the protocol
+        passes both. This check sends one round of responder status requests
+        per command within `TIMEOUT_DUPLICATE`.
         """
         last_command = self._last_command.get(controller, {}).get(group)
         if not last_command:
             self._save_last_command(controller, group, command)
             return False
-        tdelta = datetime.now() - last_command[1]
-        if command == last_command[0] and tdelta < TIMEOUT_DUPLICATE:
+        tdelta = monotonic() - last_command[1]
+        if command == last_command[0] and tdelta < TIMEOUT_DUPLICATE.total_seconds():
             return True
         self._save_last_command(controller, group, command)
         return False
@@ -268,5 +274,5 @@ class DeviceLinkManager:
     def _save_last_command(self, controller: Address, group: int, command: str):
         """Save the date and time of the last command from a controller."""
         controller_commands = self._last_command.get(controller, {})
-        controller_commands[group] = (command, datetime.now())
+        controller_commands[group] = (command, monotonic())
         self._last_command[controller] = controller_commands
@@ -7,7 +7,7 @@ from typing import ValuesView
 import async_timeout
 
 from ..address import Address
-from ..constants import AllLinkMode, DeviceAction
+from ..constants import AllLinkMode, DeviceAction, EngineVersion
 from ..device_types.device_base import Device
 from ..device_types.modem_base import ModemBase
 from ..device_types.x10_base import X10DeviceBase
@@ -16,16 +16,17 @@ from ..subscriber_base import SubscriberBase
 from ..topics import DEVICE_LIST_CHANGED
 from ..x10_address import X10Address
 from .device_id_manager import DeviceId, DeviceIdManager
-from .link_manager import (
-    async_cancel_linking_mode,
-    async_enter_linking_mode,
-    async_unlink_devices,
-)
+from .fact_cache import ALDB
+from .link_manager import async_cancel_linking_mode, async_enter_linking_mode
+from .link_manager.link_planner import LinkPlanner
+from .poll_manager import PollManager
+from .state_snapshot_manager import StateSnapshotManager
 from .utils import create_device, create_x10_device
 
 DEVICE_INFO_FILE = "insteon_devices.json"
 _LOGGER = logging.getLogger(__name__)
 _DEVICE_LOGGERS = []
+ENGINE_VERSION_CONCURRENCY = 3
 
 
 class DeviceManager(SubscriberBase):
@@ -39,6 +40,9 @@ class DeviceManager(SubscriberBase):
         self._id_manager = DeviceIdManager()
         self._id_manager.subscribe(self._async_device_identified)
         self._loading_saved_lock = asyncio.Lock()
+        self._engine_version_task = None
+        self._state_manager = None
+        self._poll_manager = PollManager(self)
 
         self._delay_device_inspection = False
         self._to_be_inspected = []
@@ -145,10 +149,17 @@ class DeviceManager(SubscriberBase):
         """Return the devices."""
         return self._devices.values()
 
-    async def async_inspect_device(self, device: Device):
-        """Inspect the properties of the devices."""
-        await device.async_read_config()
-        await self.modem.aldb.async_load()
+    async def async_inspect_device(self, device: Device, force: bool = False):
+        """Inspect the properties of the devices.
+
+        Device settings and the Modem ALDB that are fresh in their `fact_cache`
+        are not read again unless `force` is True.
+        """
+        await device.async_read_config(force=force)
+        if force or not self.modem.fact_cache.is_fresh(ALDB):
+            await self.modem.aldb.async_load()
+            if self.modem.aldb.is_loaded:
+                self.modem.fact_cache.update(ALDB)
         await device.async_add_default_links()
 
     async def _async_ensure_inspect_devices(self):
@@ -246,10 +257,12 @@ class DeviceManager(SubscriberBase):
             force = True
 
         if remove_all_refs:
+            planner = LinkPlanner()
             for _, device in self.items():
                 if device == self.modem or device.address == address:
                     continue
-                await async_unlink_devices(device, address)
+                planner.remove_link(device, address)
+            await planner.async_execute()
 
         if not force and device_to_delete:
             for rec in device_to_delete.aldb.find(
@@ -294,9 +307,29 @@ class DeviceManager(SubscriberBase):
             self[device.address] = device
         return device
 
+    @property
+    def engine_version_task(self):
+        """Return the task reading the unknown engine versions of saved devices."""
+        return self._engine_version_task
+
+    @property
+    def state_manager(self):
+        """Return the manager saving and restoring the device state."""
+        return self._state_manager
+
+    @property
+    def poll_manager(self):
+        """Return the manager polling devices that do not report their state."""
+        return self._poll_manager
+
     async def async_close(self):
-        """Close the device ID listener."""
+        """Close the device ID listener, stop polling and save the device state."""
         self._id_manager.close()
+        self._poll_manager.stop()
+        if self._engine_version_task and not self._engine_version_task.done():
+            self._engine_version_task.cancel()
+        if self._state_manager:
+            await self._state_manager.async_close()
 
     async def async_load(self, workdir="", id_devices=1, load_modem_aldb=1):
         """Load devices from the `insteon_devices.yaml` file and device overrides.
@@ -318,6 +351,11 @@ class DeviceManager(SubscriberBase):
 
         The Modem ALDB is loaded if `refresh` is True or if the saved file has no devices.
 
+        Unknown engine versions of saved devices are read in the background by
+        `engine_version_task` and the devices are saved when it completes.
+
+        The last known device state is restored from `insteon_state.json` and
+        marked stale until it is refreshed in the background by `state_manager`.
         """
         if workdir:
             async with self._loading_saved_lock:
@@ -325,6 +363,12 @@ class DeviceManager(SubscriberBase):
                 devices = await saved_devices_manager.async_load()
                 for address in devices:
                     self[address] = devices[address]
+            if self._state_manager:
+                self._state_manager.stop()
+            self._state_manager = StateSnapshotManager(self, workdir)
+            await self._state_manager.async_restore()
+            self._state_manager.start()
+            self._start_engine_version_discovery(devices, workdir)
 
         if load_modem_aldb == 0:
             load_modem_aldb = False
@@ -335,11 +379,12 @@ class DeviceManager(SubscriberBase):
 
         if load_modem_aldb:
             await self._modem.aldb.async_load()
+            if self._modem.aldb.is_loaded:
+                self._modem.fact_cache.update(ALDB)
 
-        for mem_addr in self._modem.aldb:
-            rec = self._modem.aldb[mem_addr]
-            if rec.is_in_use and rec.target != Address("000000"):
-                self._id_manager.append(rec.target)
+        for target, _, _ in self._modem.aldb.links().values():
+            if target != Address("000000"):
+                self._id_manager.append(target)
 
         if id_devices:
             id_all = id_devices == 2
@@ -350,6 +395,49 @@ class DeviceManager(SubscriberBase):
         saved_devices_manager = SavedDeviceManager(workdir, self.modem)
         await saved_devices_manager.async_save(self._devices)
 
+    def _start_engine_version_discovery(self, devices, workdir):
+        """Read the unknown engine versions of saved devices in the background."""
+        addresses = [
+            address
+            for address, device in devices.items()
+            if device.engine_version == EngineVersion.UNKNOWN and device.cat != 0x03
+        ]
+        if not addresses:
+            return
+        if self._engine_version_task and not self._engine_version_task.done():
+            self._engine_version_task.cancel()
+        self._engine_version_task = asyncio.create_task(
+            self._async_discover_engine_versions(addresses, workdir)
+        )
+
+    async def _async_discover_engine_versions(self, addresses, workdir):
+        """Read the engine versions and save the devices if any are found.
+
+        Battery devices queue the request until they wake up so they are saved
+        the next time the devices are saved.
+        """
+        semaphore = asyncio.Semaphore(ENGINE_VERSION_CONCURRENCY)
+
+        async def _async_get_engine_version(device):
+            async with semaphore:
+                await device.async_get_engine_version()
+
+        targets = [
+            self._devices[address] for address in addresses if address in self._devices
+        ]
+        await asyncio.gather(
+            *[_async_get_engine_version(device) for device in targets],
+            return_exceptions=True,
+        )
+        found = [
+            device.address
+            for device in targets
+            if device.engine_version != EngineVersion.UNKNOWN
+        ]
+        _LOGGER.debug("Read %d of %d engine versions", len(found), len(targets))
+        if found:
+            await self.async_save(workdir)
+
     async def _async_device_identified(
         self, device_id: DeviceId, link_mode: AllLinkMode
     ):
@@ -357,8 +445,14 @@ class DeviceManager(SubscriberBase):
         if self._loading_saved_lock.locked():
             return
 
-        await self._linked_device.put(device_id.address)
         device = self._devices.get(device_id.address)
+        if isinstance(link_mode, AllLinkMode):
+            # All-Linking changed the Modem and device ALDBs
+            if self._modem:
+                self._modem.fact_cache.invalidate(ALDB)
+            if device:
+                device.fact_cache.invalidate(ALDB)
+        await self._linked_device.put(device_id.address)
         if (
             device
             and device.cat == device_id.cat
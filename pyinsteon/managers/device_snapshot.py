@@ -0,0 +1,126 @@
+"""Binary snapshot of the saved device information.
+
+The snapshot holds the same information as the saved device JSON file. A
+header index gives the location of each device so a device and its ALDB are
+only decoded when they are read. The ALDB of each device is stored as the
+device memory image of each record.
+
+Layout, all values little endian:
+    Header: magic, version, device count
+    Index: one entry per device of address, info offset, info length,
+        ALDB offset and ALDB record count
+    Device info: JSON of the device information without the ALDB
+    ALDB: memory address and the 8 record bytes for each record
+"""
+
+import json
+import mmap
+import struct
+from typing import Dict, Iterator, List, Tuple
+
+from ..address import Address
+from ..aldb.aldb_image import PACKED_RECORD, PackedRecords
+from ..aldb.aldb_record import ALDBRecord, aldb_record_to_bytes
+
+SNAPSHOT_MAGIC = b"PYINSTDB"
+SNAPSHOT_VERSION = 1
+HEADER = struct.Struct("<8sHI")
+INDEX_ENTRY = struct.Struct("<3sIIII")
+RECORD = PACKED_RECORD
+
+
+class SnapshotError(Exception):
+    """Snapshot is not a valid device snapshot."""
+
+
+def create_snapshot(devices: List[Tuple[Dict, Dict[int, ALDBRecord]]]) -> bytes:
+    """Return a snapshot of a list of device information and ALDB records.
+
+    The device information must include the `address` and must not include
+    the ALDB.
+    """
+    index = []
+    sections = []
+    offset = HEADER.size + INDEX_ENTRY.size * len(devices)
+    for info, records in devices:
+        info_bytes = json.dumps(info, separators=(",", ":")).encode()
+        aldb_bytes = b"".join(
+            RECORD.pack(mem_addr, aldb_record_to_bytes(rec))
+            for mem_addr, rec in records.items()
+        )
+        index.append(
+            INDEX_ENTRY.pack(
+                bytes(Address(info["address"])),
+                offset,
+                len(info_bytes),
+                offset + len(info_bytes),
+                len(records),
+            )
+        )
+        sections.append(info_bytes)
+        sections.append(aldb_bytes)
+        offset += len(info_bytes) + len(aldb_bytes)
+
+    header = HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(devices))
+    return b"".join([header, *index, *sections])
+
+
+class DeviceSnapshot:
+    """Read the devices in a snapshot.
+
+    `buffer` is any bytes like object such as an `mmap`. Only the header
+    index is read when the snapshot is opened. The information and ALDB
+    records read are copied, so they remain valid after the snapshot is
+    closed.
+    """
+
+    def __init__(self, buffer):
+        """Init the DeviceSnapshot class."""
+        self._source = buffer
+        self._buffer = memoryview(buffer)
+        try:
+            magic, version, count = HEADER.unpack_from(self._buffer, 0)
+        except struct.error as ex:
+            raise SnapshotError("Snapshot header is incomplete") from ex
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise SnapshotError("Unsupported snapshot format")
+        self._index = {}
+        for entry in INDEX_ENTRY.iter_unpack(
+            self._buffer[HEADER.size : HEADER.size + INDEX_ENTRY.size * count]
+        ):
+            self._index[Address(entry[0])] = entry[1:]
+        if len(self._index) != count:
+            raise SnapshotError("Snapshot index is incomplete")
+
+    def __len__(self):
+        """Return the number of devices."""
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Address]:
+        """Iterate through the device addresses."""
+        return iter(self._index)
+
+    def __contains__(self, address):
+        """Return True if the snapshot has a device."""
+        return Address(address) in self._index
+
+    def device_info(self, address) -> Dict:
+        """Return the information of a device without the ALDB."""
+        info_offset, info_length, _, _ = self._index[Address(address)]
+        return json.loads(bytes(self._buffer[info_offset : info_offset + info_length]))
+
+    def aldb_records(self, address) -> PackedRecords:
+        """Return the ALDB records of a device.
+
+        The packed records are decoded when they are accessed.
+        """
+        _, _, aldb_offset, count = self._index[Address(address)]
+        return PackedRecords(
+            bytes(self._buffer[aldb_offset : aldb_offset + RECORD.size * count])
+        )
+
+    def close(self):
+        """Release the buffer and close the file mapping."""
+        self._buffer.release()
+        if isinstance(self._source, mmap.mmap):
+            self._source.close()
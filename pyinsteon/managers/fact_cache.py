@@ -0,0 +1,59 @@
+"""Track how long facts read from a device remain fresh."""
+
+from time import monotonic
+from typing import Dict
+
+ENGINE_VERSION = "engine_version"
+PRODUCT_ID = "product_id"
+OP_FLAGS = "op_flags"
+EXT_PROPERTIES = "ext_properties"
+ALDB = "aldb"
+
+HOUR = 60 * 60
+# A TTL of None means the fact does not expire
+FACT_TTLS = {
+    ENGINE_VERSION: None,
+    PRODUCT_ID: None,
+    OP_FLAGS: 24 * HOUR,
+    EXT_PROPERTIES: 24 * HOUR,
+    ALDB: 24 * HOUR,
+}
+
+
+class FactCache:
+    """Track how long facts read from a device remain fresh.
+
+    A fact is fresh from the time it is updated until its TTL passes or it
+    is invalidated.
+    """
+
+    def __init__(self, ttls: Dict[str, float] = None):
+        """Init the FactCache class."""
+        self._ttls = {**FACT_TTLS, **(ttls or {})}
+        self._updated: Dict[str, float] = {}
+
+    @property
+    def ttls(self) -> Dict[str, float]:
+        """Return the TTL in seconds of each fact."""
+        return self._ttls
+
+    def is_fresh(self, fact: str) -> bool:
+        """Return if a fact is fresh."""
+        updated = self._updated.get(fact)
+        if updated is None:
+            return False
+        ttl = self._ttls.get(fact)
+        return ttl is None or monotonic() - updated < ttl
+
+    def update(self, *facts: str):
+        """Mark facts as read from the device."""
+        now = monotonic()
+        for fact in facts:
+            self._updated[fact] = now
+
+    def invalidate(self, *facts: str):
+        """Mark facts as needing to be read again or all facts if none are given."""
+        if not facts:
+            self._updated.clear()
+        for fact in facts:
+            self._updated.pop(fact, None)
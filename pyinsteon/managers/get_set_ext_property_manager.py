@@ -5,6 +5,8 @@ from collections import namedtuple
 import logging
 from typing import Dict, Union
 
+import async_timeout
+
 from ..address import Address
 from ..config.extended_property import ExtendedProperty
 from ..constants import PropertyType, ResponseStatus
@@ -17,6 +19,8 @@ from ..utils import multiple_status
 
 _LOGGER = logging.getLogger(__name__)
 TIMEOUT = 2
+MIN_TIMEOUT = 0.5
+RESPONSE_TIMEOUT_FACTOR = 4
 RETRIES = 20
 
 PropertyInfo = namedtuple("PropertyInfo", "name group data_field bit set_cmd")
@@ -40,12 +44,19 @@ class GetSetExtendedPropertyManager(SubscriberBase):
         self._flags: Dict[str, PropertyInfo] = {}
         self._response_queue = asyncio.Queue()
         self._get_cmd_lock = asyncio.Lock()
+        self._response_time = None
+        self._write_results: Dict[str, ResponseStatus] = {}
 
     @property
     def flag_info(self):
         """Return the flag information."""
         return self._flags
 
+    @property
+    def write_results(self) -> Dict[str, ResponseStatus]:
+        """Return the result of the last write for each property written."""
+        return self._write_results
+
     def create(
         self,
         name: str,
@@ -100,53 +111,96 @@ class GetSetExtendedPropertyManager(SubscriberBase):
     async def async_read(self, group=None):
         """Get the properties for a group."""
         async with self._get_cmd_lock:
-            while not self._response_queue.empty():
-                self._response_queue.get_nowait()
             if group is None:
                 results = []
                 for curr_group in self._prop_groups:
                     result = await self._async_read(group=curr_group)
                     results.append(result)
-                    await asyncio.sleep(2)
                 return multiple_status(*results)
             result = await self._async_read(group=group)
         self._call_subscribers()
         return result
 
     async def async_write(self):
-        """Set the properties for a group."""
+        """Set the properties for a group.
+
+        Dirty properties that share a data field are written with one command.
+        """
+        self._write_results = {}
         results = []
-        for name, prop in self._properties.items():
-            if prop.is_dirty:
-                group = self._flags[name].group
-                data_field = self._flags[name].data_field
-                result = await self._write_flag(name, group, data_field)
-                results.append(result)
+        for (group, data_field), names in self._dirty_fields().items():
+            result = await self._write_field(group, data_field)
+            results.append(result)
+            for name in names:
+                self._write_results[name] = result
         self._call_subscribers()
         return multiple_status(*results)
 
+    def _dirty_fields(self):
+        """Return the names of the dirty properties by group and data field."""
+        fields = {}
+        for name, prop in self._properties.items():
+            if prop.is_dirty:
+                flag_info = self._flags[name]
+                fields.setdefault((flag_info.group, flag_info.data_field), []).append(
+                    name
+                )
+        return fields
+
     async def _async_read(self, group):
+        """Read one group.
+
+        The next request is sent as soon as the response for this group is
+        received or the wait for it times out.
+        """
         retry = 0
         result = ResponseStatus.UNSENT
         while retry < RETRIES and result != ResponseStatus.SUCCESS:
+            while not self._response_queue.empty():
+                self._response_queue.get_nowait()
             await self._get_command.async_send(group=group)
-            result = await self._wait_for_get()
+            result = await self._wait_for_get(group)
             retry += 1
         return result
 
-    async def _wait_for_get(self):
-        """Wait for the get response message."""
+    async def _wait_for_get(self, group):
+        """Wait for the get response message of a group.
+
+        Responses for other groups, such as late responses to an earlier
+        request, are ignored.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
         try:
-            return await asyncio.wait_for(self._response_queue.get(), TIMEOUT)
+            async with async_timeout.timeout(self._response_timeout()):
+                while await self._response_queue.get() != group:
+                    pass
         except asyncio.TimeoutError:
             return ResponseStatus.FAILURE
+        self._update_response_time(loop.time() - start)
+        return ResponseStatus.SUCCESS
 
-    async def _write_flag(self, name, group, field):
-        """Write a flag to a device."""
-        flag = self._properties[name]
+    def _response_timeout(self):
+        """Return the time to wait for a response based on the device response time."""
+        if self._response_time is None:
+            return TIMEOUT
+        return min(
+            TIMEOUT, max(MIN_TIMEOUT, RESPONSE_TIMEOUT_FACTOR * self._response_time)
+        )
+
+    def _update_response_time(self, response_time):
+        """Update the average time the device takes to respond."""
+        if self._response_time is None:
+            self._response_time = response_time
+        else:
+            self._response_time = 0.75 * self._response_time + 0.25 * response_time
+
+    async def _write_field(self, group, field):
+        """Write a data field to a device."""
         if isinstance(self._prop_groups[group][field], PropertyInfo):
-            data = flag.new_value
-            set_cmd = self._prop_groups[group][field].set_cmd
+            flag_info = self._prop_groups[group][field]
+            data = self._properties[flag_info.name].new_value
+            set_cmd = flag_info.set_cmd
         else:
             set_cmd, data = self._calc_flag_value(self._prop_groups[group][field])
         if set_cmd is not None:
@@ -168,7 +222,7 @@ class GetSetExtendedPropertyManager(SubscriberBase):
         for field in self._prop_groups[group]:
             value = data.get(f"data{field}")
             self._update_one_field(group=group, field=field, value=value)
-        self._response_queue.put_nowait(ResponseStatus.SUCCESS)
+        self._response_queue.put_nowait(group)
 
     def _update_one_field(self, group, field, value):
         """Update one field including bit based fields."""
@@ -182,7 +236,6 @@ class GetSetExtendedPropertyManager(SubscriberBase):
                 bit_value = bool(value & 1 << flag_info.bit)
                 flag = self._properties[flag_info.name]
                 flag.set_value(value=bit_value)
-        self._response_queue.put_nowait(ResponseStatus.SUCCESS)
 
     def _calc_flag_value(self, field):
         data = 0x00
@@ -190,7 +243,11 @@ class GetSetExtendedPropertyManager(SubscriberBase):
         for bit in field:
             flag_info = field[bit]
             flag = self._properties[flag_info.name]
-            set_value = not flag.new_value if flag.is_reversed else flag.new_value
+            # Bits that are not changing keep their current value
+            if flag.is_dirty:
+                set_value = not flag.new_value if flag.is_reversed else flag.new_value
+            else:
+                set_value = not flag.value if flag.is_reversed else flag.value
             if set_value:
                 data = data | 1 << bit
             set_cmd = flag_info.set_cmd
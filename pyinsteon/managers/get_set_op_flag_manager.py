@@ -33,6 +33,12 @@ class GetSetOperatingFlagsManager:
         self._send_lock = asyncio.Lock()
         self._extended_write = False
         self._extended_read = False
+        self._write_results: Dict[str, ResponseStatus] = {}
+
+    @property
+    def write_results(self) -> Dict[str, ResponseStatus]:
+        """Return the result of the last write for each flag written."""
+        return self._write_results
 
     @property
     def extended_write(self):
@@ -126,18 +132,25 @@ class GetSetOperatingFlagsManager:
         return result
 
     async def async_write(self):
-        """Set the operating flags."""
-        results = []
+        """Set the operating flags.
+
+        The result of each flag written is available from `write_results`.
+        """
+        self._write_results = {}
         for name, flag_info in self._flags.items():
             if self._op_flags[name].is_dirty:
-                result = await self._async_write(flag_info)
-                results.append(result)
-        return multiple_status(*results)
+                self._write_results[name] = await self._async_write(flag_info)
+        return multiple_status(*self._write_results.values())
 
-    async def _async_write(self, flag_info):
+    def _flag_cmd(self, flag_info):
+        """Return the command to set a flag to its new value."""
         flag = self._op_flags[flag_info.name]
         should_set = not flag.new_value if flag.is_reversed else flag.new_value
-        cmd = flag_info.set_cmd if should_set else flag_info.unset_cmd
+        return flag_info.set_cmd if should_set else flag_info.unset_cmd
+
+    async def _async_write(self, flag_info):
+        flag = self._op_flags[flag_info.name]
+        cmd = self._flag_cmd(flag_info)
         if cmd is not None:  # The operating flag is read only
             retries = 0
             result = ResponseStatus.UNSENT
@@ -146,8 +159,12 @@ class GetSetOperatingFlagsManager:
                 result = await self._set_command.async_send(
                     cmd=cmd, extended=self._extended_write
                 )
-                if result == ResponseStatus.DIRECT_NAK_CHECK_SUM:
-                    self._extended_read = True
+                if (
+                    result == ResponseStatus.DIRECT_NAK_CHECK_SUM
+                    and not self._extended_write
+                ):
+                    # Use the extended form for the remaining writes
+                    self._extended_write = True
                     retries = -1
                 elif result in [
                     ResponseStatus.DIRECT_NAK_ALDB,
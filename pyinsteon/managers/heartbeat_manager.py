@@ -1,12 +1,12 @@
 """Heartbeat manager."""
 
-import asyncio
 from datetime import datetime, timedelta
 
 from ..address import Address
 from ..handlers.from_device.off import OffInbound
 from ..handlers.from_device.on_level import OnLevelInbound
 from ..subscriber_base import SubscriberBase
+from .timer_manager import timer_manager
 
 HB_CHECK_BUFFER = 300  # 5 min or 300 seconds
 
@@ -38,6 +38,7 @@ class HeartbeatManager(SubscriberBase):
         self._off_hb = self.OnOffHeartbeat(f"{subscriber_topic}_off")
 
         self._last_heartbeat = datetime.now()
+        self._check_timer = None
         self._schedule_next_check()
 
     @property
@@ -81,11 +82,15 @@ class HeartbeatManager(SubscriberBase):
 
     def _schedule_next_check(self):
         """Schedule the next time we check for the heartbeat."""
-        loop = asyncio.get_event_loop()
         # Last heartbeat time is a baseline to trigger the next call
         last_hb = (datetime.now() - self._last_heartbeat).total_seconds()
         # Calculate seconds from now to check again
         # _max_duration is in minutes so convert to seconds
         max_dur_sec = self._max_duration * 60
         next_call = max(HB_CHECK_BUFFER, max_dur_sec + HB_CHECK_BUFFER - last_hb)
-        loop.call_later(next_call, self._check_heartbeat)
+        if self._check_timer is None:
+            self._check_timer = timer_manager.call_later(
+                next_call, self._check_heartbeat
+            )
+        else:
+            self._check_timer.rearm(next_call)
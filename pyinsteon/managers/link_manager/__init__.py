@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, Union
 
 import async_timeout
 
@@ -228,35 +228,13 @@ async def async_unlink_devices(
 
 
 def get_broken_links(
-    devices: dict[Address, Device], work_dir: str = "."
+    devices: dict[Address, Device] = None, work_dir: str = "."
 ) -> list[tuple[Address, ALDBRecord, LinkStatus]]:
-    """Return a list of broken links."""
-    broken_link_list = []
-    for addr, device in devices.items():
-        for rec in device.aldb.find(in_use=True):
-            status = _test_broken(addr, rec, devices)
-            if status != LinkStatus.FOUND:
-                broken_link_list.append((addr, rec, status))
-    return broken_link_list
-
-
-def _test_broken(address: Address, rec: ALDBRecord, devices: List[Device]):
-    """Test if a corresponding record exists in liked device."""
-    device = devices.get(rec.target)
-    if not device:
-        return LinkStatus.MISSING_TARGET
-
-    if not device.aldb.is_loaded:
-        return LinkStatus.TARGET_DB_NOT_LOADED
-
-    for mem_addr in device.aldb:
-        t_rec = device.aldb[mem_addr]
-        if (
-            t_rec.target == address
-            and t_rec.group == rec.group
-            and t_rec.is_controller != rec.is_controller
-        ):
-            return LinkStatus.FOUND
-    if rec.is_controller:
-        return LinkStatus.MISSING_RESPONDER
-    return LinkStatus.MISSING_CONTROLLER
+    """Return a list of broken links from the live `link_index`.
+
+    The `devices` and `work_dir` arguments are kept for compatibility.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ... import link_index
+
+    return link_index.get_broken_links()
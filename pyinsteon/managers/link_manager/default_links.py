@@ -6,6 +6,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from ...constants import ResponseStatus
+from .link_planner import LinkPlanner
 
 if TYPE_CHECKING:
     from ...device_types.device_base import Device
@@ -26,28 +27,27 @@ async def async_add_default_links(device: Device):
         return ResponseStatus.UNSENT
 
     modem = devices.modem
+    planner = LinkPlanner()
 
     for link_info in device.default_links:
         is_controller = link_info.is_controller
         group = link_info.group
-        device.aldb.add(
-            group=group,
-            target=modem.address,
-            controller=is_controller,
+        planner.add_link(
+            device,
+            modem,
+            group,
+            is_controller,
             data1=int(modem.cat),
             data2=int(modem.subcat),
             data3=modem.firmware,
         )
-        modem.aldb.add(
-            group=group,
-            target=device.address,
-            controller=not is_controller,
+        planner.add_link(
+            modem,
+            device,
+            group,
+            not is_controller,
             data1=int(device.cat),
             data2=int(device.subcat),
             data3=int(device.firmware),
         )
-    _, failed_device = await device.aldb.async_write()
-    _, failed_modem = await modem.aldb.async_write()
-    if failed_modem == 0 and failed_device == 0:
-        return ResponseStatus.SUCCESS
-    return ResponseStatus.FAILURE
+    return await planner.async_execute()
@@ -0,0 +1,297 @@
+"""Track the consistency of links between devices.
+
+Each in use ALDB record is indexed by device, target, group and link mode so
+the matching record in the target device is found without scanning the
+target ALDB. Only the link fields are read, so saved records are not decoded
+to build the index. The link status is updated as records change and subscribers
+are notified when a link breaks or is repaired.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+from ... import pub
+from ...address import Address
+from ...aldb.aldb_record import ALDBRecord
+from ...constants import DeviceAction, LinkStatus
+from ...subscriber_base import SubscriberBase
+from ...topics import ALDB_LINK_CHANGED, ALDB_STATUS_CHANGED, LINK_STATUS_CHANGED
+from ...utils import subscribe_topic, unsubscribe_topic
+
+if TYPE_CHECKING:
+    from ...device_types.device_base import Device
+
+_LOGGER = logging.getLogger(__name__)
+
+LinkKey = Tuple[Address, Address, int, bool]
+# (target, group, is_controller)
+LinkFields = Tuple[Address, int, bool]
+
+
+class LinkIndex(SubscriberBase):
+    """Index of the links between devices.
+
+    Subscribers are called with `address`, `record` and `status` when the
+    status of a link changes. A status of `LinkStatus.FOUND` means a broken
+    link was repaired.
+
+    If `track_changes` is False the index is built from the current records
+    and is not updated.
+
+    The modem is not announced in the device list. It is indexed when a
+    record links to it or when the index is queried.
+    """
+
+    def __init__(self, devices: Dict[Address, Device], track_changes: bool = True):
+        """Init the LinkIndex class."""
+        super().__init__(subscriber_topic=LINK_STATUS_CHANGED)
+        self._devices = devices
+        # Device address -> memory address -> link fields
+        self._records: Dict[Address, Dict[int, LinkFields]] = {}
+        # (device, target, group, is_controller) -> memory addresses
+        self._index: Dict[LinkKey, Set[int]] = {}
+        # (target, is_controller) -> group -> (device, memory address)
+        self._targets: Dict[
+            Tuple[Address, bool], Dict[int, Set[Tuple[Address, int]]]
+        ] = {}
+        self._status: Dict[Tuple[Address, int], LinkStatus] = {}
+        self._track_changes = track_changes
+        self._tracked: Set[Address] = set()
+        for address in list(devices):
+            self._add_device(address)
+        if track_changes:
+            devices.subscribe(self._device_added_or_removed)
+
+    def get_broken_links(self) -> List[Tuple[Address, ALDBRecord, LinkStatus]]:
+        """Return a list of broken links."""
+        self._track_modem()
+        return [
+            (address, self._get_record(address, mem_addr), status)
+            for (address, mem_addr), status in self._status.items()
+            if status != LinkStatus.FOUND
+        ]
+
+    def get_link_status(self, address: Address, mem_addr: int) -> LinkStatus:
+        """Return the status of the link in a device ALDB record."""
+        self._track_modem()
+        return self._status.get((Address(address), mem_addr))
+
+    def get_links_to(
+        self, target: Address, is_controller: bool, group: int = None
+    ) -> List[Tuple[Address, ALDBRecord]]:
+        """Return the records in other devices that link to a target device.
+
+        Records are returned in device and memory address order.
+        """
+        self._track_modem()
+        groups = self._targets.get((Address(target), is_controller), {})
+        if group is None:
+            links = set().union(*groups.values())
+        else:
+            links = groups.get(group, set())
+        return [
+            (address, self._get_record(address, mem_addr))
+            for address, mem_addr in sorted(
+                links, key=lambda link: (link[0].id, -link[1])
+            )
+        ]
+
+    def get_groups(self, target: Address, is_controller: bool) -> List[int]:
+        """Return the groups of the records in other devices that link to a target."""
+        self._track_modem()
+        return sorted(self._targets.get((Address(target), is_controller), {}))
+
+    def has_link(
+        self, address: Address, target: Address, group: int, is_controller: bool
+    ) -> bool:
+        """Return True if a device has an in use link to a target."""
+        self._track_modem()
+        return bool(
+            self._index.get((Address(address), Address(target), group, is_controller))
+        )
+
+    def _get_record(self, address: Address, mem_addr: int) -> ALDBRecord:
+        """Return the record of an indexed link."""
+        return self._devices.get(address).aldb[mem_addr]
+
+    def _track_modem(self):
+        """Index the modem if it has not been indexed."""
+        modem = getattr(self._devices, "modem", None)
+        if modem is not None and modem.address not in self._tracked:
+            self._add_device(modem.address)
+
+    def _device_added_or_removed(self, address, action: DeviceAction):
+        """Track device list changes."""
+        if action == DeviceAction.ADDED:
+            device = self._devices.get(address)
+            if device:
+                self._add_device(device.address)
+        elif action == DeviceAction.REMOVED:
+            try:
+                self._remove_device(Address(address))
+            except ValueError:
+                return
+
+    def _add_device(self, address: Address):
+        """Index the records of a device."""
+        device = self._devices.get(address)
+        if not device or not hasattr(device, "aldb"):
+            return
+        self._tracked.add(address)
+        if self._track_changes:
+            subscribe_topic(self._link_changed, f"{address.id}.{ALDB_LINK_CHANGED}")
+            subscribe_topic(
+                self._aldb_status_changed, f"{address.id}.{ALDB_STATUS_CHANGED}"
+            )
+        self._sync_device(address)
+
+    def _remove_device(self, address: Address):
+        """Remove the records of a device from the index."""
+        self._tracked.discard(address)
+        unsubscribe_topic(self._link_changed, f"{address.id}.{ALDB_LINK_CHANGED}")
+        unsubscribe_topic(
+            self._aldb_status_changed, f"{address.id}.{ALDB_STATUS_CHANGED}"
+        )
+        for mem_addr in list(self._records.get(address, {})):
+            self._remove_record(address, mem_addr)
+        self._records.pop(address, None)
+        self._update_target(address)
+
+    def _sync_device(self, address: Address):
+        """Synchronize the index with the records in a device ALDB."""
+        device = self._devices.get(address)
+        links = {}
+        if device and hasattr(device, "aldb"):
+            links = device.aldb.links()
+        for mem_addr in list(self._records.get(address, {})):
+            if mem_addr not in links:
+                self._remove_record(address, mem_addr)
+        for mem_addr, link in links.items():
+            self._add_record(address, mem_addr, link)
+        self._update_target(address)
+
+    def _link_changed(self, record: ALDBRecord, sender: Address, deleted: bool):
+        """Update the index with a changed record."""
+        address = Address(sender)
+        if deleted or not _is_link(record):
+            self._remove_record(address, record.mem_addr)
+        else:
+            self._add_record(
+                address,
+                record.mem_addr,
+                (record.target, record.group, record.is_controller),
+            )
+
+    def _aldb_status_changed(self, topic=pub.AUTO_TOPIC, **kwargs):
+        """Resynchronize a device when the load status of its ALDB changes."""
+        address = Address(topic.name.split(".")[0])
+        self._sync_device(address)
+
+    def _add_record(self, address: Address, mem_addr: int, link: LinkFields):
+        """Add a record to the index."""
+        curr_link = self._records.get(address, {}).get(mem_addr)
+        if curr_link is not None:
+            if curr_link == link:
+                return
+            self._remove_record(address, mem_addr)
+
+        _, group, _ = link
+        self._records.setdefault(address, {})[mem_addr] = link
+        self._index.setdefault(_link_key(address, link), set()).add(mem_addr)
+        self._targets.setdefault(_target_key(link), {}).setdefault(group, set()).add(
+            (address, mem_addr)
+        )
+        self._update_status(address, mem_addr)
+        self._update_counterparts(address, link)
+
+    def _remove_record(self, address: Address, mem_addr: int):
+        """Remove a record from the index."""
+        link = self._records.get(address, {}).pop(mem_addr, None)
+        if link is None:
+            return
+        _, group, _ = link
+        key = _link_key(address, link)
+        self._index[key].discard(mem_addr)
+        if not self._index[key]:
+            self._index.pop(key)
+        groups = self._targets[_target_key(link)]
+        groups[group].discard((address, mem_addr))
+        if not groups[group]:
+            groups.pop(group)
+        if not groups:
+            self._targets.pop(_target_key(link))
+        self._status.pop((address, mem_addr), None)
+        self._update_counterparts(address, link)
+
+    def _update_counterparts(self, address: Address, link: LinkFields):
+        """Update the status of the records that link back to a record."""
+        target, group, is_controller = link
+        key = (target, address, group, not is_controller)
+        for mem_addr in self._index.get(key, set()):
+            self._update_status(target, mem_addr)
+
+    def _update_target(self, target: Address):
+        """Update the status of all records that link to a target device."""
+        for is_controller in [True, False]:
+            groups = self._targets.get((target, is_controller), {})
+            for address, mem_addr in list(set().union(*groups.values())):
+                self._update_status(address, mem_addr)
+
+    def _update_status(self, address: Address, mem_addr: int):
+        """Update the status of a record and notify subscribers of changes.
+
+        The record is only read from the ALDB when there are subscribers.
+        """
+        status = self._test_link(address, self._records[address][mem_addr])
+        prev_status = self._status.get((address, mem_addr))
+        self._status[(address, mem_addr)] = status
+        if status == prev_status:
+            return
+        if not self._track_changes or (
+            prev_status is None and status == LinkStatus.FOUND
+        ):
+            return
+        if not self._has_subscribers():
+            return
+        self._call_subscribers(
+            address=address.id,
+            record=self._get_record(address, mem_addr),
+            status=status,
+        )
+
+    def _test_link(self, address: Address, link: LinkFields) -> LinkStatus:
+        """Return the status of a link."""
+        target, group, is_controller = link
+        device = self._devices.get(target)
+        if not device or not hasattr(device, "aldb"):
+            return LinkStatus.MISSING_TARGET
+        if target not in self._tracked:
+            # The modem is only found as the target of a link
+            self._add_device(target)
+        if not device.aldb.is_loaded:
+            return LinkStatus.TARGET_DB_NOT_LOADED
+        key = (target, address, group, not is_controller)
+        if self._index.get(key):
+            return LinkStatus.FOUND
+        if is_controller:
+            return LinkStatus.MISSING_RESPONDER
+        return LinkStatus.MISSING_CONTROLLER
+
+
+def _is_link(record: ALDBRecord) -> bool:
+    """Return True if the record is an in use link."""
+    return record.is_in_use and not record.is_high_water_mark
+
+
+def _link_key(address: Address, link: LinkFields) -> LinkKey:
+    """Return the index key of a record."""
+    target, group, is_controller = link
+    return (address, target, group, is_controller)
+
+
+def _target_key(link: LinkFields) -> Tuple[Address, bool]:
+    """Return the target key of a record."""
+    target, _, is_controller = link
+    return (target, is_controller)
@@ -0,0 +1,198 @@
+"""Plan and write link changes across many devices.
+
+Link changes are staged in each device ALDB as pending changes so only the
+records that differ from the current records are written and existing
+records are reused. The plan estimates the messages required, writes the
+devices with bounded concurrency and can be run again to resume after a
+failure.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, List, Union
+
+from ...address import Address
+from ...aldb.modem_aldb import ModemALDB
+from ...constants import ReadWriteMode, ResponseStatus
+from ...utils import multiple_status
+
+if TYPE_CHECKING:
+    from ...device_types.device_base import Device
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_CONCURRENT = 3
+# Estimated messages to write one record
+MESSAGES_PER_RECORD = {
+    ReadWriteMode.STANDARD: 1,
+    ReadWriteMode.EEPROM: 1,
+    ReadWriteMode.PEEK_POKE: 17,
+    ReadWriteMode.UNKNOWN: 1,
+}
+# Estimated seconds to send a message and receive the response
+DEVICE_MESSAGE_TIME = 0.5
+MODEM_MESSAGE_TIME = 0.1
+
+
+class LinkPlanner:
+    """Plan and write link changes across many devices."""
+
+    def __init__(self, devices: List[Device] = None):
+        """Init the LinkPlanner class.
+
+        Pending changes already in the ALDB of `devices` are included in the
+        plan.
+        """
+        self._devices: Dict[Address, Device] = {}
+        self._results: Dict[Address, ResponseStatus] = {}
+        for device in devices or []:
+            self.add_device(device)
+
+    @property
+    def pending(self) -> Dict[Address, int]:
+        """Return the number of pending record changes by device."""
+        return {
+            address: len(device.aldb.pending_changes)
+            for address, device in self._devices.items()
+            if device.aldb.pending_changes
+        }
+
+    @property
+    def message_count(self) -> int:
+        """Return the estimated number of messages to write the plan."""
+        return sum(
+            self._device_messages(self._devices[address]) for address in self.pending
+        )
+
+    @property
+    def duration(self) -> float:
+        """Return the estimated time in seconds to write the plan."""
+        duration = 0
+        for address in self.pending:
+            device = self._devices[address]
+            message_time = (
+                MODEM_MESSAGE_TIME
+                if isinstance(device.aldb, ModemALDB)
+                else DEVICE_MESSAGE_TIME
+            )
+            duration += self._device_messages(device) * message_time
+        return duration
+
+    @property
+    def results(self) -> Dict[Address, ResponseStatus]:
+        """Return the write result by device."""
+        return dict(self._results)
+
+    @property
+    def is_complete(self) -> bool:
+        """Return True if all planned changes are written."""
+        return not self.pending
+
+    def add_device(self, device: Device):
+        """Add a device and its pending changes to the plan."""
+        self._devices[device.address] = device
+        self._results.pop(device.address, None)
+
+    def add_link(
+        self,
+        device: Device,
+        target: Union[Device, Address],
+        group: int,
+        is_controller: bool,
+        data1: int = 0x00,
+        data2: int = 0x00,
+        data3: int = 0x00,
+    ):
+        """Add a link to a device.
+
+        If the link exists it is modified in place. If it exists with the same
+        data nothing is written.
+        """
+        self.add_device(device)
+        device.aldb.add(
+            group=group,
+            target=_address(target),
+            controller=is_controller,
+            data1=data1,
+            data2=data2,
+            data3=data3,
+        )
+
+    def remove_link(
+        self,
+        device: Device,
+        target: Union[Device, Address],
+        group: int = None,
+        is_controller: bool = None,
+    ):
+        """Remove the links in a device to a target.
+
+        If `group` or `is_controller` is None, links with any value are removed.
+        """
+        self.add_device(device)
+        for rec in device.aldb.find(
+            target=_address(target),
+            group=group,
+            is_controller=is_controller,
+            in_use=True,
+        ):
+            device.aldb.remove(rec.mem_addr)
+
+    def link_devices(
+        self,
+        controller: Device,
+        responder: Device,
+        group: int,
+        data1: int = 0x00,
+        data2: int = 0x00,
+        data3: int = 0x00,
+    ):
+        """Add the controller and responder links between two devices."""
+        self.add_link(responder, controller, group, False, data1, data2, data3)
+        self.add_link(controller, responder, group, True, data1, data2, data3)
+
+    async def async_execute(self, max_concurrent: int = MAX_CONCURRENT):
+        """Write the pending changes.
+
+        Up to `max_concurrent` devices are written at one time. Records that
+        fail remain pending so the plan can be executed again to resume.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        addresses = list(self.pending)
+        _LOGGER.debug(
+            "Writing %d devices, estimated %d messages",
+            len(addresses),
+            self.message_count,
+        )
+        await asyncio.gather(
+            *[self._async_write_device(address, semaphore) for address in addresses]
+        )
+        if not self._results:
+            return ResponseStatus.SUCCESS
+        return multiple_status(*self._results.values())
+
+    async def _async_write_device(self, address: Address, semaphore: asyncio.Semaphore):
+        """Write the pending changes of a device."""
+        device = self._devices[address]
+        async with semaphore:
+            try:
+                _, failed = await device.aldb.async_write()
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.error("Error writing the ALDB of %s: %s", str(address), ex)
+                failed = len(device.aldb.pending_changes)
+        self._results[address] = (
+            ResponseStatus.FAILURE if failed else ResponseStatus.SUCCESS
+        )
+
+    @staticmethod
+    def _device_messages(device: Device) -> int:
+        """Return the estimated number of messages to write a device."""
+        per_record = MESSAGES_PER_RECORD.get(device.aldb.read_write_mode, 1)
+        return len(device.aldb.pending_changes) * per_record
+
+
+def _address(target: Union[Device, Address]) -> Address:
+    """Return the address of a device or an address."""
+    return Address(getattr(target, "address", target))
@@ -1,12 +1,11 @@
 """Low battery manager."""
 
-import asyncio
-
 from ..address import Address
 from ..handlers.from_device.off import OffInbound
 from ..handlers.from_device.on_level import OnLevelInbound
 from ..subscriber_base import SubscriberBase
 from ..utils import subscribe_topic
+from .timer_manager import timer_manager
 
 WAIT_TIME = 5
 
@@ -34,6 +33,7 @@ class LowBatteryManager(SubscriberBase):
         self._off_low_battery.subscribe(self._low_battery)
         self._low_battery_recd = False
         self._low_battery_state = False
+        self._check_timer = None
         self._low_battery_event = self.LowBatterySubscriber(f"{subscriber_topic}.true")
         self._low_battery_clear_event = self.LowBatterySubscriber(
             f"{subscriber_topic}.false"
@@ -50,13 +50,17 @@ class LowBatteryManager(SubscriberBase):
 
     def _all_device_messages(self, **kwargs):
         """Capture all messages for this device."""
-        loop = asyncio.get_event_loop()
         target = kwargs.get("target")
         # stop if this is a low battery message
         if target and Address(target).low == self._group:
             return
         self._low_battery_recd = False
-        loop.call_later(WAIT_TIME, self._check_low_battery)
+        if self._check_timer is None:
+            self._check_timer = timer_manager.call_later(
+                WAIT_TIME, self._check_low_battery
+            )
+        else:
+            self._check_timer.rearm(WAIT_TIME)
 
     def _low_battery(self, on_level):
         """Low battery message received."""
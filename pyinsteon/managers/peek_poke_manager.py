@@ -1,16 +1,24 @@
-"""Peek and poke command manager."""
+"""Peek and poke command manager.
+
+Each manager keeps an image of the device memory bytes it has peeked or poked.
+Pokes of a byte that already holds the value in the image are skipped. The
+image is invalidated for a record when the ALDB reports a change to that
+record that does not match the image.
+"""
 
 import asyncio
 from datetime import datetime, timedelta
 import logging
+from typing import Dict
 
 from ..address import Address
+from ..aldb.aldb_record import RECORD_LENGTH, aldb_record_to_bytes
 from ..constants import ResponseStatus
 from ..handlers.to_device.peek import PeekCommand
 from ..handlers.to_device.poke import PokeCommand
 from ..handlers.to_device.set_msb import SetMsbCommand
 from ..subscriber_base import SubscriberBase
-from ..topics import PEEK, POKE
+from ..topics import ALDB_LINK_CHANGED, PEEK, POKE
 from ..utils import publish_topic, subscribe_topic
 
 _instances = {}
@@ -46,31 +54,65 @@ class PeekPokeManager(SubscriberBase):
         self._poke_topic = f"{self._address.id}.manager.{POKE}"
         self._last_msb = None
         self._time_last_msb = datetime.min
+        self._memory: Dict[int, int] = {}
+        subscribe_topic(
+            self._aldb_link_changed, f"{self._address.id}.{ALDB_LINK_CHANGED}"
+        )
+
+    @property
+    def memory(self) -> Dict[int, int]:
+        """Return the known device memory values by memory address."""
+        return dict(self._memory)
+
+    def invalidate(self, mem_addr: int = None, length: int = 1):
+        """Remove memory addresses from the memory image.
+
+        If `mem_addr` is None the full image is removed. Otherwise `length`
+        bytes are removed starting at `mem_addr` and going down.
+        """
+        if mem_addr is None:
+            self._memory = {}
+            return
+        for curr_addr in range(mem_addr, mem_addr - length, -1):
+            self._memory.pop(curr_addr, None)
 
     async def async_peek(self, mem_addr: int, extended: bool = False):
         """Peek a value at a memory address."""
         result = await self._async_peek(mem_addr=mem_addr)
         if result == ResponseStatus.SUCCESS:
             value = await self._peek_value_queue.get()
+            self._memory[mem_addr] = value
             publish_topic(topic=self._peek_topic, mem_addr=mem_addr, value=value)
             await asyncio.sleep(0.05)
         return result
 
     async def async_poke(self, mem_addr: int, value: int):
-        """Poke a value at a memory address."""
+        """Poke a value at a memory address.
+
+        If the memory image shows the address already holds the value, no
+        command is sent. Otherwise the address is peeked to set the poke
+        address in the device.
+        """
         if 0 > value > 255:
             raise ValueError("Poke value can only be one byte.")
+        if self._memory.get(mem_addr) == value:
+            publish_topic(topic=self._poke_topic, mem_addr=mem_addr, value=value)
+            return ResponseStatus.SUCCESS
         result = await self._async_peek(mem_addr)
         if result == ResponseStatus.SUCCESS:
             orig_value = await self._peek_value_queue.get()
+            self._memory[mem_addr] = orig_value
             if orig_value == value:
                 publish_topic(topic=self._poke_topic, mem_addr=mem_addr, value=value)
                 await asyncio.sleep(0.05)
                 return ResponseStatus.SUCCESS
             result = await self._poke_cmd.async_send(value=value)
             if result == ResponseStatus.SUCCESS:
+                self._memory[mem_addr] = value
                 publish_topic(topic=self._poke_topic, mem_addr=mem_addr, value=value)
                 await asyncio.sleep(0.05)
+            else:
+                self._memory.pop(mem_addr, None)
         return result
 
     def subscribe_peek(self, listener: callable, force_strong_ref: bool = False):
@@ -117,6 +159,19 @@ class PeekPokeManager(SubscriberBase):
         await self._peek_value_queue.put(value)
         await asyncio.sleep(0.05)
 
+    def _aldb_link_changed(self, record, sender, deleted):
+        """Invalidate the memory image of a record that changed."""
+        if record.mem_addr is None or record.mem_addr <= 0:
+            return
+        first_addr = record.mem_addr - RECORD_LENGTH + 1
+        rec_bytes = aldb_record_to_bytes(record)
+        if all(
+            self._memory.get(first_addr + offset) == rec_bytes[offset]
+            for offset in range(RECORD_LENGTH)
+        ):
+            return
+        self.invalidate(record.mem_addr, RECORD_LENGTH)
+
     async def _receive_poke_value(self, value):
         """Place the last poke value in the queue."""
         _LOGGER.debug("Received poke value: %d (0x%02x)", value, value)
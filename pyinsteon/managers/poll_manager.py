@@ -0,0 +1,204 @@
+"""Poll devices that do not report their state.
+
+Devices such as thermostats, IOLincs and outlets only report some of their
+state in response to a status request. A poll target declares how fresh the
+state of a device, or one group of a device, must be. The poll manager
+requests the status of the stalest target first, highest priority first,
+within a global poll rate. Any value received from the device, including
+broadcast and direct ACK messages, counts as fresh.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+from typing import Dict, Tuple, Union
+
+from ..address import Address
+from ..constants import ResponseStatus
+
+POLL_RATE = 6
+MIN_POLL_RATE = 0.1
+IDLE_WAIT = 0.5
+BACKOFF_BASE = 60
+BACKOFF_MAX = 60 * 60
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollTarget:
+    """A device or group polled by the poll manager."""
+
+    def __init__(self, address: Address, group: int, max_age: float, priority=0):
+        """Init the PollTarget class."""
+        self.address = address
+        self.group = group
+        self.max_age = max_age
+        self.priority = priority
+        self.last_poll: datetime = None
+        self.failures = 0
+        self.next_attempt: datetime = None
+
+
+class PollManager:
+    """Poll devices that do not report their state.
+
+    At most `rate` status requests are sent per minute. The rate is at least
+    `MIN_POLL_RATE`. Polling waits while other messages are queued to the
+    modem so interactive commands are sent first. A target that does not respond is retried with an exponential
+    backoff from `BACKOFF_BASE` to `BACKOFF_MAX` seconds.
+    """
+
+    def __init__(self, devices, rate: float = POLL_RATE):
+        """Init the PollManager class."""
+        self._devices = devices
+        self._rate = max(MIN_POLL_RATE, float(rate))
+        self._targets: Dict[Tuple[Address, Union[int, None]], PollTarget] = {}
+        self._poll_task = None
+        self._target_added = asyncio.Event()
+
+    @property
+    def targets(self) -> Dict[Tuple[Address, Union[int, None]], PollTarget]:
+        """Return the poll targets by address and group."""
+        return self._targets
+
+    @property
+    def rate(self) -> float:
+        """Return the maximum number of status requests per minute."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: float):
+        """Set the maximum number of status requests per minute."""
+        self._rate = max(MIN_POLL_RATE, float(value))
+
+    def add(self, address, max_age: float, group: int = None, priority: int = 0):
+        """Poll a device or device group at least every `max_age` seconds.
+
+        Higher priority targets are polled first when several targets are
+        stale.
+        """
+        address = Address(address)
+        self._targets[(address, group)] = PollTarget(
+            address=address, group=group, max_age=max_age, priority=priority
+        )
+        self._target_added.set()
+        self.start()
+
+    def remove(self, address, group: int = None):
+        """Stop polling a device or device group."""
+        self._targets.pop((Address(address), group), None)
+
+    def start(self):
+        """Start polling."""
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._async_poll())
+
+    def stop(self):
+        """Stop polling."""
+        if self._poll_task and not self._poll_task.done():
+            self._poll_task.cancel()
+
+    def staleness(self, target: PollTarget) -> float:
+        """Return the age of a target state as a fraction of its `max_age`."""
+        last_update = self._last_update(target)
+        if last_update is None:
+            return float("inf")
+        age = (datetime.now() - last_update).total_seconds()
+        return age / target.max_age if target.max_age else float("inf")
+
+    def next_target(self) -> Union[PollTarget, None]:
+        """Return the stale target to poll next or None."""
+        now = datetime.now()
+        stale = []
+        for target in list(self._targets.values()):
+            if self._devices[target.address] is None:
+                continue
+            if target.next_attempt is not None and now < target.next_attempt:
+                continue
+            staleness = self.staleness(target)
+            if staleness >= 1:
+                stale.append((target.priority, staleness, target))
+        if not stale:
+            return None
+        return max(stale, key=lambda item: item[:2])[2]
+
+    async def async_poll(self, target: PollTarget) -> ResponseStatus:
+        """Request the status of a target and schedule any retry."""
+        device = self._devices[target.address]
+        if device is None:
+            return ResponseStatus.FAILURE
+        result = await device.async_status(group=target.group, max_age=target.max_age)
+        now = datetime.now()
+        if result in [ResponseStatus.SUCCESS, ResponseStatus.RUN_ON_WAKE]:
+            target.last_poll = now
+            target.failures = 0
+            target.next_attempt = None
+        else:
+            target.failures += 1
+            backoff = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (target.failures - 1))
+            target.next_attempt = now + timedelta(seconds=backoff)
+            _LOGGER.debug(
+                "Status of %s failed, next attempt in %d seconds",
+                str(target.address),
+                backoff,
+            )
+        return result
+
+    def _last_update(self, target: PollTarget) -> Union[datetime, None]:
+        """Return the time the target state was last received."""
+        device = self._devices[target.address]
+        if target.group is not None:
+            groups = [device.groups.get(target.group)]
+        else:
+            groups = list(device.groups.values())
+        last_group_update = None
+        if groups and all(
+            group is not None and not group.is_stale and group.last_update
+            for group in groups
+        ):
+            last_group_update = min(group.last_update for group in groups)
+        updates = [update for update in [target.last_poll, last_group_update] if update]
+        return max(updates, default=None)
+
+    def _queue_busy(self) -> bool:
+        """Return if messages are waiting to be sent to the modem."""
+        modem = self._devices.modem
+        protocol = modem.protocol if modem else None
+        return protocol is not None and not protocol.message_queue.empty()
+
+    async def _async_poll(self):
+        """Poll the stale targets within the poll rate."""
+        while True:
+            if self._queue_busy():
+                await asyncio.sleep(IDLE_WAIT)
+                continue
+            target = self.next_target()
+            if target is None:
+                self._target_added.clear()
+                try:
+                    await asyncio.wait_for(self._target_added.wait(), self._wait())
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self.async_poll(target)
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.error("Error polling %s: %s", str(target.address), str(ex))
+            await asyncio.sleep(60 / self._rate)
+
+    def _wait(self) -> float:
+        """Return the seconds until the next target becomes stale."""
+        now = datetime.now()
+        waits = []
+        for target in self._targets.values():
+            if self._devices[target.address] is None:
+                continue
+            if target.next_attempt is not None and now < target.next_attempt:
+                waits.append((target.next_attempt - now).total_seconds())
+                continue
+            last_update = self._last_update(target)
+            if last_update is None:
+                waits.append(0)
+            else:
+                age = (now - last_update).total_seconds()
+                waits.append(target.max_age - age)
+        return max(min(waits, default=BACKOFF_MAX), IDLE_WAIT)
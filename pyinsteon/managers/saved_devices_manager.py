@@ -2,20 +2,24 @@
 
 import json
 import logging
-from os import path
-from typing import Dict
+import mmap
+from os import path, replace
+from typing import Dict, List
 
 import aiofiles
+import aiofiles.tempfile
 
 from ..address import Address
 from ..aldb.aldb_record import ALDBRecord
-from ..constants import EngineVersion
 from ..device_types.device_base import Device
 from ..x10_address import X10Address
 from .device_id_manager import DeviceId
+from .device_snapshot import DeviceSnapshot, SnapshotError, create_snapshot
+from .fact_cache import ALDB, EXT_PROPERTIES, OP_FLAGS
 from .utils import create_device
 
 DEVICE_INFO_FILE = "insteon_devices.json"
+SNAPSHOT_FILE = "insteon_devices.bin"
 OLD_DEVICE_INFO_FILE = "insteon_plm_device_info.dat"
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,7 +41,7 @@ def aldb_rec_to_dict(rec):
     }
 
 
-def _dict_to_device(device_dict):
+def _dict_to_device(device_dict, aldb_records=None):
     address = Address(device_dict.get("address"))
     aldb_status = device_dict.get("aldb_status", 0)
     aldb = device_dict.get("aldb", {})
@@ -56,7 +60,8 @@ def _dict_to_device(device_dict):
     device = create_device(device_id)
     if device:
         device.engine_version = engine_version
-        aldb_records = dict_to_aldb_record(aldb)
+        if aldb_records is None:
+            aldb_records = dict_to_aldb_record(aldb)
         device.aldb.load_saved_records(aldb_status, aldb_records, first_mem_addr)
         device.aldb.read_write_mode = read_write_mode
         for flag in operating_flags:
@@ -67,9 +72,20 @@ def _dict_to_device(device_dict):
             value = properties[flag]
             if device.properties.get(flag):
                 device.properties[flag].set_value(value)
+        _update_saved_facts(device, operating_flags, properties)
     return device
 
 
+def _update_saved_facts(device, operating_flags=None, properties=None):
+    """Mark the facts loaded from the saved device information as fresh."""
+    if device.aldb.is_loaded:
+        device.fact_cache.update(ALDB)
+    if operating_flags:
+        device.fact_cache.update(OP_FLAGS)
+    if properties:
+        device.fact_cache.update(EXT_PROPERTIES)
+
+
 def _device_to_dict(device_list):
     """Convert a device to a dictionary."""
     device_dict = []
@@ -110,6 +126,50 @@ def _device_to_dict(device_list):
     return device_dict
 
 
+def _device_info(device_dict):
+    """Return the device information without the ALDB."""
+    return {key: value for key, value in device_dict.items() if key != "aldb"}
+
+
+def _devices_to_snapshot(device_list, device_dicts) -> bytes:
+    """Return a snapshot of the devices."""
+    return create_snapshot(
+        [
+            (
+                _device_info(device_dict),
+                dict(device_list.get(Address(device_dict["address"])).aldb.items()),
+            )
+            for device_dict in device_dicts
+        ]
+    )
+
+
+def json_to_snapshot(device_dicts: List[Dict]) -> bytes:
+    """Return a snapshot of the saved device JSON data."""
+    return create_snapshot(
+        [
+            (
+                _device_info(device_dict),
+                dict_to_aldb_record(device_dict.get("aldb", {})),
+            )
+            for device_dict in device_dicts
+        ]
+    )
+
+
+def snapshot_to_json(snapshot: DeviceSnapshot) -> List[Dict]:
+    """Return the saved device JSON data of a snapshot."""
+    device_dicts = []
+    for address in snapshot:
+        device_dict = snapshot.device_info(address)
+        device_dict["aldb"] = {
+            mem_addr: aldb_rec_to_dict(rec)
+            for mem_addr, rec in snapshot.aldb_records(address).items()
+        }
+        device_dicts.append(device_dict)
+    return device_dicts
+
+
 def dict_to_aldb_record(aldb_dict):
     """Convert a dictionary to an ALDB record."""
     records = {}
@@ -227,25 +287,45 @@ class SavedDeviceManager:
         self._modem = modem
 
     async def async_save(self, device_list: dict):
-        """Save all devices to the `insteon_devices.json` file for faster loading."""
+        """Save all devices to the `insteon_devices.json` file for faster loading.
+
+        A snapshot of the devices is also saved to `insteon_devices.bin`.
+        """
         device_dict = _device_to_dict(device_list)
         await self._write_saved_devices(device_dict)
+        await self._write_snapshot(_devices_to_snapshot(device_list, device_dict))
 
     async def async_load(self) -> Dict[Address, Device]:
-        """Load devices from the saved device file."""
-        saved_devices = await self._read_saved_devices()
+        """Load devices from the saved device file.
+
+        The snapshot file is used unless the JSON file is newer.
+        """
+        snapshot = self._open_snapshot()
+        if snapshot is None:
+            saved_devices = (
+                (saved_device, dict_to_aldb_record(saved_device.get("aldb", {})))
+                for saved_device in await self._read_saved_devices()
+            )
+        else:
+            saved_devices = (
+                (snapshot.device_info(address), snapshot.aldb_records(address))
+                for address in snapshot
+            )
+        try:
+            return self._load_devices(saved_devices)
+        finally:
+            if snapshot is not None:
+                snapshot.close()
+
+    def _load_devices(self, saved_devices) -> Dict[Address, Device]:
+        """Create the devices from the saved device information."""
         device_list = {}
-        for saved_device in saved_devices:
+        for saved_device, aldb_records in saved_devices:
             address = Address(saved_device.get("address"))
             if address != self._modem.address:
-                device = _dict_to_device(saved_device)
+                device = _dict_to_device(saved_device, aldb_records)
                 if device:
                     device_list[address] = device
-                    if (
-                        device.engine_version == EngineVersion.UNKNOWN
-                        and device.cat != 0x03
-                    ):
-                        await device.async_get_engine_version()
                     _LOGGER.debug(
                         "Device with id %s added to device list "
                         "from saved device data.",
@@ -253,14 +333,13 @@ class SavedDeviceManager:
                     )
             else:
                 aldb_status = saved_device.get("aldb_status", 0)
-                aldb = saved_device.get("aldb", {})
                 read_write_mode = saved_device.get("read_write_mode", 0)
                 first_mem_ddr = saved_device.get("first_mem_addr")
-                aldb_records = dict_to_aldb_record(aldb)
                 self._modem.aldb.load_saved_records(
                     aldb_status, aldb_records, first_mem_ddr
                 )
                 self._modem.aldb.read_write_mode = read_write_mode
+                _update_saved_facts(self._modem)
         return device_list
 
     async def _read_saved_devices(self):
@@ -298,6 +377,48 @@ class SavedDeviceManager:
             _LOGGER.error("Cannot write to file %s", device_file)
             _LOGGER.error("Exception: %s", str(ex))
 
+    def _open_snapshot(self):
+        """Open the snapshot file if it is not older than the JSON file."""
+        if not self._workdir:
+            return None
+        snapshot_file = path.join(self._workdir, SNAPSHOT_FILE)
+        device_file = path.join(self._workdir, DEVICE_INFO_FILE)
+        try:
+            if path.exists(device_file) and path.getmtime(device_file) > path.getmtime(
+                snapshot_file
+            ):
+                _LOGGER.debug("Saved device file is newer than the snapshot")
+                return None
+            with open(snapshot_file, "rb") as snapshot_fp:
+                buffer = mmap.mmap(snapshot_fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            _LOGGER.debug("Saved device snapshot not found")
+            return None
+        try:
+            return DeviceSnapshot(buffer)
+        except SnapshotError as ex:
+            _LOGGER.debug("Loading saved device snapshot failed: %s", str(ex))
+            buffer.close()
+            return None
+
+    async def _write_snapshot(self, snapshot: bytes):
+        """Write the device snapshot file.
+
+        The snapshot is written to a temporary file that replaces the snapshot
+        file, so an open snapshot is never changed.
+        """
+        snapshot_file = path.join(self._workdir, SNAPSHOT_FILE)
+        try:
+            async with aiofiles.tempfile.NamedTemporaryFile(
+                "wb", dir=self._workdir, prefix=f"{SNAPSHOT_FILE}.", delete=False
+            ) as afp:
+                await afp.write(snapshot)
+                await afp.flush()
+            replace(afp.name, snapshot_file)
+        except FileNotFoundError as ex:
+            _LOGGER.error("Cannot write to file %s", snapshot_file)
+            _LOGGER.error("Exception: %s", str(ex))
+
     async def _read_old_device_file(self):
         """Load device information from the insteonplm device info file."""
         _LOGGER.debug("Loading insteonplm saved device info.")
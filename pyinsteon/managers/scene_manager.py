@@ -9,13 +9,13 @@ from typing import Dict, Union
 import aiofiles
 import voluptuous as vol
 
-from .. import devices
+from .. import devices, link_index
 from ..address import Address
 from ..constants import ResponseStatus
 from ..handlers.send_all_link_off import SendAllLinkOffCommandHandler
 from ..handlers.send_all_link_on import SendAllLinkOnCommandHandler
-from ..utils import multiple_status
 from .device_link_manager import LinkInfo
+from .link_manager.link_planner import LinkPlanner
 
 SCENE_FILE = "insteon_scenes.json"
 _LOGGER = logging.getLogger(__name__)
@@ -71,68 +71,48 @@ async def async_get_scenes(work_dir=None):
     scenes: Dict[Group, Dict[str, Union[Dict[ResponderAddress, LinkInfo], str]]] = {}
     if work_dir:
         await async_load_scene_names(work_dir=work_dir)
-    for addr in devices:
-        device = devices[addr]
-        if device == devices.modem:
-            continue
-        for rec in device.aldb.find(
-            target=devices.modem.address, is_controller=False, in_use=True
-        ):
-            if rec.group == 0:
-                continue
-            if not scenes.get(rec.group):
-                scenes[rec.group] = {}
-                scenes[rec.group]["name"] = _scene_names.get(
-                    rec.group, f"Insteon Scene {rec.group}"
-                )
-                scenes[rec.group]["group"] = rec.group
-                scenes[rec.group]["devices"] = {}
-            scene = scenes.get(rec.group)
-            if not scene["devices"].get(device.address):
-                scene["devices"][device.address] = []
-            has_controller = False
-            for _ in devices.modem.aldb.find(
-                target=device.address, group=rec.group, is_controller=True, in_use=True
-            ):
-                has_controller = True
-                break
-            scene["devices"][device.address].append(
-                LinkInfo(rec.data1, rec.data2, rec.data3, has_controller, True)
-            )
+    for group in _get_scene_groups():
+        scenes[group] = _get_scene(group)
     return scenes
 
 
 async def async_get_scene(scene_num: int, work_dir: str = None):
     """Return a scenes."""
-    scene: Dict[str, Union[Dict[ResponderAddress, LinkInfo], str]] = {}
     if work_dir:
         await async_load_scene_names(work_dir=work_dir)
+    return _get_scene(scene_num)
+
+
+def _get_scene_groups():
+    """Return the scene numbers from the link index."""
+    return [
+        group
+        for group in link_index.get_groups(devices.modem.address, is_controller=False)
+        if group != 0
+    ]
+
+
+def _get_scene(scene_num: int):
+    """Return a scene from the link index."""
+    scene: Dict[str, Union[Dict[ResponderAddress, LinkInfo], str]] = {}
     scene["name"] = _scene_names.get(scene_num, f"Insteon Scene {scene_num}")
     scene["group"] = scene_num
     scene["devices"] = {}
-    for addr in devices:
-        device = devices[addr]
-        if device == devices.modem:
+    if scene_num == 0:
+        return scene
+    modem_address = devices.modem.address
+    for address, rec in link_index.get_links_to(
+        modem_address, is_controller=False, group=scene_num
+    ):
+        device = devices[address]
+        if not device or device == devices.modem:
             continue
-        for rec in device.aldb.find(
-            target=devices.modem.address,
-            is_controller=False,
-            in_use=True,
-            group=scene_num,
-        ):
-            if rec.group == 0:
-                continue
-            if not scene["devices"].get(device.address):
-                scene["devices"][device.address] = []
-            has_controller = False
-            for _ in devices.modem.aldb.find(
-                target=device.address, group=rec.group, is_controller=True, in_use=True
-            ):
-                has_controller = True
-                break
-            scene["devices"][device.address].append(
-                LinkInfo(rec.data1, rec.data2, rec.data3, has_controller, True)
-            )
+        has_controller = link_index.has_link(
+            modem_address, device.address, scene_num, is_controller=True
+        )
+        scene["devices"].setdefault(device.address, []).append(
+            LinkInfo(rec.data1, rec.data2, rec.data3, has_controller, True)
+        )
     return scene
 
 
@@ -324,21 +304,14 @@ def _remove_scene_links(scene_num: int, scene_data):
 
 async def _async_write_scene_link_changes(device_list):
     """Write the ALDB for the devices changed."""
-    results = []
-    for device in device_list:
-        _, failed = await device.aldb.async_write()
-        result = ResponseStatus.FAILURE if failed else ResponseStatus.SUCCESS
-        results.append(result)
-    _, failed = await devices.modem.aldb.async_write()
-    result = ResponseStatus.FAILURE if failed else ResponseStatus.SUCCESS
-    results.append(result)
-    return multiple_status(*results)
+    planner = LinkPlanner([*device_list, devices.modem])
+    return await planner.async_execute()
 
 
 async def _find_next_scene():
     """Return the next available scene number."""
     next_scene = 20
-    scenes = await async_get_scenes()
+    scenes = _get_scene_groups()
     while next_scene in scenes:
         next_scene += 1
     return next_scene
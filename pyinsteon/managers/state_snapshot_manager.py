@@ -0,0 +1,345 @@
+"""Save and restore the last known state of devices.
+
+The state snapshot holds the group values, last communication time, engine
+version, product ID and operating flag values of each device with the time
+each value was received. Restored group values are marked stale until they
+are received from the device again. Stale values are requested from the
+device once they are older than `STATUS_MAX_AGE`, at startup or later as they
+age.
+"""
+
+import asyncio
+from datetime import datetime
+import json
+import logging
+from os import path
+
+import aiofiles
+
+from ..constants import EngineVersion, ResponseStatus
+from ..x10_address import X10Address
+from .timer_manager import timer_manager
+
+STATE_FILE = "insteon_state.json"
+STATE_VERSION = 1
+SAVE_INTERVAL = 15 * 60
+VERIFY_CONCURRENCY = 2
+VERIFY_DELAY = 0.5
+OP_FLAG_MAX_AGE = 24 * 60 * 60
+STATUS_MAX_AGE = 60 * 60
+VERIFY_RETRY = 15 * 60
+VERIFY_MARGIN = 1
+_NEVER = datetime(1, 1, 1, 1, 1, 1)
+_LOGGER = logging.getLogger(__name__)
+
+
+def _timestamp(value: datetime):
+    """Return the timestamp of a time or None."""
+    if value is None or value == _NEVER:
+        return None
+    return value.timestamp()
+
+
+def _datetime(value):
+    """Return the time of a timestamp or None."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value)
+
+
+class StateSnapshotManager:
+    """Save and restore the last known state of devices.
+
+    The state is saved every `save_interval` seconds and when the manager is
+    closed. After the state is restored the verifier requests the status of
+    the devices with stale values older than `STATUS_MAX_AGE`, oldest first,
+    and reads operating flags older than `OP_FLAG_MAX_AGE`. The verifier runs
+    again when the next value reaches its max age, or after `VERIFY_RETRY`
+    seconds if a refresh failed. While started, the time a group value
+    changes is recorded as the last communication with the device.
+    """
+
+    def __init__(self, devices, workdir):
+        """Init the StateSnapshotManager class."""
+        self._devices = devices
+        self._workdir = workdir
+        # (address, fact) or (address, flag name) to (value, timestamp)
+        self._facts = {}
+        self._save_task = None
+        self._verify_task = None
+        self._verify_timer = None
+        self._groups = []
+
+    @property
+    def verify_task(self):
+        """Return the task refreshing the stale device state."""
+        return self._verify_task
+
+    def start(self, save_interval=SAVE_INTERVAL):
+        """Start saving the state periodically and verifying the stale state."""
+        self.stop()
+        self._groups = [
+            group
+            for device in self._stateful_devices()
+            for group in device.groups.values()
+        ]
+        for group in self._groups:
+            group.subscribe(self._state_changed)
+        self._save_task = asyncio.create_task(
+            self._async_save_periodically(save_interval)
+        )
+        self._start_verify()
+
+    def stop(self):
+        """Stop saving the state and verifying the stale state."""
+        for task in [self._save_task, self._verify_task]:
+            if task and not task.done():
+                task.cancel()
+        if self._verify_timer:
+            self._verify_timer.cancel()
+        for group in self._groups:
+            group.unsubscribe(self._state_changed)
+        self._groups = []
+
+    async def async_close(self):
+        """Stop the background tasks and save the state."""
+        self.stop()
+        await self.async_save()
+
+    async def async_save(self):
+        """Save the state of the devices to the `insteon_state.json` file."""
+        state = {"version": STATE_VERSION, "devices": self._devices_state()}
+        state_file = path.join(self._workdir, STATE_FILE)
+        try:
+            async with aiofiles.open(state_file, "w") as afp:
+                await afp.write(json.dumps(state, separators=(",", ":")))
+                await afp.flush()
+        except FileNotFoundError as ex:
+            _LOGGER.error("Cannot write to file %s", state_file)
+            _LOGGER.error("Exception: %s", str(ex))
+
+    async def async_restore(self):
+        """Restore the state of the devices from the `insteon_state.json` file.
+
+        Only values the devices have not received yet are restored.
+        """
+        state_file = path.join(self._workdir, STATE_FILE)
+        try:
+            async with aiofiles.open(state_file, "r") as afp:
+                state = json.loads(await afp.read())
+        except FileNotFoundError:
+            _LOGGER.debug("Saved state file not found")
+            return
+        except json.decoder.JSONDecodeError:
+            _LOGGER.debug("Loading saved state file failed")
+            return
+        if state.get("version") != STATE_VERSION:
+            _LOGGER.debug("Unsupported saved state version")
+            return
+
+        for address, device_state in state.get("devices", {}).items():
+            device = self._devices.get(address)
+            if device is None or device == self._devices.modem:
+                continue
+            self._restore_device(device, device_state)
+
+    async def async_verify(self, concurrency=VERIFY_CONCURRENCY):
+        """Refresh the stale device state, oldest first."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _async_verify_device(device):
+            async with semaphore:
+                if self._stale_groups(device):
+                    await device.async_status()
+                if self._op_flags_age(device) > OP_FLAG_MAX_AGE:
+                    result = await device.async_read_op_flags()
+                    if result == ResponseStatus.SUCCESS:
+                        self._update_facts(device, datetime.now().timestamp())
+                await asyncio.sleep(VERIFY_DELAY)
+
+        targets = sorted(
+            [device for device in self._stateful_devices() if self._is_stale(device)],
+            key=self._oldest_update,
+        )
+        await asyncio.gather(
+            *[_async_verify_device(device) for device in targets],
+            return_exceptions=True,
+        )
+
+    def _start_verify(self):
+        """Start the verifier."""
+        self._verify_task = asyncio.create_task(self._async_verify_and_schedule())
+
+    async def _async_verify_and_schedule(self):
+        """Refresh the stale device state and schedule the next refresh."""
+        await self.async_verify()
+        self._verify_timer = timer_manager.call_later(
+            self._next_verify_delay(), self._start_verify
+        )
+
+    def _next_verify_delay(self):
+        """Return the seconds until the next stale value reaches its max age."""
+        now = datetime.now().timestamp()
+        waits = []
+        for device in self._stateful_devices():
+            waits.extend(
+                STATUS_MAX_AGE - (now - (_timestamp(group.last_update) or 0))
+                for group in device.groups.values()
+                if group.is_stale
+            )
+            waits.extend(
+                OP_FLAG_MAX_AGE - (now - self._facts[(device.address.id, name)][1])
+                for name in device.operating_flags
+                if (device.address.id, name) in self._facts
+            )
+        # Values past their max age were not refreshed so retry them later
+        waits = [wait if wait > 0 else VERIFY_RETRY for wait in waits]
+        return min(waits, default=OP_FLAG_MAX_AGE) + VERIFY_MARGIN
+
+    def _stateful_devices(self):
+        """Return the devices with state to save."""
+        return [
+            device
+            for device in self._devices.values()
+            if device != self._devices.modem
+            and not isinstance(device.address, X10Address)
+        ]
+
+    def _is_stale(self, device):
+        """Return if any state of a device needs to be refreshed."""
+        return (
+            bool(self._stale_groups(device))
+            or self._op_flags_age(device) > OP_FLAG_MAX_AGE
+        )
+
+    @staticmethod
+    def _stale_groups(device):
+        """Return the stale groups of a device older than `STATUS_MAX_AGE`."""
+        now = datetime.now().timestamp()
+        return [
+            group
+            for group in device.groups.values()
+            if group.is_stale
+            and now - (_timestamp(group.last_update) or 0) > STATUS_MAX_AGE
+        ]
+
+    def _oldest_update(self, device):
+        """Return the timestamp of the oldest stale group of a device."""
+        return min(
+            [
+                _timestamp(group.last_update) or 0
+                for group in self._stale_groups(device)
+            ],
+            default=0,
+        )
+
+    def _op_flags_age(self, device):
+        """Return the age in seconds of the oldest operating flag value."""
+        now = datetime.now().timestamp()
+        ages = [
+            now - self._facts[(device.address.id, name)][1]
+            for name in device.operating_flags
+            if (device.address.id, name) in self._facts
+        ]
+        return max(ages, default=0)
+
+    def _update_fact(self, address, key, value, timestamp):
+        """Record the value of a fact and return its timestamp.
+
+        The timestamp of an unchanged value is kept.
+        """
+        saved = self._facts.get((address, key))
+        if saved is None or saved[0] != value:
+            saved = (value, timestamp)
+            self._facts[(address, key)] = saved
+        return saved[1]
+
+    def _update_facts(self, device, timestamp):
+        """Record the current operating flag values of a device."""
+        for name, flag in device.operating_flags.items():
+            if flag.is_loaded:
+                self._facts[(device.address.id, name)] = (flag.value, timestamp)
+
+    def _devices_state(self):
+        """Return the state of the devices."""
+        now = datetime.now().timestamp()
+        devices_state = {}
+        for device in self._stateful_devices():
+            address = device.address.id
+            device_state = {
+                "last_communication": _timestamp(device.last_communication_received),
+                "groups": {
+                    str(group_id): [group.value, _timestamp(group.last_update)]
+                    for group_id, group in device.groups.items()
+                    if group.value is not None
+                },
+                "operating_flags": {
+                    name: [
+                        flag.value,
+                        self._update_fact(address, name, flag.value, now),
+                    ]
+                    for name, flag in device.operating_flags.items()
+                    if flag.is_loaded
+                },
+            }
+            if device.engine_version != EngineVersion.UNKNOWN:
+                version = int(device.engine_version)
+                device_state["engine_version"] = [
+                    version,
+                    self._update_fact(address, "engine_version", version, now),
+                ]
+            if device.product_id is not None:
+                device_state["product_id"] = [
+                    device.product_id,
+                    self._update_fact(address, "product_id", device.product_id, now),
+                ]
+            devices_state[address] = device_state
+        return devices_state
+
+    def _restore_device(self, device, device_state):
+        """Restore the state of a device."""
+        address = device.address.id
+        last_communication = _datetime(device_state.get("last_communication"))
+        if (
+            last_communication is not None
+            and device.last_communication_received == _NEVER
+        ):
+            device.last_communication_received = last_communication
+
+        for group_id, (value, timestamp) in device_state.get("groups", {}).items():
+            group = device.groups.get(int(group_id))
+            if group is not None and group.last_update is None:
+                group.load_value(value, _datetime(timestamp))
+
+        for name, (value, timestamp) in device_state.get("operating_flags", {}).items():
+            flag = device.operating_flags.get(name)
+            if flag is None:
+                continue
+            if not flag.is_loaded:
+                flag.set_value(value)
+            if flag.value == value:
+                self._facts[(address, name)] = (value, timestamp)
+
+        if "engine_version" in device_state:
+            value, timestamp = device_state["engine_version"]
+            if device.engine_version == EngineVersion.UNKNOWN:
+                device.engine_version = value
+            self._facts[(address, "engine_version")] = (value, timestamp)
+
+        if "product_id" in device_state:
+            value, timestamp = device_state["product_id"]
+            if device.product_id is None:
+                device.product_id = value
+            self._facts[(address, "product_id")] = (value, timestamp)
+
+    async def _async_save_periodically(self, save_interval):
+        """Save the state every `save_interval` seconds."""
+        while True:
+            await asyncio.sleep(save_interval)
+            await self.async_save()
+
+    def _state_changed(self, name, address, value, group):
+        """Record the time a group value of a device changed."""
+        device = self._devices.get(address)
+        if device is not None:
+            device.last_communication_received = datetime.now()
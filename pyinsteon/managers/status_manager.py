@@ -15,11 +15,20 @@ second call happens
         else
             Wait until the first call is done then run
 
+Freshness:
+A status type is fresh when its status response was received, or every group
+value it reports was received from the device, within `max_age` seconds. The
+groups a status type reports are the groups updated by its last status
+response. Group values are also updated by broadcast, cleanup and direct ACK
+messages so a status request is not needed after the device reports its state.
+A call with `max_age` skips the fresh status types.
+
 """
 
 from asyncio import Lock
+from datetime import datetime, timedelta
 from logging import DEBUG, getLogger
-from typing import Callable, Dict, Union
+from typing import Callable, Dict, Set, Union
 
 from ..address import Address
 from ..constants import ResponseStatus
@@ -33,13 +42,42 @@ _LOGGER.setLevel(DEBUG)
 class StatusManager:
     """Status manager."""
 
-    def __init__(self, address: Address):
+    def __init__(self, address: Address, groups: Dict = None):
         """Init the StatusManager class."""
         self._address = Address(address)
+        self._groups = groups if groups is not None else {}
         self._status_cmds: Dict[int, StatusRequestCommand] = {}
         self._callbacks: Dict[int, Callable] = {}
         self._call_waiting: bool = False
         self._run_lock = Lock()
+        self._last_status: Dict[int, datetime] = {}
+        self._status_groups: Dict[int, Set[int]] = {}
+
+    def last_update(self, status_type: int) -> Union[datetime, None]:
+        """Return the time the state of a status type was last received."""
+        last_status = self._last_status.get(status_type)
+        groups = [
+            self._groups.get(group)
+            for group in self._status_groups.get(status_type, [])
+        ]
+        if not groups or any(
+            group is None or group.is_stale or group.last_update is None
+            for group in groups
+        ):
+            return last_status
+        last_group_update = min(group.last_update for group in groups)
+        if last_status is None:
+            return last_group_update
+        return max(last_status, last_group_update)
+
+    def is_fresh(self, status_type: int, max_age: Union[float, None]) -> bool:
+        """Return if the state of a status type was received within `max_age` seconds."""
+        if max_age is None:
+            return False
+        last_update = self.last_update(status_type)
+        return last_update is not None and datetime.now() - last_update <= timedelta(
+            seconds=max_age
+        )
 
     def add_status_type(self, status_type: int, callback_function: Callable):
         """Add a status request type."""
@@ -57,11 +95,26 @@ class StatusManager:
             status_cmd.unsubscribe(self._callbacks[status_type])
             self._callbacks.pop(status_type)
             self._status_cmds.pop(status_type)
+            self._last_status.pop(status_type, None)
+            self._status_groups.pop(status_type, None)
 
     async def async_status(
-        self, status_type: Union[int, None] = None
+        self, status_type: Union[int, None] = None, max_age: float = None
     ) -> ResponseStatus:
-        """Send the status request."""
+        """Send the status request.
+
+        If `max_age` is given, status types received within `max_age` seconds
+        are not requested.
+        """
+        if status_type is not None and status_type not in self._status_cmds:
+            status_type = None
+        status_types = (
+            [status_type] if status_type is not None else list(self._status_cmds)
+        )
+        if all(self.is_fresh(curr_type, max_age) for curr_type in status_types):
+            _LOGGER.debug("Status is current, no status request sent.")
+            return ResponseStatus.SUCCESS
+
         if self._call_waiting:
             # No need for this call because an existing call is already scheduled
             _LOGGER.debug("No need to run this status request.")
@@ -76,21 +129,22 @@ class StatusManager:
             self._call_waiting = True
 
         results = []
-        if status_type is not None and status_type not in self._status_cmds:
-            status_type = None
-        status_types = (
-            [status_type] if status_type is not None else self._status_cmds.keys()
-        )
         async with self._run_lock:
             for curr_status_type in status_types:
+                # A prior call may have received the status while this call waited
+                if curr_status_type not in self._status_cmds or self.is_fresh(
+                    curr_status_type, max_age
+                ):
+                    continue
                 result = await self._async_status(self._status_cmds[curr_status_type])
                 results.append(result)
             self._call_waiting = False
 
         return multiple_status(*results)
 
-    async def _async_status(self, status_cmd: Callable) -> ResponseStatus:
+    async def _async_status(self, status_cmd: StatusRequestCommand) -> ResponseStatus:
         """Execute the status command."""
+        start = datetime.now()
         retries = 2
         result = ResponseStatus.UNSENT
         while retries and result not in [
@@ -99,4 +153,15 @@ class StatusManager:
         ]:
             result = await status_cmd.async_send()
             retries -= 1
+        if result == ResponseStatus.SUCCESS:
+            self._status_received(status_cmd.status_type, start)
         return result
+
+    def _status_received(self, status_type: int, start: datetime):
+        """Record the status response time and the groups it updated."""
+        self._last_status[status_type] = datetime.now()
+        self._status_groups[status_type] = {
+            group_id
+            for group_id, group in self._groups.items()
+            if group.last_update is not None and group.last_update >= start
+        }
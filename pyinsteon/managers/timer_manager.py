@@ -0,0 +1,196 @@
+"""Shared timer scheduler for periodic device checks.
+
+Managers such as the heartbeat, low battery and device ping managers register
+deadlines with a single scheduler rather than each holding their own event
+loop handle or sleeping task. The scheduler keeps the deadlines in a heap and
+holds one event loop handle for the earliest deadline.
+"""
+
+import asyncio
+import heapq
+from inspect import isawaitable
+from itertools import count
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _log_task_error(task: asyncio.Future):
+    """Log the exception raised by a timer coroutine."""
+    if task.cancelled() or task.exception() is None:
+        return
+    ex = task.exception()
+    _LOGGER.error("An issue occured running a timer callback")
+    _LOGGER.error("Error: %s", str(ex))
+    _LOGGER.debug("Timer callback error", exc_info=ex)
+
+
+class ScheduledTimer:
+    """Handle to a deadline registered with the TimerManager.
+
+    Cancelling a timer or moving its deadline later is O(1). The heap entry is
+    left in place and is discarded or re-queued when it reaches the top.
+    """
+
+    __slots__ = ("_manager", "_deadline", "_callback", "_args", "_cancelled", "_entry")
+
+    def __init__(self, manager, deadline, callback, args):
+        """Init the ScheduledTimer class."""
+        self._manager = manager
+        self._deadline = deadline
+        self._callback = callback
+        self._args = args
+        self._cancelled = False
+        self._entry = None
+
+    @property
+    def deadline(self) -> float:
+        """Return the event loop time the timer is due."""
+        return self._deadline
+
+    @property
+    def active(self) -> bool:
+        """Return True if the timer is waiting to run."""
+        return not self._cancelled
+
+    def cancel(self):
+        """Cancel the timer."""
+        self._cancelled = True
+
+    def rearm(self, delay: float):
+        """Reschedule the timer to run `delay` seconds from now.
+
+        A cancelled or completed timer is reactivated.
+        """
+        self._manager.rearm(self, delay)
+
+    def _run(self):
+        """Run the timer callback."""
+        self._cancelled = True
+        result = self._callback(*self._args)
+        if isawaitable(result):
+            task = asyncio.ensure_future(result)
+            task.add_done_callback(_log_task_error)
+
+
+class TimerManager:
+    """Schedule deadlines for many timers using a single event loop handle."""
+
+    def __init__(self):
+        """Init the TimerManager class."""
+        self._heap = []
+        self._counter = count()
+        self._loop = None
+        self._handle = None
+        self._handle_deadline = None
+
+    def __len__(self):
+        """Return the number of active timers."""
+        return len([entry for entry in self._heap if self._is_current(entry)])
+
+    def call_later(self, delay: float, callback, *args) -> ScheduledTimer:
+        """Schedule a callback to run `delay` seconds from now.
+
+        The callback can be a function or a coroutine function.
+        """
+        loop = self._get_loop()
+        timer = ScheduledTimer(self, loop.time() + delay, callback, args)
+        self._push(timer)
+        return timer
+
+    def rearm(self, timer: ScheduledTimer, delay: float):
+        """Reschedule a timer to run `delay` seconds from now."""
+        loop = self._get_loop()
+        deadline = loop.time() + delay
+        # pylint: disable=protected-access
+        was_active = timer.active
+        old_deadline = timer._deadline
+        timer._deadline = deadline
+        timer._cancelled = False
+        if was_active and timer._entry is not None and deadline >= old_deadline:
+            # The existing heap entry is re-queued when it comes due
+            return
+        self._push(timer)
+
+    def clear(self):
+        """Cancel all timers."""
+        for _, _, timer in self._heap:
+            timer.cancel()
+        self._heap = []
+        self._cancel_handle()
+
+    def _get_loop(self):
+        """Return the current event loop.
+
+        Timers scheduled on a previous event loop are discarded.
+        """
+        loop = asyncio.get_event_loop()
+        if loop is not self._loop:
+            if self._loop is not None:
+                _LOGGER.debug("Event loop changed, clearing timers")
+            for _, _, timer in self._heap:
+                timer._entry = None  # pylint: disable=protected-access
+            self._heap = []
+            self._handle = None
+            self._handle_deadline = None
+            self._loop = loop
+        return loop
+
+    def _push(self, timer: ScheduledTimer):
+        """Add a timer to the heap."""
+        # pylint: disable=protected-access
+        timer._entry = next(self._counter)
+        heapq.heappush(self._heap, (timer._deadline, timer._entry, timer))
+        self._arm()
+
+    @staticmethod
+    def _is_current(entry) -> bool:
+        """Return True if the heap entry is the active entry of its timer."""
+        _, entry_id, timer = entry
+        # pylint: disable=protected-access
+        return timer.active and timer._entry == entry_id
+
+    def _arm(self):
+        """Set the loop handle to the earliest deadline."""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            self._cancel_handle()
+            return
+        deadline = self._heap[0][0]
+        if self._handle is not None and self._handle_deadline <= deadline:
+            return
+        self._cancel_handle()
+        self._handle_deadline = deadline
+        self._handle = self._loop.call_at(deadline, self._run_due)
+
+    def _cancel_handle(self):
+        """Cancel the event loop handle."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = None
+        self._handle_deadline = None
+
+    def _run_due(self):
+        """Run the timers that are due."""
+        self._handle = None
+        self._handle_deadline = None
+        now = self._loop.time()
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if not self._is_current(entry):
+                continue
+            deadline, _, timer = entry
+            # pylint: disable=protected-access
+            if timer._deadline > deadline:
+                timer._entry = next(self._counter)
+                heapq.heappush(self._heap, (timer._deadline, timer._entry, timer))
+                continue
+            try:
+                timer._run()
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.error("Error running timer callback: %s", str(ex))
+        self._arm()
+
+
+timer_manager = TimerManager()
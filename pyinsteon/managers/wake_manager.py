@@ -0,0 +1,183 @@
+"""Plan the commands sent to a battery device while it is awake.
+
+Battery operated devices are only awake for a few seconds after they send a
+message. Commands requested while the device is asleep are queued here and
+run as one batch when the device wakes up. The batch is ordered by value,
+identical requests are merged, and the run time is estimated so the device is
+only asked to stay awake when the remaining wake window is too short.
+"""
+
+import logging
+from typing import List
+
+_LOGGER = logging.getLogger(__name__)
+
+# Estimated usable time in seconds after a keep awake command is sent
+WAKE_WINDOW = 30
+DEFAULT_PRIORITY = 3
+DEFAULT_COST = 3
+
+# Lower priority values run first. Writes run before reads so the values read
+# reflect the values written. The engine version is read before the ALDB
+# since the ALDB read method depends on it.
+COMMAND_PRIORITY = {
+    "async_status": 0,
+    "async_get_engine_version": 1,
+    "async_read_product_id": 1,
+    "async_write_op_flags": 2,
+    "async_write_ext_properties": 2,
+    "async_read_op_flags": 3,
+    "async_read_ext_properties": 3,
+    "async_write_on_wake": 4,
+    "async_add_default_links_on_wake": 4,
+    "async_load_on_wake": 5,
+}
+
+# Estimated time in seconds to run a command
+COMMAND_COST = {
+    "async_status": 1,
+    "async_get_engine_version": 1,
+    "async_read_product_id": 1,
+    "async_write_op_flags": 3,
+    "async_write_ext_properties": 3,
+    "async_read_op_flags": 3,
+    "async_read_ext_properties": 3,
+    "async_write_on_wake": 5,
+    "async_add_default_links_on_wake": 10,
+    "async_load_on_wake": 15,
+}
+
+# Boolean arguments that are merged with `or` rather than making a new request
+MERGE_ARGS = ["refresh", "force"]
+
+# Set commands are single messages that change the device state
+SET_PREFIX = "async_set_"
+
+
+def _command_name(command) -> str:
+    """Return the name of a command method."""
+    return getattr(command, "__name__", repr(command))
+
+
+class WakeCommand:
+    """Command to run when a battery device wakes up."""
+
+    __slots__ = ("command", "kwargs", "retries", "name", "priority", "cost", "order")
+
+    def __init__(self, command, kwargs, retries, order):
+        """Init the WakeCommand class."""
+        self.command = command
+        self.kwargs = kwargs
+        self.retries = retries
+        self.order = order
+        self.name = _command_name(command)
+        self.priority = COMMAND_PRIORITY.get(self.name, DEFAULT_PRIORITY)
+        self.cost = COMMAND_COST.get(self.name, DEFAULT_COST)
+        if self.name.startswith(SET_PREFIX):
+            self.priority = min(self.priority, 2)
+            self.cost = min(self.cost, 1)
+
+    @property
+    def key(self):
+        """Return the key used to identify redundant requests."""
+        args = tuple(
+            sorted(
+                (arg, val) for arg, val in self.kwargs.items() if arg not in MERGE_ARGS
+            )
+        )
+        return (self.name, args)
+
+    def merge(self, other):
+        """Merge a redundant request into this request."""
+        for arg in MERGE_ARGS:
+            if arg in other.kwargs:
+                self.kwargs[arg] = bool(self.kwargs.get(arg) or other.kwargs.get(arg))
+        self.retries = max(self.retries, other.retries)
+
+    async def async_run(self):
+        """Run the command."""
+        return await self.command(**self.kwargs)
+
+
+class WakeCommandManager:
+    """Queue, merge and order commands for a battery device wake window."""
+
+    def __init__(self, wake_window=WAKE_WINDOW):
+        """Init the WakeCommandManager class."""
+        self._pending = {}
+        self._order = 0
+        self._wake_window = wake_window
+
+    def __len__(self):
+        """Return the number of pending commands."""
+        return len(self._pending)
+
+    @property
+    def wake_window(self) -> float:
+        """Return the estimated usable wake time after a keep awake command."""
+        return self._wake_window
+
+    @property
+    def pending(self) -> List[str]:
+        """Return the names of the pending commands in run order."""
+        return [cmd.name for cmd in self._ordered()]
+
+    @property
+    def estimated_duration(self) -> float:
+        """Return the estimated time to run all pending commands."""
+        return sum(cmd.cost for cmd in self._pending.values())
+
+    @property
+    def fits_wake_window(self) -> bool:
+        """Return True if the pending commands fit in one wake window."""
+        return self.estimated_duration <= self._wake_window
+
+    def add(self, command, retries=3, **kwargs) -> WakeCommand:
+        """Add a command to run when the device wakes up.
+
+        A request that is redundant with a pending request is merged with it.
+        """
+        self._order += 1
+        wake_cmd = WakeCommand(command, kwargs, retries, self._order)
+        return self._add(wake_cmd)
+
+    def requeue(self, wake_cmd: WakeCommand):
+        """Requeue a failed command for the next wake window."""
+        if wake_cmd.retries <= 0:
+            _LOGGER.debug("Command %s failed with no retries left", wake_cmd.name)
+            return
+        wake_cmd.retries -= 1
+        self._add(wake_cmd)
+
+    def restore(self, wake_cmd: WakeCommand):
+        """Return a command that was not run to the pending commands."""
+        self._add(wake_cmd)
+
+    def clear(self):
+        """Remove all pending commands."""
+        self._pending = {}
+
+    def pop_batch(self) -> List[WakeCommand]:
+        """Return the pending commands in run order and clear the queue."""
+        batch = self._ordered()
+        self._pending = {}
+        if sum(cmd.cost for cmd in batch) > self._wake_window:
+            _LOGGER.debug(
+                "Commands exceed the wake window and require keep awake commands"
+            )
+        return batch
+
+    def _add(self, wake_cmd: WakeCommand) -> WakeCommand:
+        """Add or merge a command into the pending commands."""
+        key = wake_cmd.key
+        existing = self._pending.get(key)
+        if existing is not None:
+            _LOGGER.debug("Merging redundant command %s", wake_cmd.name)
+            existing.merge(wake_cmd)
+            return existing
+        self._pending[key] = wake_cmd
+        return wake_cmd
+
+    def _ordered(self) -> List[WakeCommand]:
+        """Return the pending commands in run order."""
+        return sorted(self._pending.values(), key=lambda cmd: (cmd.priority, cmd.order))
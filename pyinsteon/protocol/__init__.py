@@ -4,6 +4,9 @@ import asyncio
 from functools import partial
 import logging
 
+import async_timeout
+
+from ..address import Address
 from ..constants import ResponseStatus
 from ..handlers.get_im_info import GetImInfoHandler
 from ..managers.device_id_manager import DeviceId
@@ -14,6 +17,9 @@ from .protocol import Protocol
 from .serial_transport import async_connect_serial, async_connect_socket
 
 _LOGGER = logging.getLogger(__name__)
+IM_INFO_RETRIES = 5
+IM_INFO_TIMEOUT = 3
+_VERIFY_TASKS = set()
 
 
 async def async_modem_connect(
@@ -24,6 +30,8 @@ async def async_modem_connect(
     password=None,
     hub_version=2,
     mock=False,
+    fast_connect=False,
+    modem_id: DeviceId = None,
 ):
     """Connect to the Insteon Modem.
 
@@ -36,26 +44,14 @@ async def async_modem_connect(
         username: Hub username for the Hub V2
         password: Hub password for the Hub V2
         hub_version: 1 | 2 (Default: 2)
+        fast_connect: Connect without fixed waits and request the modem ID as
+            soon as the transport is connected (Default: False)
+        modem_id: Cached modem `DeviceId`. With `fast_connect` the modem is
+            created from the cached ID and the ID is verified in the background.
 
     If the device is a serial device see the serial class parameters.
 
     """
-    device_id = None
-
-    def set_im_info(address, cat, subcat, firmware):
-        nonlocal device_id
-        device_id = DeviceId(address, cat, subcat, firmware)
-
-    async def async_test_device_id():
-        """Test if the device ID is set."""
-        retries = 10
-        while device_id is None and retries:
-            await asyncio.sleep(0.1)
-            if device_id is not None:
-                return True
-            retries -= 1
-        return False
-
     transport = None
     if not device and not host:
         raise ValueError("Must specify either a device or a host")
@@ -78,24 +74,82 @@ async def async_modem_connect(
     protocol = Protocol(connect_method=connect_method)
 
     try:
-        await protocol.async_connect(retry=False)
+        await protocol.async_connect(retry=False, settle=not fast_connect)
     except ConnectionError as ex:
         raise ConnectionError("Modem did not respond connection request") from ex
 
-    get_im_info = GetImInfoHandler()
-    get_im_info.subscribe(set_im_info)
-    retries = 5
-    result = None
-    while retries and result != ResponseStatus.SUCCESS:
-        await asyncio.sleep(1)
-        result = await get_im_info.async_send()
-        retries -= 1
+    if fast_connect and modem_id is not None:
+        device_id = modem_id
+        task = asyncio.create_task(_async_verify_modem_id(modem_id))
+        _VERIFY_TASKS.add(task)
+        task.add_done_callback(_VERIFY_TASKS.discard)
+    else:
+        device_id = await _async_read_modem_id(fast_connect)
 
-    # Wait for a max of 60 seconds for the modem to respond
-    if device_id is None and not await async_test_device_id():
+    if device_id is None:
         raise ConnectionError("Modem did not respond to ID request")
 
     modem = create_device(device_id)
     modem.protocol = protocol
     modem.transport = transport
     return modem
+
+
+async def _async_read_modem_id(fast_connect):
+    """Request the modem ID.
+
+    With `fast_connect` each request waits only until the modem responds or
+    `IM_INFO_TIMEOUT` passes.
+    """
+    device_id = None
+
+    def set_im_info(address, cat, subcat, firmware):
+        nonlocal device_id
+        device_id = DeviceId(address, cat, subcat, firmware)
+
+    async def async_test_device_id():
+        """Test if the device ID is set."""
+        retries = 10
+        while device_id is None and retries:
+            await asyncio.sleep(0.1)
+            if device_id is not None:
+                return True
+            retries -= 1
+        return False
+
+    get_im_info = GetImInfoHandler()
+    get_im_info.subscribe(set_im_info)
+    retries = IM_INFO_RETRIES
+    result = None
+    while retries and result != ResponseStatus.SUCCESS:
+        if fast_connect:
+            try:
+                async with async_timeout.timeout(IM_INFO_TIMEOUT):
+                    result = await get_im_info.async_send()
+            except asyncio.TimeoutError:
+                result = ResponseStatus.FAILURE
+        else:
+            await asyncio.sleep(1)
+            result = await get_im_info.async_send()
+        retries -= 1
+
+    # The modem ID is received with the response so only wait if it is not set
+    if device_id is None and not fast_connect:
+        await async_test_device_id()
+    return device_id
+
+
+async def _async_verify_modem_id(modem_id: DeviceId):
+    """Verify a cached modem ID matches the connected modem."""
+    device_id = await _async_read_modem_id(fast_connect=True)
+    if device_id is None:
+        _LOGGER.warning("Modem did not respond to ID request")
+    elif Address(device_id.address) != Address(modem_id.address) or (
+        device_id.cat,
+        device_id.subcat,
+    ) != (modem_id.cat, modem_id.subcat):
+        _LOGGER.error(
+            "Connected modem %s does not match the cached modem %s",
+            str(device_id),
+            str(modem_id),
+        )
@@ -367,31 +367,31 @@ def set_status(address: Address, on_level: int, topic=pub.AUTO_TOPIC):
 @topic_to_command_handler(register_list=COMMAND_REGISTER, topic=SET_ADDRESS_MSB)
 def set_address_msb(address: Address, high_byte: int, topic=pub.AUTO_TOPIC):
     """Create a SET_ADDRESS_MSB command."""
-    _create_direct_message(topic=topic, address=address, cmd2=high_byte)
+    _create_direct_message(topic=topic, address=address, cmd2=high_byte, priority=10)
 
 
 @topic_to_command_handler(register_list=COMMAND_REGISTER, topic=POKE)
 def poke(address: Address, value: int, topic=pub.AUTO_TOPIC):
     """Create a POKE command."""
-    _create_direct_message(topic=topic, address=address, cmd2=value)
+    _create_direct_message(topic=topic, address=address, cmd2=value, priority=10)
 
 
 @topic_to_command_handler(register_list=COMMAND_REGISTER, topic=PEEK)
 def peek(address: Address, lsb: int, topic=pub.AUTO_TOPIC):
     """Create a PEEK command."""
-    _create_direct_message(topic=topic, address=address, cmd2=lsb)
+    _create_direct_message(topic=topic, address=address, cmd2=lsb, priority=10)
 
 
 @topic_to_command_handler(register_list=COMMAND_REGISTER, topic=PEEK_INTERNAL)
 def peek_internal(address: Address, lsb: int, topic=pub.AUTO_TOPIC):
     """Create a PEEK_INTERNAL command."""
-    _create_direct_message(topic=topic, address=address, cmd2=lsb)
+    _create_direct_message(topic=topic, address=address, cmd2=lsb, priority=10)
 
 
 @topic_to_command_handler(register_list=COMMAND_REGISTER, topic=POKE_INTERNAL)
 def poke_internal(address: Address, value: int, topic=pub.AUTO_TOPIC):
     """Create a POKE_INTERNAL command."""
-    _create_direct_message(topic=topic, address=address, cmd2=value)
+    _create_direct_message(topic=topic, address=address, cmd2=value, priority=10)
 
 
 @topic_to_command_handler(register_list=COMMAND_REGISTER, topic=ON_AT_RAMP_RATE)
@@ -453,7 +453,9 @@ def _read_aldb(address, mem_addr, num_recs, topic):
     user_data = UserData(
         {"d1": 0x00, "d2": 0x00, "d3": mem_hi, "d4": mem_lo, "d5": num_recs}
     )
-    _create_direct_message(topic=topic, address=address, cmd2=0, user_data=user_data)
+    _create_direct_message(
+        topic=topic, address=address, cmd2=0, user_data=user_data, priority=10
+    )
 
 
 def _write_aldb(
@@ -494,7 +496,9 @@ def _write_aldb(
             "d13": data3,
         }
     )
-    _create_direct_message(topic=topic, address=address, cmd2=0, user_data=user_data)
+    _create_direct_message(
+        topic=topic, address=address, cmd2=0, user_data=user_data, priority=10
+    )
 
 
 @topic_to_command_handler(
@@ -0,0 +1,131 @@
+"""Suppress duplicate inbound messages before they are converted to topics.
+
+Insteon devices repeat every broadcast and All-Link Cleanup message up to
+`max_hops` times. The repeats carry a reduced `hops_left` value. Dropping them
+here avoids converting and publishing the same event several times.
+"""
+
+import logging
+from time import monotonic
+from typing import Dict, Tuple
+
+from ..constants import MessageFlagType, MessageId
+
+_LOGGER = logging.getLogger(__name__)
+
+MIN_DUP = 0.7
+MAX_DUP = 2
+MAX_ENTRIES = 256
+DEDUP_MESSAGE_IDS = [MessageId.STANDARD_RECEIVED, MessageId.EXTENDED_RECEIVED]
+DEDUP_MESSAGE_TYPES = [
+    MessageFlagType.BROADCAST,
+    MessageFlagType.ALL_LINK_BROADCAST,
+    MessageFlagType.ALL_LINK_CLEANUP,
+]
+
+
+def _get_group(msg) -> int:
+    """Return the group of a broadcast or cleanup message."""
+    if msg.flags.message_type == MessageFlagType.ALL_LINK_CLEANUP:
+        return msg.cmd2
+    return msg.target.low if msg.target else 0
+
+
+class MessageDeduplicator:
+    """Track recent broadcast and cleanup messages to identify repeats.
+
+    Messages are tracked by (address, cmd1, cmd2, group, message type). A
+    message is a duplicate if it arrives within `MAX_DUP` seconds of the last
+    matching message with fewer hops left, or within `MIN_DUP` seconds with
+    the same hops left. A message with more hops left is a new event.
+    """
+
+    def __init__(self):
+        """Init the MessageDeduplicator class."""
+        self._table: Dict[Tuple, Tuple[float, int, bytes]] = {}
+        self._received = 0
+        self._suppressed = 0
+        self._suppressed_by_type: Dict[MessageFlagType, int] = {}
+
+    @property
+    def received(self) -> int:
+        """Return the number of messages tested for duplication."""
+        return self._received
+
+    @property
+    def suppressed(self) -> int:
+        """Return the number of duplicate messages suppressed."""
+        return self._suppressed
+
+    @property
+    def suppressed_by_type(self) -> Dict[MessageFlagType, int]:
+        """Return the number of duplicate messages suppressed by message type."""
+        return dict(self._suppressed_by_type)
+
+    def reset_counters(self):
+        """Reset the message counters."""
+        self._received = 0
+        self._suppressed = 0
+        self._suppressed_by_type = {}
+
+    def clear(self):
+        """Clear the table of recent messages."""
+        self._table = {}
+
+    def is_duplicate(self, msg) -> bool:
+        """Test if an inbound message is a repeat of a recent message."""
+        if msg.message_id not in DEDUP_MESSAGE_IDS:
+            return False
+        message_type = msg.flags.message_type
+        if message_type not in DEDUP_MESSAGE_TYPES:
+            return False
+
+        self._received += 1
+        curr_time = monotonic()
+        key = (
+            bytes(msg.address),
+            msg.cmd1,
+            msg.cmd2,
+            _get_group(msg),
+            message_type,
+        )
+        hops_left = msg.flags.hops_left
+        user_data = getattr(msg, "user_data", None)
+        user_data = bytes(user_data) if user_data is not None else None
+        last = self._table.get(key)
+        if len(self._table) >= MAX_ENTRIES and last is None:
+            self._purge(curr_time)
+        self._table[key] = (curr_time, hops_left, user_data)
+
+        if last is None or not self._is_repeat(curr_time, hops_left, user_data, last):
+            return False
+
+        self._suppressed += 1
+        self._suppressed_by_type[message_type] = (
+            self._suppressed_by_type.get(message_type, 0) + 1
+        )
+        _LOGGER.debug("Duplicate message suppressed: %r", msg)
+        return True
+
+    @staticmethod
+    def _is_repeat(curr_time, hops_left, user_data, last) -> bool:
+        """Test if the message is a repeat of the last matching message."""
+        last_time, last_hops_left, last_user_data = last
+        if user_data != last_user_data:
+            return False
+        delta = curr_time - last_time
+        if delta >= MAX_DUP or last_hops_left is None or hops_left is None:
+            return False
+        if hops_left > last_hops_left:
+            return False
+        if hops_left == last_hops_left:
+            return delta <= MIN_DUP
+        return True
+
+    def _purge(self, curr_time):
+        """Remove entries that can no longer match a duplicate."""
+        self._table = {
+            key: entry
+            for key, entry in self._table.items()
+            if curr_time - entry[0] < MAX_DUP
+        }
@@ -0,0 +1,293 @@
+"""Schedule the messages queued to the modem.
+
+Queued messages are `(priority, sequence, msg, token)` tuples. The priority
+assigns each message to a traffic class:
+
+    TRAFFIC_INTERACTIVE: priority 3 or lower, such as on, off and modem
+        commands.
+    TRAFFIC_CONFIG: priority 4 to 6, such as extended set commands.
+    TRAFFIC_STATUS: priority 7, such as status requests and linking.
+    TRAFFIC_BULK: priority 8 or higher, such as ALDB reads and writes and
+        peek and poke commands.
+
+The fair scheduler shares the modem between the traffic classes by weight
+using self-clocked weighted fair queuing, so every class with queued
+messages is sent from and a new interactive message waits for at most one
+message of each other class. Within a class, devices are sent to in turn
+and the messages of a device are sent by priority then in the order they
+were queued.
+"""
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import OrderedDict, deque
+import heapq
+from itertools import count
+from time import monotonic
+from typing import Callable, Dict
+
+TRAFFIC_INTERACTIVE = "interactive"
+TRAFFIC_CONFIG = "config"
+TRAFFIC_STATUS = "status"
+TRAFFIC_BULK = "bulk"
+CLASS_WEIGHTS = {
+    TRAFFIC_INTERACTIVE: 8,
+    TRAFFIC_CONFIG: 4,
+    TRAFFIC_STATUS: 2,
+    TRAFFIC_BULK: 1,
+}
+
+
+def traffic_class(priority: int) -> str:
+    """Return the traffic class of a message priority."""
+    if priority <= 3:
+        return TRAFFIC_INTERACTIVE
+    if priority <= 6:
+        return TRAFFIC_CONFIG
+    if priority <= 7:
+        return TRAFFIC_STATUS
+    return TRAFFIC_BULK
+
+
+def _get_device(msg):
+    """Return the address of the device a message is sent to or None."""
+    return getattr(msg, "address", None)
+
+
+class QueueWaitMetrics:
+    """Time the messages of a traffic class waited in the queue."""
+
+    def __init__(self):
+        """Init the QueueWaitMetrics class."""
+        self.count = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """Return the average seconds a message waited in the queue."""
+        return self.total_wait / self.count if self.count else 0.0
+
+    def add(self, wait: float):
+        """Add the seconds a message waited in the queue."""
+        self.count += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.last_wait = wait
+
+
+class MessageScheduler(ABC):
+    """Base class of the schedulers of the modem message queue."""
+
+    def __init__(self):
+        """Init the MessageScheduler class."""
+        self._sequence = count()
+        self._metrics = {name: QueueWaitMetrics() for name in CLASS_WEIGHTS}
+
+    @property
+    def metrics(self) -> Dict[str, QueueWaitMetrics]:
+        """Return the queue wait metrics by traffic class."""
+        return self._metrics
+
+    @abstractmethod
+    def __len__(self):
+        """Return the number of queued messages."""
+
+    @abstractmethod
+    def __iter__(self):
+        """Iterate the queued messages."""
+
+    @abstractmethod
+    def push(self, item):
+        """Queue a message."""
+
+    @abstractmethod
+    def pop(self):
+        """Remove and return the next message to send."""
+
+    @abstractmethod
+    def prune(self, is_dropped: Callable) -> int:
+        """Remove the queued messages `is_dropped` returns True for."""
+
+    def _entry(self, item):
+        """Return the heap entry of a message."""
+        return (item[0], next(self._sequence), monotonic(), item)
+
+    def _record_wait(self, entry):
+        """Record the time a message waited in the queue."""
+        priority, _, queued_at, _ = entry
+        self._metrics[traffic_class(priority)].add(monotonic() - queued_at)
+
+
+class PriorityScheduler(MessageScheduler):
+    """Send the messages by priority then in the order they were queued."""
+
+    def __init__(self):
+        """Init the PriorityScheduler class."""
+        super().__init__()
+        self._entries = []
+
+    def __len__(self):
+        """Return the number of queued messages."""
+        return len(self._entries)
+
+    def __iter__(self):
+        """Iterate the queued messages."""
+        return iter([entry[3] for entry in self._entries])
+
+    def push(self, item):
+        """Queue a message."""
+        heapq.heappush(self._entries, self._entry(item))
+
+    def pop(self):
+        """Remove and return the next message to send."""
+        entry = heapq.heappop(self._entries)
+        self._record_wait(entry)
+        return entry[3]
+
+    def prune(self, is_dropped: Callable) -> int:
+        """Remove the queued messages `is_dropped` returns True for."""
+        size = len(self._entries)
+        self._entries = [entry for entry in self._entries if not is_dropped(entry[3])]
+        heapq.heapify(self._entries)
+        return size - len(self._entries)
+
+
+class _TrafficClass:
+    """Queued messages of one traffic class by device."""
+
+    def __init__(self, weight: int):
+        """Init the _TrafficClass class."""
+        self.weight = weight
+        self.finish = 0.0
+        self.devices: Dict = OrderedDict()
+        self.size = 0
+
+    def push(self, device, entry):
+        """Queue a message to a device."""
+        heapq.heappush(self.devices.setdefault(device, []), entry)
+        self.size += 1
+
+    def pop(self):
+        """Remove and return the next message of the next device in turn."""
+        device, entries = next(iter(self.devices.items()))
+        entry = heapq.heappop(entries)
+        del self.devices[device]
+        if entries:
+            self.devices[device] = entries
+        self.size -= 1
+        return entry
+
+
+class FairScheduler(MessageScheduler):
+    """Share the modem between traffic classes by weight and devices in turn."""
+
+    def __init__(self, weights: Dict[str, int] = None):
+        """Init the FairScheduler class."""
+        super().__init__()
+        weights = {**CLASS_WEIGHTS, **(weights or {})}
+        self._classes = {name: _TrafficClass(weights[name]) for name in CLASS_WEIGHTS}
+        self._virtual_time = 0.0
+
+    def __len__(self):
+        """Return the number of queued messages."""
+        return sum(traffic.size for traffic in self._classes.values())
+
+    def __iter__(self):
+        """Iterate the queued messages."""
+        return iter(
+            [
+                entry[3]
+                for traffic in self._classes.values()
+                for entries in traffic.devices.values()
+                for entry in entries
+            ]
+        )
+
+    def push(self, item):
+        """Queue a message."""
+        entry = self._entry(item)
+        traffic = self._classes[traffic_class(entry[0])]
+        if not traffic.size:
+            traffic.finish = self._virtual_time + 1 / traffic.weight
+        traffic.push(_get_device(item[2]), entry)
+
+    def pop(self):
+        """Remove and return the next message to send."""
+        traffic = min(
+            (traffic for traffic in self._classes.values() if traffic.size),
+            key=lambda traffic: traffic.finish,
+        )
+        self._virtual_time = traffic.finish
+        entry = traffic.pop()
+        if traffic.size:
+            traffic.finish += 1 / traffic.weight
+        self._record_wait(entry)
+        return entry[3]
+
+    def prune(self, is_dropped: Callable) -> int:
+        """Remove the queued messages `is_dropped` returns True for."""
+        dropped = 0
+        for traffic in self._classes.values():
+            for device, entries in list(traffic.devices.items()):
+                kept = [entry for entry in entries if not is_dropped(entry[3])]
+                dropped += len(entries) - len(kept)
+                traffic.size -= len(entries) - len(kept)
+                if kept:
+                    heapq.heapify(kept)
+                    traffic.devices[device] = kept
+                else:
+                    del traffic.devices[device]
+        return dropped
+
+
+class MessageQueue(asyncio.Queue):
+    """Queue of the messages to write to the modem.
+
+    The order messages are sent in is set by the scheduler, a `FairScheduler`
+    by default. An entry without a message, the writer stop sentinel, is not
+    scheduled and is returned before any queued message.
+    """
+
+    def __init__(self, scheduler: MessageScheduler = None):
+        """Init the MessageQueue class."""
+        self._scheduler = scheduler if scheduler is not None else FairScheduler()
+        super().__init__()
+
+    @property
+    def scheduler(self) -> MessageScheduler:
+        """Return the message scheduler."""
+        return self._scheduler
+
+    @property
+    def metrics(self) -> Dict[str, QueueWaitMetrics]:
+        """Return the queue wait metrics by traffic class."""
+        return self._scheduler.metrics
+
+    def prune(self, is_dropped: Callable) -> int:
+        """Remove the queued messages `is_dropped` returns True for."""
+        return self._scheduler.prune(is_dropped)
+
+    def qsize(self) -> int:
+        """Return the number of queued entries."""
+        return len(self._queue) + len(self._stop_entries)
+
+    def empty(self) -> bool:
+        """Return if no entries are queued."""
+        return not self.qsize()
+
+    def _init(self, maxsize):
+        self._queue = self._scheduler
+        self._stop_entries = deque()
+
+    def _put(self, item):
+        if item[2] is None:
+            self._stop_entries.append(item)
+        else:
+            self._queue.push(item)
+
+    def _get(self):
+        if self._stop_entries:
+            return self._stop_entries.popleft()
+        return self._queue.pop()
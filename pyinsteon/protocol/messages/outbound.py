@@ -16,6 +16,7 @@ from ...data_types.all_link_record_flags import AllLinkRecordFlags
 from ...data_types.im_config_flags import IMConfigurationFlags
 from ...data_types.message_flags import MessageFlags
 from ...data_types.user_data import UserData
+from ...send_token import SEND_TOKEN
 from ...topics import (
     CANCEL_ALL_LINKING,
     GET_ALL_LINK_RECORD_FOR_SENDER,
@@ -75,10 +76,13 @@ class OutboundWriteManager:
         self._protocol_write = value
 
     def write(self, msg, priority):
-        """Write to the protocol."""
+        """Write to the protocol.
+
+        The message carries the `SendToken` of the handler sending it, if any.
+        """
         if self._protocol_write is None:
             raise AttributeError
-        self._protocol_write(msg=msg, priority=priority)
+        self._protocol_write(msg=msg, priority=priority, token=SEND_TOKEN.get())
 
 
 outbound_write_manager = OutboundWriteManager()
@@ -234,7 +238,7 @@ def set_ack_message_byte(cmd2: int, topic=pub.AUTO_TOPIC) -> Outbound:
 )
 def get_first_all_link_record(topic=pub.AUTO_TOPIC) -> Outbound:
     """Create a GET_FIRST_ALL_LINK_RECORD outbound message."""
-    _create_outbound_message(topic=topic, priority=1)
+    _create_outbound_message(topic=topic, priority=10)
 
 
 @topic_to_message_handler(
@@ -242,7 +246,7 @@ def get_first_all_link_record(topic=pub.AUTO_TOPIC) -> Outbound:
 )
 def get_next_all_link_record(topic=pub.AUTO_TOPIC) -> Outbound:
     """Create a GET_NEXT_ALL_LINK_RECORD outbound message."""
-    _create_outbound_message(topic=topic, priority=1)
+    _create_outbound_message(topic=topic, priority=10)
 
 
 @topic_to_message_handler(register_list=MESSAGE_REGISTER, topic=SET_IM_CONFIGURATION)
@@ -2,14 +2,19 @@
 
 import asyncio
 from enum import Enum
+from itertools import count
 import logging
 from queue import SimpleQueue
 from typing import Union
 
+import async_timeout
+
 from ..address import Address
 from ..constants import AckNak
 from ..utils import log_error, publish_topic
 from .command_to_msg import register_command_handlers
+from .message_dedup import MessageDeduplicator
+from .message_scheduler import MessageQueue, MessageScheduler
 from .messages.inbound import create
 from .messages.outbound import outbound_write_manager, register_outbound_handlers
 from .msg_to_topic import convert_to_topic
@@ -18,6 +23,9 @@ _LOGGER = logging.getLogger(__name__)
 _LOGGER_PYINSTEON = logging.getLogger("pyinsteon")
 _LOGGER_MSG = logging.getLogger("pyinsteon.messages")
 MAX_RECONNECT_WAIT_TIME = 300
+CONNECTION_MADE_WAIT = 0.1
+PRUNE_QUEUE_SIZE = 50
+PRUNE_WRITE_COUNT = 25
 
 
 def _get_addresses_in_msg(msg):
@@ -69,17 +77,23 @@ class TransportStatus(Enum):
 class Protocol(asyncio.Protocol):
     """Serial protocol to perform async I/O with the PLM."""
 
-    def __init__(self, connect_method, *args, **kwargs):
+    def __init__(
+        self, connect_method, *args, scheduler: MessageScheduler = None, **kwargs
+    ):
         """Init the SerialProtocol class."""
         super().__init__(*args, **kwargs)
         self._transport = None
-        self._message_queue = asyncio.PriorityQueue()
+        self._connection_made = asyncio.Event()
+        self._message_queue = MessageQueue(scheduler)
+        self._message_sequence = count()
+        self._writes_since_prune = 0
         self._last_message = SimpleQueue()
         self._buffer = bytearray()
         self._should_reconnect = True
         self._connect_method = connect_method
         self._writer_task = None
         self._writer_lock = asyncio.Lock()
+        self._deduplicator = MessageDeduplicator()
         outbound_write_manager.protocol_write = self.write
         register_outbound_handlers()
         register_command_handlers()
@@ -90,10 +104,15 @@ class Protocol(asyncio.Protocol):
         return not self._transport.is_closing() if self._transport else False
 
     @property
-    def message_queue(self):
+    def message_queue(self) -> MessageQueue:
         """Return the queue of messages to write to the transport."""
         return self._message_queue
 
+    @property
+    def deduplicator(self) -> MessageDeduplicator:
+        """Return the inbound duplicate message filter."""
+        return self._deduplicator
+
     @property
     def transport(self):
         """Return the transport."""
@@ -102,6 +121,7 @@ class Protocol(asyncio.Protocol):
     def connection_made(self, transport):
         """Run when a connection to the transport has been made."""
         self._transport = transport
+        self._connection_made.set()
         publish_topic("connection.made")
 
     def data_received(self, data):
@@ -131,7 +151,7 @@ class Protocol(asyncio.Protocol):
                 last_msg_nak = bytearray(bytes(last_msg))
                 last_msg_nak.extend(bytes([0x15]))
                 msg, _ = create(last_msg_nak)
-            if msg:
+            if msg and not self._deduplicator.is_duplicate(msg):
                 asyncio.create_task(_publish_message(msg))
                 msg = None
 
@@ -153,17 +173,22 @@ class Protocol(asyncio.Protocol):
         else:
             asyncio.create_task(self._stop_writer())
 
-    async def async_connect(self, retry=True):
-        """Connect to the transport asynchronously."""
+    async def async_connect(self, retry=True, settle=True):
+        """Connect to the transport asynchronously.
+
+        If `settle` is False the connection is attempted without an initial wait.
+        """
         wait_time = 0.1
-        await asyncio.sleep(0.5)  # Give everything time to settle
+        if settle:
+            await asyncio.sleep(0.5)  # Give everything time to settle
         while not self.connected:
             _LOGGER.debug("Attempting to connect to modem")
+            self._connection_made.clear()
             self._transport = await self._connect_method(protocol=self)
             if self._transport is None and not retry:
                 publish_topic("connection.failed")
                 raise ConnectionError("Modem did not respond to connection request")
-            await asyncio.sleep(0.1)  # Let the transport finish connecting
+            await self._async_wait_connection_made()
             if not self.connected and retry:
                 await asyncio.sleep(wait_time)
                 wait_time = min(MAX_RECONNECT_WAIT_TIME, 1.5 * wait_time)
@@ -172,6 +197,14 @@ class Protocol(asyncio.Protocol):
 
         _LOGGER.debug("Connected to modem in async_connect")
 
+    async def _async_wait_connection_made(self):
+        """Wait for the transport to finish connecting."""
+        try:
+            async with async_timeout.timeout(CONNECTION_MADE_WAIT):
+                await self._connection_made.wait()
+        except asyncio.TimeoutError:
+            pass
+
     def pause_writing(self):
         """Pause writing to the transport."""
         asyncio.ensure_future(self._stop_writer())
@@ -202,17 +235,42 @@ class Protocol(asyncio.Protocol):
         """Stop the writer task."""
         if self._writer_task:
             self._writer_task.remove_done_callback(self._start_writer)
-        await self._message_queue.put((0, None))
+        await self._message_queue.put((0, next(self._message_sequence), None, None))
 
-    def write(self, msg, priority=5):
+    def write(self, msg, priority=5, token=None):
         """Prepare data for writing to the transport.
 
         Data is actually written by _write_message to ensure a pause between writes.
         This approach minimizes NAK messages. This also allows for some messages
         to be lower priority such as 'Load ALDB' versus higher priority such as
-        'Set Light Level'.
+        'Set Light Level'. The priority sets the traffic class the scheduler
+        uses to share the modem between classes and devices.
+
+        A message with an expired or cancelled `SendToken` is dropped rather
+        than written. Once the queue holds `PRUNE_QUEUE_SIZE` messages, the
+        expired messages are removed every `PRUNE_WRITE_COUNT` writes.
         """
-        self._message_queue.put_nowait((priority, msg))
+        if token is not None and token.expired:
+            _LOGGER.debug("Message expired before it was queued: %s", repr(msg))
+            return
+        self._writes_since_prune += 1
+        if (
+            self._writes_since_prune >= PRUNE_WRITE_COUNT
+            and self._message_queue.qsize() >= PRUNE_QUEUE_SIZE
+        ):
+            self._prune_message_queue()
+        self._message_queue.put_nowait(
+            (priority, next(self._message_sequence), msg, token)
+        )
+
+    def _prune_message_queue(self):
+        """Remove the expired and cancelled messages from the queue."""
+        self._writes_since_prune = 0
+        dropped = self._message_queue.prune(
+            lambda entry: entry[3] is not None and entry[3].expired
+        )
+        if dropped:
+            _LOGGER.debug("Dropped %d expired messages", dropped)
 
     async def _write_messages(self):
         """Write data to the transport."""
@@ -225,9 +283,12 @@ class Protocol(asyncio.Protocol):
             _LOGGER.debug("Modem writer started.")
             try:
                 while self._transport and not self._transport.is_closing():
-                    _, msg = await self._message_queue.get()
+                    _, _, msg, token = await self._message_queue.get()
                     if msg is None:
                         return
+                    if token is not None and token.expired:
+                        _LOGGER.debug("Dropping expired message: %s", repr(msg))
+                        continue
                     _LOGGER_MSG.debug("TX: %s", repr(msg))
                     if (
                         _LOGGER_MSG.level == 0 or _LOGGER_MSG.level > logging.DEBUG
@@ -242,6 +303,8 @@ class Protocol(asyncio.Protocol):
                         self._last_message.get()
                     self._last_message.put(msg)
                     await self._transport.async_write(msg)
+                    if token is not None:
+                        token.mark_sent()
                     await asyncio.sleep(self._transport.write_wait)
             except RuntimeError as error:
                 _LOGGER.warning(
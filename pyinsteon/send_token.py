@@ -0,0 +1,49 @@
+"""Deadline and cancellation of queued outbound messages."""
+
+from contextvars import ContextVar
+from time import monotonic
+from typing import Callable
+
+
+class SendToken:
+    """Deadline and cancellation of a queued outbound message.
+
+    The protocol writer drops a queued message when its token is cancelled or
+    its deadline has passed. `on_sent` is called when the message is written.
+    """
+
+    def __init__(self, timeout: float = None, on_sent: Callable = None):
+        """Init the SendToken class."""
+        self._deadline = monotonic() + timeout if timeout is not None else None
+        self._cancelled = False
+        self._on_sent = on_sent
+
+    @property
+    def deadline(self) -> float:
+        """Return the monotonic time the message must be sent by or None."""
+        return self._deadline
+
+    @property
+    def cancelled(self) -> bool:
+        """Return if the message is no longer needed."""
+        return self._cancelled
+
+    @property
+    def expired(self) -> bool:
+        """Return if the message is cancelled or its deadline has passed."""
+        return self._cancelled or (
+            self._deadline is not None and monotonic() > self._deadline
+        )
+
+    def cancel(self):
+        """Cancel the message if it has not been sent."""
+        self._cancelled = True
+
+    def mark_sent(self):
+        """Mark the message as written to the modem."""
+        if self._on_sent is not None:
+            self._on_sent()
+
+
+# Token of the messages created while a handler publishes its send topic
+SEND_TOKEN: ContextVar = ContextVar("send_token", default=None)
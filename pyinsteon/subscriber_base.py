@@ -4,6 +4,7 @@ from abc import ABC
 import logging
 from typing import Callable
 
+from . import pub
 from .utils import publish_topic, subscribe_topic, unsubscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +34,11 @@ class SubscriberBase(ABC):
         """Unsubscribe to the event."""
         unsubscribe_topic(callback, self._subscriber_topic)
 
+    def _has_subscribers(self) -> bool:
+        """Return True if the event has subscribers."""
+        topic = pub.getDefaultTopicMgr().getTopic(self._subscriber_topic, okIfNone=True)
+        return topic is not None and topic.hasListeners()
+
     def _call_subscribers(self, **kwargs):
         """Call subscribers to the event."""
         publish_topic(self._subscriber_topic, **kwargs)
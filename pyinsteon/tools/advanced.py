@@ -5,14 +5,10 @@ import os
 
 import aiofiles
 
-from .. import devices
+from .. import devices, link_index
 from ..aldb.aldb_record import ALDBRecord
 from ..constants import ALDBStatus, AllLinkMode, LinkStatus
-from ..managers.link_manager import (
-    async_cancel_linking_mode,
-    async_enter_linking_mode,
-    get_broken_links,
-)
+from ..managers.link_manager import async_cancel_linking_mode, async_enter_linking_mode
 from ..managers.saved_devices_manager import aldb_rec_to_dict, dict_to_aldb_record
 from .aldb import ToolsAldb
 
@@ -185,29 +181,28 @@ class AdvancedTools(ToolsAldb):
         Useage:
             get_broken_links [--background | -b]
         """
-        broken_links = get_broken_links(devices)
+        broken_links = link_index.get_broken_links()
         log_stdout("Device   Mem Addr Target    Group Mode Status")
         log_stdout(
             "-------- -------- --------- ----- ---- ----------------------------------------"
         )
-        for address, broken_link, _ in broken_links:
-            for mem_addr, rec, status in broken_link:
-                status_txt = ""
-                if status == LinkStatus.MISSING_CONTROLLER:
-                    status_txt = "Missing controller"
-                elif status == LinkStatus.MISSING_RESPONDER:
-                    status_txt = "Missing responder"
-                elif status == LinkStatus.MISSING_TARGET:
-                    status_txt = "Target device not found"
-                elif status == LinkStatus.TARGET_DB_NOT_LOADED:
-                    status_txt = "Cannot verify - Target ALDB not loaded"
-                if rec.is_controller:
-                    link_mode = "C"
-                else:
-                    link_mode = "R"
-                log_stdout(
-                    f"{str(address)}     {mem_addr:04x} {str(rec.target)} {rec.group:5d}   {link_mode:s} {status_txt:.40s}"
-                )
+        for address, rec, status in broken_links:
+            status_txt = ""
+            if status == LinkStatus.MISSING_CONTROLLER:
+                status_txt = "Missing controller"
+            elif status == LinkStatus.MISSING_RESPONDER:
+                status_txt = "Missing responder"
+            elif status == LinkStatus.MISSING_TARGET:
+                status_txt = "Target device not found"
+            elif status == LinkStatus.TARGET_DB_NOT_LOADED:
+                status_txt = "Cannot verify - Target ALDB not loaded"
+            if rec.is_controller:
+                link_mode = "C"
+            else:
+                link_mode = "R"
+            log_stdout(
+                f"{str(address)}     {rec.mem_addr:04x} {str(rec.target)} {rec.group:5d}   {link_mode:s} {status_txt:.40s}"
+            )
 
     async def do_change_link(
         self, address, mem_addr, log_stdout=None, background=False, **kwargs
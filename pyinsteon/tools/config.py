@@ -486,4 +486,4 @@ class ToolsConfig(ToolsBase):
         for device_address in addresses:
             device = devices[device_address]
             if not device == devices.modem and device.cat != 0x03:
-                await device.async_get_engine_version()
+                await device.async_get_engine_version(force=True)
@@ -137,6 +137,7 @@ IO_SET_SENSOR_NOMINAL_VALUE = "io_set_sensor_nominal_value"
 IO_ALARM_DATA_RESPONSE = "io_alarm_data_response"
 
 ALDB_LINK_CHANGED = "aldb.link_changed"
+LINK_STATUS_CHANGED = "link_status_changed"
 
 ENGINE_VERSION = "engine_version"
 ALDB_STATUS_CHANGED = "aldb_status_changed"
@@ -0,0 +1,129 @@
+"""Test the ALDB memory image record storage."""
+
+from random import choice, randint
+from unittest import TestCase
+
+from pyinsteon.aldb.aldb_image import PACKED_RECORD, ALDBImage, PackedRecords
+from pyinsteon.aldb.aldb_record import ALDBRecord, aldb_record_to_bytes
+from tests.utils import random_address
+
+
+def _random_records(targets, count, first_mem_addr=0x0FFF):
+    """Return a dictionary of random records."""
+    records = {}
+    for index in range(count):
+        mem_addr = first_mem_addr - index * 8
+        records[mem_addr] = ALDBRecord(
+            memory=mem_addr,
+            controller=bool(randint(0, 1)),
+            group=randint(0, 3),
+            target=choice(targets),
+            data1=randint(0, 255),
+            data2=randint(0, 255),
+            data3=randint(0, 3),
+            in_use=bool(randint(0, 1)),
+            bit5=bool(randint(0, 1)),
+        )
+    return records
+
+
+class TestALDBImage(TestCase):
+    """Test the ALDB memory image record storage."""
+
+    def test_mapping(self):
+        """Test records are stored and returned as copies."""
+        targets = [random_address() for _ in range(3)]
+        records = _random_records(targets, 20)
+        image = ALDBImage(records)
+        assert len(image) == 20
+        assert list(image) == sorted(records, reverse=True)
+        for mem_addr, rec in records.items():
+            assert image[mem_addr].is_exact_match(rec)
+            assert image[mem_addr].is_bit5_set == rec.is_bit5_set
+            assert image[mem_addr] is not rec
+
+        # Records above the first record and off the slot boundary
+        high_rec = records[0x0FFF].copy()
+        high_rec.mem_addr = 0x1007
+        image[0x1007] = high_rec
+        odd_rec = records[0x0FF7].copy()
+        odd_rec.mem_addr = 0x0FF5
+        image[0x0FF5] = odd_rec
+        assert list(image)[:3] == [0x1007, 0x0FFF, 0x0FF7]
+        assert 0x0FF5 in image
+        assert image[0x1007].is_exact_match(high_rec)
+
+        del image[0x1007]
+        del image[0x0FF5]
+        del image[0x0FFF - 19 * 8]
+        assert len(image) == 19
+        assert 0x0FFF - 19 * 8 not in image
+        assert image.get(0x0FFF - 19 * 8) is None
+        copy = image.copy()
+        del copy[0x0FFF]
+        assert 0x0FFF in image
+
+    def test_find(self):
+        """Test finding records in the image matches record equality."""
+        targets = [random_address() for _ in range(3)]
+        records = _random_records(targets, 200)
+        image = ALDBImage(records)
+        odd_rec = records[0x0FFF].copy()
+        odd_rec.mem_addr = 0x0001
+        records[0x0001] = odd_rec
+        image[0x0001] = odd_rec
+
+        criteria = [
+            {"target": targets[0]},
+            {"target": targets[1], "group": 1, "is_controller": False},
+            {"group": 0, "data3": 2, "is_controller": False},
+            {"group": 2, "data3": 1, "in_use": True},
+            {"target": targets[2], "in_use": False},
+        ]
+        for kwargs in criteria:
+            test_rec = ALDBRecord(
+                memory=None,
+                controller=kwargs.get("is_controller"),
+                group=kwargs.get("group"),
+                target=kwargs.get("target"),
+                data1=None,
+                data2=None,
+                data3=kwargs.get("data3"),
+            )
+            in_use = kwargs.get("in_use")
+            expected = [
+                mem_addr
+                for mem_addr in sorted(records, reverse=True)
+                if records[mem_addr] == test_rec
+                and (in_use is None or records[mem_addr].is_in_use == in_use)
+            ]
+            found = [rec.mem_addr for rec in image.find(**kwargs)]
+            assert found == expected, kwargs
+
+    def test_packed_links(self):
+        """Test the links of packed records match the decoded records."""
+        targets = [random_address() for _ in range(3)]
+        records = _random_records(targets, 20)
+        records[0x0FFF - 20 * 8] = ALDBRecord(
+            memory=0x0FFF - 20 * 8,
+            controller=False,
+            group=0,
+            target="000000",
+            data1=0,
+            data2=0,
+            data3=0,
+            in_use=True,
+            high_water_mark=True,
+        )
+        packed = PackedRecords(
+            b"".join(
+                PACKED_RECORD.pack(mem_addr, aldb_record_to_bytes(rec))
+                for mem_addr, rec in records.items()
+            )
+        )
+        expected = {
+            mem_addr: (rec.target, rec.group, rec.is_controller)
+            for mem_addr, rec in records.items()
+            if rec.is_in_use and not rec.is_high_water_mark
+        }
+        assert packed.links() == expected
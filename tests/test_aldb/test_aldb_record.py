@@ -3,7 +3,11 @@ from random import randint
 from unittest import TestCase
 
 from pyinsteon.address import Address
-from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.aldb.aldb_record import (
+    ALDBRecord,
+    aldb_record_from_bytes,
+    aldb_record_to_bytes,
+)
 from tests.utils import random_address
 
 
@@ -306,3 +310,34 @@ class TestAldbRecord(TestCase):
         assert base_rec != ne_rec_group
         assert base_rec != ne_rec_target
         assert base_rec != ne_rec_data3
+
+    def test_to_from_bytes(self):
+        """Test converting a record to and from device memory bytes."""
+        mem_addr = 0x0FFF
+        target = random_address()
+        rec = ALDBRecord(
+            memory=mem_addr,
+            controller=True,
+            group=randint(0, 254),
+            target=target,
+            data1=randint(0, 254),
+            data2=randint(0, 254),
+            data3=randint(0, 254),
+            in_use=True,
+            high_water_mark=False,
+            bit5=True,
+            bit4=False,
+        )
+        rec_bytes = aldb_record_to_bytes(rec)
+        assert len(rec_bytes) == 8
+        assert rec_bytes[0] == rec.control_flags
+        assert rec_bytes[2:5] == bytes(target)
+        assert rec_bytes[7] == rec.data3
+
+        new_rec = aldb_record_from_bytes(mem_addr, rec_bytes)
+        assert new_rec.is_exact_match(rec)
+        assert new_rec.mem_addr == mem_addr
+
+        hwm_rec = aldb_record_from_bytes(0x0FF7, bytes(8))
+        assert hwm_rec.is_high_water_mark
+        assert not hwm_rec.is_in_use
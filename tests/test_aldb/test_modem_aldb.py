@@ -1,11 +1,15 @@
 """Test the modem ALDB."""
 
+import asyncio
 from unittest import TestCase
 from pyinsteon import pub
 from pyinsteon.aldb import modem_aldb
 from pyinsteon.topics import ALL_LINK_RECORD_RESPONSE
 
+from pyinsteon.aldb.aldb_record import ALDBRecord
 from pyinsteon.aldb.modem_aldb import ModemALDB
+from pyinsteon.constants import ALDBStatus, ReadWriteMode, ResponseStatus
+from pyinsteon.managers.aldb_im_write_manager import ImWriteManager
 
 from ..utils import async_case, random_address
 
@@ -42,4 +46,153 @@ class TestModemALDB(TestCase):
         listeners = topic.getListeners()
         assert len(listeners) == 1
         
-        
\ No newline at end of file
+        
+    @async_case
+    async def test_bulk_write_eeprom(self):
+        """Test the modem ALDB writes are planned into the fewest writes."""
+        aldb = ModemALDB(random_address())
+        aldb.read_write_mode = ReadWriteMode.EEPROM
+        aldb._write_manager = MockImWriteManager()
+        aldb.load_saved_records(ALDBStatus.LOADED, _modem_records())
+
+        aldb.remove(0x1FF7)
+        new_target = random_address()
+        aldb.add(group=5, target=new_target, controller=True)
+        aldb.add(group=6, target=random_address(), controller=False)
+        aldb.modify(0x1FFF, data1=9)
+
+        success, failed = await aldb.async_write()
+        assert success == 4
+        assert failed == 0
+        written = [rec.mem_addr for rec in aldb._write_manager.written]
+        assert written == [0x1FFF, 0x1FF7, 0x1FE7]
+        assert aldb[0x1FF7].target == new_target
+        assert aldb[0x1FF7].group == 5
+        assert aldb[0x1FFF].data1 == 9
+        assert aldb[0x1FDF].is_high_water_mark
+
+    @async_case
+    async def test_bulk_write_standard(self):
+        """Test standard mode writes deletes first and keeps failures."""
+        aldb = ModemALDB(random_address())
+        aldb.read_write_mode = ReadWriteMode.STANDARD
+        aldb._write_manager = MockImWriteManager()
+        records = _modem_records()
+        aldb.load_saved_records(ALDBStatus.LOADED, records)
+
+        # Delete and add of the same link is written as one change
+        aldb.remove(0x1FEF)
+        aldb.add(
+            group=records[0x1FEF].group,
+            target=records[0x1FEF].target,
+            controller=False,
+            data1=0x11,
+            data3=records[0x1FEF].data3,
+        )
+        aldb.remove(0x1FFF)
+        aldb.add(group=7, target=random_address(), controller=True)
+        aldb._write_manager.fail_mem_addr = 0x1FE7
+
+        success, failed = await aldb.async_write()
+        assert success == 2
+        assert failed == 1
+        written = aldb._write_manager.written
+        assert [rec.is_in_use for rec in written] == [False, True, True]
+        assert written[0].mem_addr == 0x1FFF
+        assert aldb[0x1FEF].data1 == 0x11
+        assert list(aldb.pending_changes) == [-1]
+
+    @async_case
+    async def test_eeprom_write_window(self):
+        """Test EEPROM writes wait for their ACK within a window."""
+        aldb = ModemALDB(random_address())
+        aldb.read_write_mode = ReadWriteMode.EEPROM
+        records = _modem_records()
+        aldb.load_saved_records(ALDBStatus.LOADED, records)
+        manager = ImWriteManager(aldb)
+        to_write = [
+            _modem_record(
+                mem_addr,
+                controller=True,
+                group=mem_addr & 0xFF,
+                target=random_address(),
+            )
+            for mem_addr in range(0x0FFF, 0x0FCF, -8)
+        ]
+        sent = []
+
+        def _record_sent(mem_hi, mem_low, flags, group, target, data1, data2, data3):
+            sent.append((mem_hi << 8) + mem_low + 7)
+
+        def _send_ack(mem_addr):
+            pub.sendMessage(
+                "ack.write_eeprom",
+                mem_addr=mem_addr,
+                flags=0,
+                group=0,
+                target=random_address(),
+                data1=0,
+                data2=0,
+                data3=0,
+            )
+
+        pub.subscribe(_record_sent, "send.write_eeprom")
+        try:
+            task = asyncio.create_task(manager.async_write_records(to_write))
+            await asyncio.sleep(0.05)
+            # Only the window of writes is sent before any ACK is received
+            assert sent == [0x0FFF, 0x0FF7, 0x0FEF, 0x0FE7]
+            for mem_addr in reversed(sent):
+                _send_ack(mem_addr)
+            await asyncio.sleep(0.05)
+            assert sent[4:] == [0x0FDF, 0x0FD7]
+            _send_ack(0x0FDF)
+            _send_ack(0x0FD7)
+            results = await task
+        finally:
+            pub.unsubscribe(_record_sent, "send.write_eeprom")
+        assert results == [ResponseStatus.SUCCESS] * 6
+
+
+
+class MockImWriteManager:
+    """Mock the ImWriteManager."""
+
+    def __init__(self):
+        """Init the MockImWriteManager class."""
+        self.written = []
+        self.fail_mem_addr = None
+
+    async def async_write_records(self, records, force=False):
+        """Mock writing a set of records."""
+        results = []
+        for record in records:
+            self.written.append(record)
+            if record.mem_addr == self.fail_mem_addr:
+                results.append(ResponseStatus.FAILURE)
+            else:
+                results.append(ResponseStatus.SUCCESS)
+        return results
+
+
+def _modem_record(mem_addr, **kwargs):
+    """Return a modem ALDB record."""
+    return ALDBRecord(mem_addr, data1=0, data2=0, data3=0, **kwargs)
+
+
+def _modem_records():
+    """Return a set of modem ALDB records."""
+    records = [
+        _modem_record(0x1FFF, controller=True, group=0, target=random_address()),
+        _modem_record(0x1FF7, controller=False, group=1, target=random_address()),
+        _modem_record(0x1FEF, controller=False, group=2, target=random_address()),
+        _modem_record(
+            0x1FE7,
+            controller=False,
+            group=0,
+            target="000000",
+            in_use=False,
+            high_water_mark=True,
+        ),
+    ]
+    return {rec.mem_addr: rec for rec in records}
@@ -0,0 +1,237 @@
+"""Test matching direct responses to direct commands."""
+
+import asyncio
+from time import monotonic
+import unittest
+
+from pyinsteon.constants import MessageFlagType, ResponseStatus
+from pyinsteon.handlers.to_device.off import OffCommand
+from pyinsteon.handlers.to_device.on_level import OnLevelCommand
+from pyinsteon.handlers.transaction_manager import (
+    TRANSACTIONS,
+    CommandSuperseded,
+    TransactionManager,
+)
+from pyinsteon.topics import OFF, ON
+from pyinsteon.utils import build_topic
+
+from tests.utils import TopicItem, async_case, random_address, send_topics
+
+
+def _ack(address, group, on_level, topic=ON, cmd1=0x11):
+    """Return the modem ACK of an ON command."""
+    return TopicItem(
+        build_topic(topic, "ack", address, group, MessageFlagType.DIRECT),
+        {"cmd1": cmd1, "cmd2": on_level, "user_data": None},
+        0.05,
+    )
+
+
+def _direct_ack(address, on_level, topic=ON, cmd1=0x11):
+    """Return the direct ACK of an ON command."""
+    return TopicItem(
+        build_topic(topic, None, address, None, MessageFlagType.DIRECT_ACK),
+        {
+            "cmd1": cmd1,
+            "cmd2": on_level,
+            "target": "000001",
+            "user_data": None,
+            "hops_left": 3,
+        },
+        0.01,
+    )
+
+
+class TestDirectResponse(unittest.TestCase):
+    """Test matching direct responses to direct commands."""
+
+    @async_case
+    async def test_direct_ack_before_ack(self):
+        """Test a direct ACK received before the modem ACK."""
+        address = random_address()
+        on_levels = []
+
+        def handle_on_level(on_level):
+            on_levels.append(on_level)
+
+        cmd = OnLevelCommand(address, 1)
+        cmd.subscribe(handle_on_level)
+        direct_ack = _direct_ack(address, 0x55)
+        send_topics([direct_ack._replace(delay=0.05), _ack(address, 1, 0x55)])
+        start = monotonic()
+        result = await cmd.async_send(on_level=0x55)
+        assert result == ResponseStatus.SUCCESS
+        assert monotonic() - start < 0.5
+        assert on_levels == [0x55]
+
+    @async_case
+    async def test_acked_command_first(self):
+        """Test the direct ACK belongs to the command acknowledged by the modem."""
+        address = random_address()
+        on_levels = {}
+
+        def handler(group):
+            def handle_on_level(on_level):
+                on_levels[group] = on_level
+
+            return handle_on_level
+
+        cmd_1 = OnLevelCommand(address, 1)
+        cmd_2 = OnLevelCommand(address, 2)
+        handler_1 = handler(1)
+        handler_2 = handler(2)
+        cmd_1.subscribe(handler_1)
+        cmd_2.subscribe(handler_2)
+        # Group 2 is acknowledged while the group 1 command waits for its ACK
+        send_topics(
+            [
+                _ack(address, 2, 0x22),
+                _direct_ack(address, 0x22),
+                _ack(address, 1, 0x11),
+                _direct_ack(address, 0x11),
+            ]
+        )
+        result = await cmd_1.async_send(on_level=0x11)
+        assert result == ResponseStatus.SUCCESS
+        assert on_levels == {1: 0x11, 2: 0x22}
+
+    @async_case
+    async def test_transactions(self):
+        """Test commands to different devices are sent while others are in flight."""
+        manager = TransactionManager(max_in_flight=2)
+        address_a = random_address()
+        address_b = random_address()
+        address_c = random_address()
+        started = []
+        release = {}
+
+        async def _async_command(name, address):
+            async with manager.async_transaction(address):
+                started.append(name)
+                release[name] = asyncio.Event()
+                await release[name].wait()
+
+        tasks = [
+            asyncio.create_task(_async_command(name, address))
+            for name, address in [
+                ("a1", address_a),
+                ("a2", address_a),
+                ("b", address_b),
+                ("c", address_c),
+            ]
+        ]
+        await asyncio.sleep(0.01)
+        # a2 waits for a1 and c waits for an in-flight slot
+        assert started == ["a1", "b"]
+
+        release["a1"].set()
+        await asyncio.sleep(0.01)
+        assert started == ["a1", "b", "a2"]
+
+        release["b"].set()
+        await asyncio.sleep(0.01)
+        assert started == ["a1", "b", "a2", "c"]
+
+        release["a2"].set()
+        release["c"].set()
+        await asyncio.gather(*tasks)
+        assert not manager.in_flight
+
+    @async_case
+    async def test_transaction_priority(self):
+        """Test interactive commands are not limited and waiters start by priority."""
+        manager = TransactionManager(max_in_flight=1)
+        started = []
+        release = {}
+
+        async def _async_command(name, priority):
+            async with manager.async_transaction(random_address(), priority=priority):
+                started.append(name)
+                release[name] = asyncio.Event()
+                await release[name].wait()
+
+        tasks = []
+        for name, priority in [("bulk1", 10), ("bulk2", 10), ("status", 7), ("on", 3)]:
+            tasks.append(asyncio.create_task(_async_command(name, priority)))
+            await asyncio.sleep(0.01)
+        # The interactive command is sent while the in-flight slot is used
+        assert started == ["bulk1", "on"]
+
+        release["on"].set()
+        release["bulk1"].set()
+        await asyncio.sleep(0.01)
+        # The status request is started before the earlier bulk command
+        assert started == ["bulk1", "on", "status"]
+
+        release["status"].set()
+        await asyncio.sleep(0.01)
+        assert started == ["bulk1", "on", "status", "bulk2"]
+
+        release["bulk2"].set()
+        await asyncio.gather(*tasks)
+        assert not manager.in_flight
+
+    @async_case
+    async def test_supersede_waiting_transaction(self):
+        """Test a waiting transaction is superseded by one with the same key."""
+        manager = TransactionManager()
+        manager.coalesce = True
+        address = random_address()
+        release = asyncio.Event()
+        results = {}
+
+        async def _async_command(name, key):
+            try:
+                async with manager.async_transaction(address, key) as outcome:
+                    await release.wait()
+                    results[name] = name
+                    if outcome is not None:
+                        outcome.set_result(name)
+            except CommandSuperseded as ex:
+                results[name] = await ex.outcome
+
+        tasks = [
+            asyncio.create_task(_async_command(name, key))
+            for name, key in [("a", "state"), ("b", "state"), ("c", "state")]
+        ]
+        await asyncio.sleep(0.01)
+        # b is superseded by c while a is in flight
+        assert results == {}
+        release.set()
+        await asyncio.gather(*tasks)
+        assert results == {"a": "a", "b": "c", "c": "c"}
+
+    @async_case
+    async def test_coalesce_state_commands(self):
+        """Test a waiting ON command is superseded by a newer OFF command."""
+        address = random_address()
+        on_levels = []
+
+        def handle_on_level(on_level):
+            on_levels.append(on_level)
+
+        cmd_on = OnLevelCommand(address, 1)
+        cmd_off = OffCommand(address, 1)
+        cmd_on.subscribe(handle_on_level)
+        cmd_off.subscribe(handle_on_level)
+        TRANSACTIONS.coalesce = True
+        try:
+            send_topics(
+                [
+                    _ack(address, 1, 0x11),
+                    _direct_ack(address, 0x11),
+                    _ack(address, 1, 0x00, OFF, 0x13),
+                    _direct_ack(address, 0x00, OFF, 0x13),
+                ]
+            )
+            results = await asyncio.gather(
+                cmd_on.async_send(on_level=0x11),
+                cmd_on.async_send(on_level=0x22),
+                cmd_off.async_send(),
+            )
+        finally:
+            TRANSACTIONS.coalesce = False
+
+        assert results == [ResponseStatus.SUCCESS] * 3
+        # The ON command at 0x22 is never sent
+        assert on_levels == [0x11, 0x00]
@@ -0,0 +1,81 @@
+"""Test the write EEPROM command handler."""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from pyinsteon import pub
+from pyinsteon.constants import ResponseStatus
+from pyinsteon.handlers import write_eeprom
+from pyinsteon.handlers.write_eeprom import WriteEepromHandler
+from pyinsteon.send_token import SEND_TOKEN
+
+from tests.utils import async_case, random_address
+
+
+class TestWriteEeprom(unittest.TestCase):
+    """Test the write EEPROM command handler."""
+
+    @async_case
+    async def test_eeprom_write_timeout(self):
+        """Test the EEPROM write ACK timeout starts when the message is written."""
+        handler = WriteEepromHandler()
+        handler.msg_timeout = 0.3
+        tokens = []
+        record = {
+            "in_use": True,
+            "high_water_mark": False,
+            "controller": True,
+            "group": 1,
+            "target": random_address(),
+            "data1": 0,
+            "data2": 0,
+            "data3": 0,
+            "bit5": True,
+            "bit4": False,
+        }
+
+        def _record_sent(mem_hi, mem_low, flags, group, target, data1, data2, data3):
+            tokens.append(SEND_TOKEN.get())
+
+        def _send_ack(mem_addr):
+            pub.sendMessage(
+                "ack.write_eeprom",
+                mem_addr=mem_addr,
+                flags=0,
+                group=0,
+                target=random_address(),
+                data1=0,
+                data2=0,
+                data3=0,
+            )
+
+        pub.subscribe(_record_sent, "send.write_eeprom")
+        try:
+            with patch.object(write_eeprom, "WRITE_TIMEOUT", 0.1):
+                # Time waiting in the queue does not count towards the ACK timeout
+                task = asyncio.create_task(handler.async_write(0x0FFF, **record))
+                await asyncio.sleep(0.15)
+                assert not task.done()
+                tokens[0].mark_sent()
+                await asyncio.sleep(0.05)
+                assert not task.done()
+                _send_ack(0x0FFF)
+                assert await task == ResponseStatus.SUCCESS
+
+                # A write without an ACK fails, is dropped and its late ACK ignored
+                task = asyncio.create_task(handler.async_write(0x0FF7, **record))
+                await asyncio.sleep(0.01)
+                tokens[1].mark_sent()
+                assert await task == ResponseStatus.FAILURE
+                assert tokens[1].expired
+                _send_ack(0x0FF7)
+                await asyncio.sleep(0.05)
+                assert handler.message_response.empty()
+
+                # A write still queued after the message timeout is dropped
+                result = await handler.async_write(0x0FEF, **record)
+                assert result == ResponseStatus.FAILURE
+                assert tokens[2].expired
+        finally:
+            pub.unsubscribe(_record_sent, "send.write_eeprom")
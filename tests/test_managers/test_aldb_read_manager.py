@@ -2,6 +2,7 @@
 import asyncio
 from random import randint
 import unittest
+from unittest.mock import patch
 
 import async_timeout
 
@@ -9,6 +10,7 @@ from pyinsteon.address import Address
 from pyinsteon.aldb.aldb_record import ALDBRecord
 from pyinsteon.constants import ReadWriteMode
 from pyinsteon.data_types.user_data import UserData
+from pyinsteon.managers import aldb_read_manager
 from pyinsteon.managers.aldb_read_manager import ALDBReadManager
 from pyinsteon.topics import EXTENDED_READ_WRITE_ALDB, PEEK, SET_ADDRESS_MSB
 
@@ -227,6 +229,68 @@ class TestAldbReadManager(unittest.TestCase):
                 await mgr.async_stop()
         assert rec_num == len(records)
 
+    @async_case
+    async def test_read_range_standard(self):
+        """Test reading a range of records using the standard method."""
+        address = random_address()
+        mgr = ALDBReadManager(address=address, first_record=0x0FFF)
+        records = gen_records(num_recs=10)
+        mem_addr = records[2].mem_addr
+        user_data = UserData(
+            {
+                "d1": 0x00,
+                "d2": 0x00,
+                "d3": mem_addr >> 8,
+                "d4": mem_addr & 0xFF,
+                "d5": 3,
+            }
+        )
+
+        ack_topic = f"ack.{address.id}.{EXTENDED_READ_WRITE_ALDB}.direct"
+        ack_topic_item = TopicItem(
+            ack_topic, {"cmd1": 0x2F, "cmd2": 0, "user_data": user_data}, 0.2
+        )
+
+        dir_ack_topic = f"{address.id}.{EXTENDED_READ_WRITE_ALDB}.direct_ack"
+        dir_ack_topic_item = TopicItem(
+            dir_ack_topic,
+            {
+                "cmd1": 0x2F,
+                "cmd2": 0,
+                "target": MODEM_ADDRESS,
+                "user_data": None,
+                "hops_left": 3,
+            },
+            0.2,
+        )
+        topic_items = [ack_topic_item, dir_ack_topic_item]
+        for rec in records[2:5]:
+            topic_items.append(create_response_topic_item(address, rec))
+        send_topics(topic_items)
+
+        read_records = []
+        async with async_timeout.timeout(3):
+            async for rec in mgr.async_read(mem_addr=mem_addr, num_recs=3):
+                read_records.append(rec)
+        assert len(read_records) == 3
+        for rec, record in zip(read_records, records[2:5]):
+            assert rec.is_exact_match(record)
+
+    def test_record_timeout(self):
+        """Test the record timeout adapts to the record latency."""
+        mgr = ALDBReadManager(address=random_address(), first_record=0x0FFF)
+        assert mgr.record_timeout == aldb_read_manager.TIMER_RECORD
+
+        curr_time = 100.0
+        with patch.object(aldb_read_manager, "monotonic", lambda: curr_time):
+            mgr._update_latency(99.9)  # pylint: disable=protected-access
+        assert mgr.record_timeout == aldb_read_manager.TIMER_RECORD_MIN
+
+        with patch.object(aldb_read_manager, "monotonic", lambda: curr_time):
+            for _ in range(20):
+                mgr._update_latency(95.0)  # pylint: disable=protected-access
+        assert mgr.record_timeout == aldb_read_manager.TIMER_RECORD
+
     @async_case
     async def test_read_one_peek(self):
         """Test reading one record using the PEEK method."""
@@ -0,0 +1,156 @@
+"""Test writing operating flags and extended properties."""
+
+import asyncio
+from time import monotonic
+import unittest
+from unittest.mock import patch
+
+from pyinsteon.config.operating_flag import OperatingFlag
+from pyinsteon.constants import EngineVersion, ResponseStatus
+from pyinsteon.device_types.dimmable_lighting_control import (
+    DimmableLightingControl_LampLinc,
+)
+from pyinsteon.managers import get_set_ext_property_manager
+from pyinsteon.managers.get_set_ext_property_manager import (
+    GetSetExtendedPropertyManager,
+)
+from pyinsteon.managers.get_set_op_flag_manager import GetSetOperatingFlagsManager
+
+from tests.utils import async_case, random_address
+
+
+class TestConfigWrite(unittest.TestCase):
+    """Test writing operating flags and extended properties."""
+
+    @async_case
+    async def test_ext_property_fields_written_once(self):
+        """Test dirty bit properties sharing a data field are written together."""
+        sent = []
+
+        class MockExtendedSetCommand:
+            """Mock the extended set command."""
+
+            def __init__(self, address, data1, data2):
+                """Init the MockExtendedSetCommand class."""
+                self._data = (data1, data2)
+
+            async def async_send(self, data3):
+                """Send the mock command."""
+                sent.append((*self._data, data3))
+                return ResponseStatus.SUCCESS
+
+        manager = GetSetExtendedPropertyManager(random_address())
+        bits = [manager.create(f"bit_{bit}", 1, 3, bit, 0x09) for bit in range(4)]
+        on_level = manager.create("on_level", 1, 5, None, 0x06)
+        for bit, prop in enumerate(bits):
+            prop.set_value(bit == 3)
+        on_level.set_value(0x20)
+
+        bits[0].new_value = True
+        bits[1].new_value = True
+        on_level.new_value = 0xFF
+        with patch.object(
+            get_set_ext_property_manager,
+            "ExtendedSetCommand",
+            MockExtendedSetCommand,
+        ):
+            result = await manager.async_write()
+
+        assert result == ResponseStatus.SUCCESS
+        # Bit 3 keeps its value
+        assert sent == [(1, 0x09, 0b1011), (1, 0x06, 0xFF)]
+        assert manager.write_results == {
+            "bit_0": ResponseStatus.SUCCESS,
+            "bit_1": ResponseStatus.SUCCESS,
+            "on_level": ResponseStatus.SUCCESS,
+        }
+        assert bits[0].value and bits[1].value and bits[3].value
+        assert not bits[2].value
+        assert on_level.value == 0xFF
+
+    @async_case
+    async def test_op_flag_extended_fallback(self):
+        """Test the extended set command is used after a checksum NAK."""
+        address = random_address()
+        op_flags = {}
+        manager = GetSetOperatingFlagsManager(address, op_flags)
+        for name, bit, set_cmd, unset_cmd in [
+            ("flag_0", 0, 0x00, 0x01),
+            ("flag_1", 1, 0x02, 0x03),
+            ("flag_2", 2, None, None),
+        ]:
+            op_flags[name] = OperatingFlag(address, name, bool)
+            op_flags[name].set_value(False)
+            manager.subscribe(name, 0, bit, set_cmd, unset_cmd)
+
+        sent = []
+
+        async def _async_send(cmd, extended=False):
+            sent.append((cmd, extended))
+            if not extended:
+                return ResponseStatus.DIRECT_NAK_CHECK_SUM
+            return ResponseStatus.SUCCESS
+
+        op_flags["flag_0"].new_value = True
+        op_flags["flag_1"].new_value = True
+        with patch.object(manager._set_command, "async_send", _async_send):
+            result = await manager.async_write()
+
+        assert result == ResponseStatus.SUCCESS
+        assert sent == [(0x00, False), (0x00, True), (0x02, True)]
+        assert manager.extended_write
+        assert manager.write_results == {
+            "flag_0": ResponseStatus.SUCCESS,
+            "flag_1": ResponseStatus.SUCCESS,
+        }
+        assert op_flags["flag_0"].value and op_flags["flag_1"].value
+
+    @async_case
+    async def test_op_flag_extended_by_engine_version(self):
+        """Test I2 and I2CS devices use the extended set command up front."""
+        for version, extended in [
+            (EngineVersion.I1, False),
+            (EngineVersion.I2, True),
+            (EngineVersion.I2CS, True),
+        ]:
+            device = DimmableLightingControl_LampLinc(
+                random_address(), 0x01, 0x01, 0x01
+            )
+            device.engine_version = version
+            assert device._op_flags_manager.extended_write == extended
+
+    @async_case
+    async def test_ext_property_read_groups(self):
+        """Test each group is read when the previous response is received."""
+        manager = GetSetExtendedPropertyManager(random_address())
+        props = {
+            group: manager.create(f"prop_{group}", group, 3, None, 0x05)
+            for group in [1, 2, 3]
+        }
+        sent = []
+
+        async def _async_send(group):
+            sent.append(group)
+            loop = asyncio.get_running_loop()
+            if len(sent) > 1:
+                # A late duplicate response to the previous request
+                loop.call_later(
+                    0.01, manager._update_all_fields, sent[-2], {"data3": sent[-2]}
+                )
+            if len(sent) != 2:
+                loop.call_later(
+                    0.05, manager._update_all_fields, group, {"data3": group}
+                )
+            return ResponseStatus.SUCCESS
+
+        with patch.object(manager._get_command, "async_send", _async_send):
+            start = monotonic()
+            result = await manager.async_read()
+            elapsed = monotonic() - start
+
+        assert result == ResponseStatus.SUCCESS
+        # The second request has no response and is retried
+        assert sent == [1, 2, 2, 3]
+        assert elapsed < 1.5
+        for group, prop in props.items():
+            assert prop.value == group
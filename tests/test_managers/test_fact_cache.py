@@ -0,0 +1,117 @@
+"""Test the device fact cache."""
+
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from pyinsteon.aldb.aldb_base import HWM_RECORD
+from pyinsteon.aldb.aldb_record import new_aldb_record_from_existing
+from pyinsteon.constants import ALDBStatus, EngineVersion, ResponseStatus
+from pyinsteon.device_types.dimmable_lighting_control import (
+    DimmableLightingControl_LampLinc,
+)
+from pyinsteon.managers import fact_cache
+from pyinsteon.managers.fact_cache import ALDB, ENGINE_VERSION, OP_FLAGS, FactCache
+
+from tests.utils import async_case, random_address
+
+
+def _mock_device():
+    """Return a device with the configuration reads mocked."""
+    device = DimmableLightingControl_LampLinc(random_address(), 0x01, 0x01, 0x01)
+
+    async def _async_engine_version():
+        device.engine_version = EngineVersion.I2CS
+        return ResponseStatus.SUCCESS
+
+    async def _async_load_aldb():
+        hwm = new_aldb_record_from_existing(HWM_RECORD, mem_addr=0x0FFF)
+        device.aldb.load_saved_records(ALDBStatus.LOADED, {0x0FFF: hwm})
+        return ALDBStatus.LOADED
+
+    device._handlers["engine_version_cmd"].async_send = AsyncMock(
+        side_effect=_async_engine_version
+    )
+    device._op_flags_manager.async_read = AsyncMock(return_value=ResponseStatus.SUCCESS)
+    device._op_flags_manager.async_write = AsyncMock(
+        return_value=ResponseStatus.SUCCESS
+    )
+    device._ext_property_manager.async_read = AsyncMock(
+        return_value=ResponseStatus.SUCCESS
+    )
+    device.aldb.async_load = AsyncMock(side_effect=_async_load_aldb)
+    return device
+
+
+def _call_counts(device):
+    """Return the number of reads of each configuration setting."""
+    return [
+        device._handlers["engine_version_cmd"].async_send.call_count,
+        device._op_flags_manager.async_read.call_count,
+        device._ext_property_manager.async_read.call_count,
+        device.aldb.async_load.call_count,
+    ]
+
+
+class TestFactCache(unittest.TestCase):
+    """Test the device fact cache."""
+
+    def test_ttl(self):
+        """Test facts expire after their TTL or when invalidated."""
+        now = 1000
+        with patch.object(fact_cache, "monotonic", lambda: now):
+            cache = FactCache({OP_FLAGS: 10})
+            assert not cache.is_fresh(OP_FLAGS)
+            cache.update(OP_FLAGS, ENGINE_VERSION)
+            assert cache.is_fresh(OP_FLAGS)
+            now = 1011
+            assert not cache.is_fresh(OP_FLAGS)
+            assert cache.is_fresh(ENGINE_VERSION)
+            cache.invalidate(ENGINE_VERSION)
+            assert not cache.is_fresh(ENGINE_VERSION)
+
+    @async_case
+    async def test_read_config(self):
+        """Test fresh settings are not read again unless forced."""
+        device = _mock_device()
+        await device.async_read_config()
+        assert _call_counts(device) == [1, 1, 1, 1]
+
+        result = await device.async_read_config()
+        assert result == ResponseStatus.SUCCESS
+        assert _call_counts(device) == [1, 1, 1, 1]
+
+        await device.async_read_config(force=True)
+        assert _call_counts(device) == [2, 2, 2, 2]
+
+        # A write invalidates the operating flags
+        device.operating_flags[next(iter(device.operating_flags))].new_value = True
+        await device.async_write_op_flags()
+        assert device.fact_cache.is_fresh(ALDB)
+        await device.async_read_config()
+        assert _call_counts(device) == [2, 3, 2, 2]
+
+        # An ALDB that is not fully loaded is read again
+        device.aldb.load_saved_records(ALDBStatus.PARTIAL, {})
+        assert not device.fact_cache.is_fresh(ALDB)
+        await device.async_read_config()
+        assert _call_counts(device) == [2, 3, 2, 3]
+
+    @async_case
+    async def test_aldb_write_keeps_fact(self):
+        """Test a link written by the library does not make the ALDB stale."""
+        device = _mock_device()
+        await device.async_read_config()
+        assert device.fact_cache.is_fresh(ALDB)
+
+        with patch.object(
+            device.aldb._write_manager,
+            "async_write",
+            AsyncMock(return_value=ResponseStatus.SUCCESS),
+        ):
+            device.aldb.add(group=0, target=random_address(), controller=True)
+            assert await device.aldb.async_write() == (1, 0)
+
+        assert len(device.aldb) == 2
+        assert device.fact_cache.is_fresh(ALDB)
+        await device.async_read_config()
+        assert _call_counts(device) == [1, 1, 1, 1]
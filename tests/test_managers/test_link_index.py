@@ -0,0 +1,206 @@
+"""Test the link consistency index."""
+
+import unittest
+from unittest.mock import patch
+
+import pyinsteon
+from pyinsteon.address import Address
+from pyinsteon.aldb.aldb_record import ALDBRecord
+from pyinsteon.constants import ALDBStatus, DeviceAction, LinkStatus
+from pyinsteon.device_types.dimmable_lighting_control import DimmableLightingControl
+from pyinsteon.managers.link_manager import get_broken_links
+from pyinsteon.managers.link_manager.link_index import LinkIndex
+from pyinsteon.subscriber_base import SubscriberBase
+
+from tests.utils import async_case, random_address
+
+
+class MockDevices(SubscriberBase):
+    """Mock the device manager."""
+
+    def __init__(self):
+        """Init the MockDevices class."""
+        super().__init__(subscriber_topic=f"mock_devices_{random_address().id}")
+        self._devices = {}
+        self.modem = None
+
+    def __iter__(self):
+        """Return an iterator of device addresses."""
+        return iter(list(self._devices))
+
+    def get(self, address):
+        """Return a device from an address."""
+        return self._devices.get(Address(address))
+
+    def add(self, device):
+        """Add a device."""
+        self._devices[device.address] = device
+        self._call_subscribers(address=device.address.id, action=DeviceAction.ADDED)
+
+    def remove(self, address):
+        """Remove a device."""
+        self._devices.pop(address)
+        self._call_subscribers(address=address.id, action=DeviceAction.REMOVED)
+
+
+def _create_device():
+    """Create a device."""
+    return DimmableLightingControl(random_address(), 0x01, 0x02, 0x03, "Test", "Model")
+
+
+def _load_links(device, links):
+    """Load a device ALDB with links of (target, group, is_controller)."""
+    records = {}
+    mem_addr = 0x0FFF
+    for target, group, is_controller in links:
+        records[mem_addr] = ALDBRecord(
+            mem_addr, is_controller, group, target, data1=0, data2=0, data3=1
+        )
+        mem_addr -= 8
+    records[mem_addr] = ALDBRecord(
+        mem_addr,
+        controller=False,
+        group=0,
+        target="000000",
+        data1=0,
+        data2=0,
+        data3=0,
+        in_use=False,
+        high_water_mark=True,
+    )
+    device.aldb.load_saved_records(ALDBStatus.LOADED, records)
+
+
+class TestLinkIndex(unittest.TestCase):
+    """Test the link consistency index."""
+
+    def setUp(self):
+        """Set up the test."""
+        self.changes = []
+
+    def _link_status_changed(self, address, record, status):
+        """Record a link status change."""
+        self.changes.append((Address(address), record.group, status))
+
+    @async_case
+    async def test_incremental_status(self):
+        """Test links break and heal as the ALDB records change."""
+        devices = MockDevices()
+        controller = _create_device()
+        responder = _create_device()
+        _load_links(controller, [(responder.address, 1, True)])
+        _load_links(responder, [])
+        devices.add(controller)
+        devices.add(responder)
+
+        index = LinkIndex(devices)
+        index.subscribe(self._link_status_changed)
+        broken = index.get_broken_links()
+        assert len(broken) == 1
+        address, record, status = broken[0]
+        assert address == controller.address
+        assert record.mem_addr == 0x0FFF
+        assert status == LinkStatus.MISSING_RESPONDER
+
+        _load_links(responder, [(controller.address, 1, False)])
+        assert not index.get_broken_links()
+        assert index.get_link_status(controller.address, 0x0FFF) == LinkStatus.FOUND
+        assert (controller.address, 1, LinkStatus.FOUND) in self.changes
+
+        self.changes = []
+        devices.remove(responder.address)
+        assert self.changes == [
+            (controller.address, 1, LinkStatus.MISSING_TARGET),
+        ]
+
+        devices.add(responder)
+        assert not index.get_broken_links()
+
+        self.changes = []
+        responder.aldb.clear()
+        assert self.changes == [
+            (controller.address, 1, LinkStatus.MISSING_RESPONDER),
+        ]
+
+    @async_case
+    async def test_get_broken_links(self):
+        """Test finding broken links from the live link index."""
+        controller = _create_device()
+        responder = _create_device()
+        missing = random_address()
+        _load_links(
+            controller,
+            [(responder.address, 1, True), (responder.address, 2, True)],
+        )
+        _load_links(
+            responder,
+            [(controller.address, 1, False), (missing, 3, False)],
+        )
+        devices = MockDevices()
+        devices.add(controller)
+        devices.add(responder)
+        index = LinkIndex(devices)
+        with patch.object(pyinsteon, "link_index", index), patch.object(
+            LinkIndex, "_sync_device"
+        ) as sync_device:
+            broken = {
+                (address, rec.group): status
+                for address, rec, status in get_broken_links(devices)
+            }
+        # The records are not indexed again
+        sync_device.assert_not_called()
+        assert broken == {
+            (controller.address, 2): LinkStatus.MISSING_RESPONDER,
+            (responder.address, 3): LinkStatus.MISSING_TARGET,
+        }
+
+    @async_case
+    async def test_group_lookup(self):
+        """Test finding the links to a target by group."""
+        devices = MockDevices()
+        modem = _create_device()
+        responder_1 = _create_device()
+        responder_2 = _create_device()
+        _load_links(modem, [(responder_1.address, 20, True)])
+        _load_links(
+            responder_1, [(modem.address, 20, False), (modem.address, 21, False)]
+        )
+        _load_links(responder_2, [(modem.address, 20, False)])
+        devices.add(responder_1)
+        devices.add(responder_2)
+
+        index = LinkIndex(devices)
+        assert index.get_groups(modem.address, is_controller=False) == [20, 21]
+        links = index.get_links_to(modem.address, is_controller=False, group=20)
+        assert sorted(address for address, _ in links) == sorted(
+            [responder_1.address, responder_2.address]
+        )
+        assert len(index.get_links_to(modem.address, is_controller=False)) == 3
+
+        # The modem is not announced in the device list
+        assert not index.has_link(modem.address, responder_1.address, 20, True)
+        devices._devices[modem.address] = modem  # pylint: disable=protected-access
+        devices.modem = modem
+        assert index.has_link(modem.address, responder_1.address, 20, True)
+
+        responder_2.aldb.clear()
+        assert index.get_groups(modem.address, is_controller=False) == [20, 21]
+        links = index.get_links_to(modem.address, is_controller=False, group=20)
+        assert [address for address, _ in links] == [responder_1.address]
+
+    @async_case
+    async def test_modem_indexed(self):
+        """Test links to the modem are found without announcing the modem."""
+        devices = MockDevices()
+        modem = _create_device()
+        responder = _create_device()
+        _load_links(modem, [(responder.address, 1, True)])
+        _load_links(responder, [(modem.address, 1, False)])
+        index = LinkIndex(devices)
+        index.subscribe(self._link_status_changed)
+        devices._devices[modem.address] = modem  # pylint: disable=protected-access
+        devices.modem = modem
+        devices.add(responder)
+        assert not self.changes
+        assert not index.get_broken_links()
+        assert index.get_link_status(modem.address, 0x0FFF) == LinkStatus.FOUND
@@ -0,0 +1,84 @@
+"""Test the link change planner."""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from pyinsteon.constants import ReadWriteMode, ResponseStatus
+from pyinsteon.managers.link_manager.link_planner import (
+    DEVICE_MESSAGE_TIME,
+    MESSAGES_PER_RECORD,
+    LinkPlanner,
+)
+
+from tests.test_managers.test_link_index import _create_device, _load_links
+from tests.utils import async_case
+
+
+class TestLinkPlanner(unittest.TestCase):
+    """Test the link change planner."""
+
+    @async_case
+    async def test_minimal_changes(self):
+        """Test only changed records are planned and existing slots are reused."""
+        controller = _create_device()
+        responder = _create_device()
+        _load_links(controller, [(responder.address, 1, True)])
+        _load_links(responder, [(controller.address, 1, False)])
+
+        planner = LinkPlanner()
+        planner.link_devices(controller, responder, 1, data3=1)
+        assert planner.is_complete
+
+        planner.link_devices(controller, responder, 2)
+        planner.remove_link(controller, responder.address, group=1)
+        assert planner.pending == {controller.address: 2, responder.address: 1}
+        removed = [
+            rec for rec in controller.aldb.pending_changes.values() if not rec.is_in_use
+        ]
+        assert [rec.mem_addr for rec in removed] == [0x0FFF]
+
+        responder.aldb.read_write_mode = ReadWriteMode.PEEK_POKE
+        assert planner.message_count == 2 + MESSAGES_PER_RECORD[ReadWriteMode.PEEK_POKE]
+        assert planner.duration == planner.message_count * DEVICE_MESSAGE_TIME
+
+    @async_case
+    async def test_execute_and_resume(self):
+        """Test writing with bounded concurrency and resuming after a failure."""
+        devices = [_create_device() for _ in range(4)]
+        target = _create_device()
+        running = 0
+        max_running = 0
+        fail = {devices[1].address}
+
+        def _mock_write(device):
+            async def _async_write(force=False):
+                nonlocal running, max_running
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                if device.address in fail:
+                    return 0, len(device.aldb.pending_changes)
+                device.aldb.clear_pending()
+                return 1, 0
+
+            return _async_write
+
+        planner = LinkPlanner()
+        for device in devices:
+            _load_links(device, [])
+            device.aldb.async_write = AsyncMock(side_effect=_mock_write(device))
+            planner.add_link(device, target, 1, False)
+
+        result = await planner.async_execute(max_concurrent=2)
+        assert result != ResponseStatus.SUCCESS
+        assert max_running == 2
+        assert planner.results[devices[1].address] == ResponseStatus.FAILURE
+        assert planner.pending == {devices[1].address: 1}
+
+        fail.clear()
+        assert await planner.async_execute() == ResponseStatus.SUCCESS
+        assert planner.is_complete
+        assert devices[0].aldb.async_write.call_count == 1
+        assert devices[1].aldb.async_write.call_count == 2
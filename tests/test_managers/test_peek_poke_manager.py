@@ -3,8 +3,10 @@ import asyncio
 import random
 import unittest
 
+from pyinsteon.aldb.aldb_record import ALDBRecord, aldb_record_to_bytes
 from pyinsteon.managers.peek_poke_manager import PeekPokeManager
-from pyinsteon.topics import PEEK, POKE, SET_ADDRESS_MSB
+from pyinsteon.topics import ALDB_LINK_CHANGED, PEEK, POKE, SET_ADDRESS_MSB
+from pyinsteon.utils import publish_topic
 
 from .. import set_log_levels
 from ..utils import TopicItem, async_case, cmd_kwargs, random_address, send_topics
@@ -124,3 +126,72 @@ class TestPeekPokeManager(unittest.TestCase):
         await asyncio.sleep(0.1)
         assert result == 0x01
         assert poke_response_recieved
+
+    @async_case
+    async def test_poke_known_value(self):
+        """Test poking a value already in the memory image sends no commands."""
+        orig_value = random.randint(0, 255)
+        poke_response_recieved = False
+        commands_sent = []
+
+        def get_poke_value(mem_addr, value):
+            nonlocal poke_response_recieved
+            assert value == orig_value
+            poke_response_recieved = True
+
+        addr = random_address()
+        mem_addr = 0x0FFF
+        mgr = PeekPokeManager(addr)
+        mgr.subscribe_poke(get_poke_value)
+        mgr._memory[mem_addr] = orig_value  # pylint: disable=protected-access
+
+        async def mock_send(*args, **kwargs):
+            commands_sent.append(kwargs)
+
+        mgr._set_msb_cmd.async_send = mock_send  # pylint: disable=protected-access
+        mgr._peek_cmd.async_send = mock_send  # pylint: disable=protected-access
+        mgr._poke_cmd.async_send = mock_send  # pylint: disable=protected-access
+
+        result = await mgr.async_poke(mem_addr=mem_addr, value=orig_value)
+        assert result == 0x01
+        assert poke_response_recieved
+        assert not commands_sent
+
+    @async_case
+    async def test_memory_invalidation(self):
+        """Test the memory image is invalidated by ALDB record changes."""
+        # pylint: disable=protected-access
+        addr = random_address()
+        mgr = PeekPokeManager(addr)
+        rec = ALDBRecord(
+            memory=0x0FFF,
+            controller=True,
+            group=1,
+            target=random_address(),
+            data1=3,
+            data2=2,
+            data3=1,
+        )
+        rec_bytes = aldb_record_to_bytes(rec)
+        for offset in range(0, 8):
+            mgr._memory[0x0FF8 + offset] = rec_bytes[offset]
+        mgr._memory[0x0FF7] = 0
+
+        topic = f"{addr.id}.{ALDB_LINK_CHANGED}"
+        publish_topic(topic, record=rec, sender=addr, deleted=False)
+        assert len(mgr.memory) == 9
+
+        new_rec = ALDBRecord(
+            memory=0x0FFF,
+            controller=True,
+            group=2,
+            target=rec.target,
+            data1=3,
+            data2=2,
+            data3=1,
+        )
+        publish_topic(topic, record=new_rec, sender=addr, deleted=False)
+        assert mgr.memory == {0x0FF7: 0}
+
+        mgr.invalidate()
+        assert not mgr.memory
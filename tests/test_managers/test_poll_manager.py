@@ -0,0 +1,125 @@
+"""Test polling devices that do not report their state."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import unittest
+
+from pyinsteon.constants import ResponseStatus
+from pyinsteon.device_types.dimmable_lighting_control import (
+    DimmableLightingControl_LampLinc,
+)
+from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers.device_manager import DeviceManager
+from pyinsteon.managers.poll_manager import BACKOFF_BASE, MIN_POLL_RATE, PollManager
+
+from tests.utils import async_case, random_address
+
+
+def _create_devices(addresses, polled, result=ResponseStatus.SUCCESS):
+    """Return a device manager with a dimmer for each address."""
+    devices = DeviceManager()
+    devices.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+    for address in addresses:
+        device = DimmableLightingControl_LampLinc(address, 0x01, 0x01, 0x01)
+
+        def _status(device):
+            async def _async_status(group=None, max_age=None):
+                polled.append(device.address)
+                if result == ResponseStatus.SUCCESS:
+                    device.groups[1].set_value(255)
+                return result
+
+            return _async_status
+
+        device.async_status = _status(device)
+        devices[address] = device
+    return devices
+
+
+def _set_last_update(device, seconds_ago):
+    """Set the time the device state was last received."""
+    device.groups[1].set_value(0)
+    device.groups[1]._last_update = datetime.now() - timedelta(seconds=seconds_ago)
+
+
+class TestPollManager(unittest.TestCase):
+    """Test polling devices that do not report their state."""
+
+    @async_case
+    async def test_poll_order(self):
+        """Test the stale targets are polled by priority then staleness."""
+        addresses = [random_address() for _ in range(4)]
+        polled = []
+        devices = _create_devices(addresses, polled)
+        poll_manager = PollManager(devices, rate=6000)
+        _set_last_update(devices[addresses[0]], 100)
+        _set_last_update(devices[addresses[1]], 300)
+        _set_last_update(devices[addresses[2]], 200)
+        _set_last_update(devices[addresses[3]], 30)
+        poll_manager.add(addresses[0], max_age=60)
+        poll_manager.add(addresses[1], max_age=60)
+        poll_manager.add(addresses[2], max_age=60, priority=1)
+        # Not stale
+        poll_manager.add(addresses[3], max_age=60)
+        await asyncio.sleep(0.2)
+        poll_manager.stop()
+
+        assert polled == [addresses[2], addresses[1], addresses[0]]
+        assert poll_manager.next_target() is None
+
+    @async_case
+    async def test_backoff(self):
+        """Test a target that does not respond is not polled until the backoff."""
+        address = random_address()
+        polled = []
+        devices = _create_devices([address], polled, ResponseStatus.FAILURE)
+        poll_manager = PollManager(devices, rate=6000)
+        poll_manager.add(address, max_age=60, group=1)
+        await asyncio.sleep(0.2)
+        poll_manager.stop()
+
+        target = poll_manager.targets[(address, 1)]
+        assert polled == [address]
+        assert target.failures == 1
+        assert target.next_attempt - datetime.now() > timedelta(
+            seconds=BACKOFF_BASE - 1
+        )
+        assert poll_manager.next_target() is None
+
+    @async_case
+    async def test_yield_to_queued_messages(self):
+        """Test polling waits until the modem write queue is empty."""
+        address = random_address()
+        polled = []
+        devices = _create_devices([address], polled)
+        message_queue = asyncio.PriorityQueue()
+        message_queue.put_nowait((1, "on"))
+        devices.modem.protocol = SimpleNamespace(message_queue=message_queue)
+        poll_manager = devices.poll_manager
+        poll_manager.rate = 6000
+        poll_manager.add(address, max_age=60)
+        await asyncio.sleep(0.2)
+        assert not polled
+
+        message_queue.get_nowait()
+        await asyncio.sleep(0.7)
+        await devices.async_close()
+        assert polled == [address]
+
+    @async_case
+    async def test_rate_is_positive(self):
+        """Test a rate of zero or less is raised to the minimum poll rate."""
+        address = random_address()
+        polled = []
+        devices = _create_devices([address], polled)
+        poll_manager = PollManager(devices, rate=0)
+        assert poll_manager.rate == MIN_POLL_RATE
+
+        poll_manager.rate = -10
+        assert poll_manager.rate == MIN_POLL_RATE
+        poll_manager.add(address, max_age=60)
+        await asyncio.sleep(0.1)
+        assert polled == [address]
+        assert not poll_manager._poll_task.done()
+        poll_manager.stop()
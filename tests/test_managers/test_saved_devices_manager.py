@@ -0,0 +1,220 @@
+"""Test saving and loading devices."""
+
+import asyncio
+import gc
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from pyinsteon.aldb import aldb_image
+from pyinsteon.constants import EngineVersion
+from pyinsteon.device_types.device_base import Device
+from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers.device_link_manager import DeviceLinkManager
+from pyinsteon.managers.device_manager import ENGINE_VERSION_CONCURRENCY, DeviceManager
+from pyinsteon.managers.device_snapshot import DeviceSnapshot, SnapshotError
+from pyinsteon.managers.link_manager.link_index import LinkIndex
+from pyinsteon.managers.saved_devices_manager import (
+    DEVICE_INFO_FILE,
+    SNAPSHOT_FILE,
+    SavedDeviceManager,
+    json_to_snapshot,
+    snapshot_to_json,
+)
+
+from tests.utils import async_case
+
+FIXTURE_FILE = os.path.join(os.path.dirname(__file__), "..", "devices_fixture.json")
+
+
+def _aldb_values(aldb):
+    """Return the exact values of the records in an ALDB."""
+    return {mem_addr: repr(rec) + str(rec) for mem_addr, rec in aldb.items()}
+
+
+class TestSavedDeviceManager(unittest.TestCase):
+    """Test saving and loading devices."""
+
+    def setUp(self):
+        """Set up the test."""
+        self.workdir = tempfile.mkdtemp()
+        shutil.copy(FIXTURE_FILE, os.path.join(self.workdir, DEVICE_INFO_FILE))
+
+    def tearDown(self):
+        """Tear down the test."""
+        shutil.rmtree(self.workdir)
+        # Collect the devices created here before another test publishes to them
+        gc.collect()
+
+    def test_json_round_trip(self):
+        """Test the snapshot converts to and from JSON without loss."""
+        with open(FIXTURE_FILE, encoding="utf-8") as fixture:
+            device_dicts = json.load(fixture)
+        snapshot = DeviceSnapshot(json_to_snapshot(device_dicts))
+        assert len(snapshot) == len(device_dicts)
+        exported = json.loads(json.dumps(snapshot_to_json(snapshot)))
+        assert exported == device_dicts
+
+        with self.assertRaises(SnapshotError):
+            DeviceSnapshot(b"not a snapshot")
+
+    @async_case
+    async def test_load_from_snapshot(self):
+        """Test devices saved to the snapshot load the same as from JSON."""
+        modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        manager = SavedDeviceManager(self.workdir, modem)
+        device_list = await manager.async_load()
+        device_list[modem.address] = modem
+        await manager.async_save(device_list)
+        assert os.path.exists(os.path.join(self.workdir, SNAPSHOT_FILE))
+
+        snapshot_modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        manager = SavedDeviceManager(self.workdir, snapshot_modem)
+        snapshot_devices = await manager.async_load()
+
+        # Without the snapshot the JSON file is used
+        os.remove(os.path.join(self.workdir, SNAPSHOT_FILE))
+        json_modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        manager = SavedDeviceManager(self.workdir, json_modem)
+        json_devices = await manager.async_load()
+
+        assert json_devices
+        assert _aldb_values(snapshot_modem.aldb) == _aldb_values(json_modem.aldb)
+        assert list(snapshot_devices) == list(json_devices)
+        for address, device in snapshot_devices.items():
+            json_device = json_devices[address]
+            assert type(device) is type(json_device)
+            assert device.engine_version == json_device.engine_version
+            assert device.aldb.status == json_device.aldb.status
+            assert device.aldb.first_mem_addr == json_device.aldb.first_mem_addr
+            assert _aldb_values(device.aldb) == _aldb_values(json_device.aldb)
+            for flag in device.operating_flags:
+                assert (
+                    device.operating_flags[flag].value
+                    == json_device.operating_flags[flag].value
+                )
+
+    @async_case
+    async def test_snapshot_aldb_decoded_on_access(self):
+        """Test the ALDB records in a snapshot are decoded when first accessed."""
+        modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        manager = SavedDeviceManager(self.workdir, modem)
+        device_list = await manager.async_load()
+        device_list[modem.address] = modem
+        await manager.async_save(device_list)
+
+        manager = SavedDeviceManager(
+            self.workdir, Hub("111111", 0x03, 51, 165, "Instoen modem")
+        )
+        with patch.object(
+            aldb_image,
+            "aldb_record_from_bytes",
+            wraps=aldb_image.aldb_record_from_bytes,
+        ) as decode:
+            snapshot_devices = await manager.async_load()
+            assert decode.call_count == 0
+
+            address, device = next(
+                (address, device)
+                for address, device in snapshot_devices.items()
+                if len(device_list[address].aldb)
+            )
+            assert device.aldb.is_loaded == device_list[address].aldb.is_loaded
+            assert len(device.aldb) == len(device_list[address].aldb)
+            assert decode.call_count == len(device.aldb)
+            assert _aldb_values(device.aldb) == _aldb_values(device_list[address].aldb)
+            assert decode.call_count == len(device.aldb)
+
+    @async_case
+    async def test_snapshot_replaced(self):
+        """Test loaded records remain valid when the snapshot is saved again."""
+        modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        manager = SavedDeviceManager(self.workdir, modem)
+        device_list = await manager.async_load()
+        await manager.async_save(device_list)
+        snapshot_devices = await manager.async_load()
+
+        # A shorter snapshot would truncate a file still mapped by the views
+        await manager.async_save({modem.address: modem})
+        assert os.listdir(self.workdir).count(SNAPSHOT_FILE) == 1
+        assert not [
+            name
+            for name in os.listdir(self.workdir)
+            if name.startswith(f"{SNAPSHOT_FILE}.")
+        ]
+        for address, device in snapshot_devices.items():
+            assert _aldb_values(device.aldb) == _aldb_values(device_list[address].aldb)
+
+    @async_case
+    async def test_snapshot_load_not_decoded(self):
+        """Test loading a snapshot indexes the links without decoding records."""
+        modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        manager = SavedDeviceManager(self.workdir, modem)
+        device_list = await manager.async_load()
+        device_list[modem.address] = modem
+        await manager.async_save(device_list)
+
+        devices = DeviceManager()
+        devices.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        link_index = LinkIndex(devices)
+        link_manager = DeviceLinkManager(devices)
+        with patch.object(
+            aldb_image,
+            "aldb_record_from_bytes",
+            wraps=aldb_image.aldb_record_from_bytes,
+        ) as decode, patch.object(
+            Device, "async_get_engine_version", AsyncMock()
+        ), patch.object(
+            devices, "async_save", AsyncMock()
+        ):
+            await devices.async_load(self.workdir, 0, 0)
+            await asyncio.sleep(0.3)
+            assert link_index.get_groups(devices.modem.address, False)
+            assert decode.call_count == 0
+            assert link_manager.links
+
+    @async_case
+    async def test_deferred_engine_version(self):
+        """Test unknown engine versions are read after the load returns."""
+        unknown = ["1a1a1a", "3c3c3c", "4d4d4d", "5e5e5e"]
+        device_file = os.path.join(self.workdir, DEVICE_INFO_FILE)
+        with open(device_file, encoding="utf-8") as saved:
+            device_dicts = json.load(saved)
+        for device_dict in device_dicts:
+            if device_dict["address"] in unknown:
+                device_dict["engine_version"] = 0xFF
+        with open(device_file, "w", encoding="utf-8") as saved:
+            json.dump(device_dicts, saved)
+
+        running = 0
+        max_running = 0
+        release = asyncio.Event()
+
+        async def _mock_get_engine_version(device):
+            nonlocal running, max_running
+            if devices[device.address] is not device:
+                return
+            running += 1
+            max_running = max(max_running, running)
+            await release.wait()
+            running -= 1
+            device.engine_version = EngineVersion.I2CS
+
+        devices = DeviceManager()
+        devices.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+        with patch.object(
+            Device, "async_get_engine_version", _mock_get_engine_version
+        ), patch.object(devices, "async_save", AsyncMock()):
+            await devices.async_load(self.workdir, 0, 0)
+            assert devices["1a1a1a"].engine_version == EngineVersion.UNKNOWN
+            assert not devices.engine_version_task.done()
+            await asyncio.sleep(0.05)
+            assert max_running == ENGINE_VERSION_CONCURRENCY
+            release.set()
+            await devices.engine_version_task
+            for address in unknown:
+                assert devices[address].engine_version == EngineVersion.I2CS
+            devices.async_save.assert_awaited_once_with(self.workdir)
@@ -0,0 +1,163 @@
+"""Test saving and restoring the device state."""
+
+import asyncio
+from datetime import datetime, timedelta
+import gc
+import shutil
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from pubsub import pub
+
+from pyinsteon.config import PROGRAM_LOCK_ON
+from pyinsteon.constants import EngineVersion, ResponseStatus
+from pyinsteon.device_types.dimmable_lighting_control import (
+    DimmableLightingControl_LampLinc,
+)
+from pyinsteon.device_types.hub import Hub
+from pyinsteon.managers import state_snapshot_manager
+from pyinsteon.managers.device_manager import DeviceManager
+from pyinsteon.managers.state_snapshot_manager import StateSnapshotManager
+
+from tests.utils import async_case, random_address
+
+
+def _create_devices(addresses):
+    """Return a device manager with a dimmer for each address."""
+    devices = DeviceManager()
+    devices.modem = Hub("111111", 0x03, 51, 165, "Instoen modem")
+    for address in addresses:
+        devices[address] = DimmableLightingControl_LampLinc(address, 0x01, 0x01, 0x01)
+    return devices
+
+
+class TestStateSnapshotManager(unittest.TestCase):
+    """Test saving and restoring the device state."""
+
+    def setUp(self):
+        """Set up the test."""
+        self.workdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Tear down the test."""
+        shutil.rmtree(self.workdir)
+        gc.collect()
+
+    @async_case
+    async def test_save_restore(self):
+        """Test the restored state is marked stale with its saved time."""
+        addresses = [random_address() for _ in range(2)]
+        devices = _create_devices(addresses)
+        state_manager = StateSnapshotManager(devices, self.workdir)
+        state_manager.start()
+        device = devices[addresses[0]]
+        device.groups[1].value = 120
+        device.engine_version = EngineVersion.I2CS
+        device.product_id = 0x1234
+        device.operating_flags[PROGRAM_LOCK_ON].set_value(True)
+        assert device.last_communication_received > datetime.now() - timedelta(1)
+        assert not device.groups[1].is_stale
+        await state_manager.async_close()
+        # Group changes are not listened to once the manager is closed
+        topic = pub.getDefaultTopicMgr().getTopic(device.groups[1].topic)
+        assert not topic.hasListener(state_manager._state_changed)
+
+        devices = _create_devices(addresses)
+        state_manager = StateSnapshotManager(devices, self.workdir)
+        await state_manager.async_restore()
+        restored = devices[addresses[0]]
+        assert restored.groups[1].value == 120
+        assert restored.groups[1].is_stale
+        assert restored.groups[1].last_update == device.groups[1].last_update
+        assert restored.engine_version == EngineVersion.I2CS
+        assert restored.product_id == 0x1234
+        assert restored.operating_flags[PROGRAM_LOCK_ON].value
+        assert (
+            restored.last_communication_received == device.last_communication_received
+        )
+        assert devices[addresses[1]].groups[1].value is None
+
+        # Receiving the value clears the stale flag
+        restored.groups[1].set_value(120)
+        assert not restored.groups[1].is_stale
+
+    @async_case
+    async def test_verify_oldest_first(self):
+        """Test the verifier refreshes the old stale devices oldest first."""
+        addresses = [random_address() for _ in range(3)]
+        devices = _create_devices(addresses)
+        state_manager = StateSnapshotManager(devices, self.workdir)
+        for index, address in enumerate(addresses):
+            devices[address].groups[1].load_value(
+                255, datetime.now() - timedelta(hours=index + 1, minutes=1)
+            )
+        recent = random_address()
+        devices[recent] = DimmableLightingControl_LampLinc(recent, 0x01, 0x01, 0x01)
+        devices[recent].groups[1].load_value(255, datetime.now())
+        devices[addresses[1]].operating_flags[PROGRAM_LOCK_ON].set_value(False)
+        state_manager._facts[(addresses[1].id, PROGRAM_LOCK_ON)] = (
+            False,
+            (datetime.now() - timedelta(days=2)).timestamp(),
+        )
+
+        refreshed = []
+
+        def _status(device):
+            async def _async_status(group=None):
+                refreshed.append(device.address)
+                device.groups[1].set_value(255)
+                return ResponseStatus.SUCCESS
+
+            return _async_status
+
+        for address in [*addresses, recent]:
+            devices[address].async_status = _status(devices[address])
+        read_op_flags = AsyncMock(return_value=ResponseStatus.SUCCESS)
+        devices[addresses[1]].async_read_op_flags = read_op_flags
+
+        with patch.object(state_snapshot_manager, "VERIFY_DELAY", 0):
+            await state_manager.async_verify(concurrency=1)
+        # The recently saved value is not requested
+        assert refreshed == list(reversed(addresses))
+        assert devices[recent].groups[1].is_stale
+        read_op_flags.assert_awaited_once()
+        for address in addresses:
+            assert not devices[address].groups[1].is_stale
+        assert state_manager._op_flags_age(devices[addresses[1]]) < 60
+
+        # Nothing is stale after the refresh
+        refreshed.clear()
+        await state_manager.async_verify()
+        assert not refreshed
+        await asyncio.sleep(0)
+
+    @async_case
+    async def test_verify_as_values_age(self):
+        """Test a restored value is requested once it reaches its max age."""
+        address = random_address()
+        devices = _create_devices([address])
+        device = devices[address]
+        device.groups[1].load_value(255, datetime.now())
+        refreshed = []
+
+        async def _async_status(group=None):
+            refreshed.append(device.address)
+            device.groups[1].set_value(255)
+            return ResponseStatus.SUCCESS
+
+        device.async_status = _async_status
+        state_manager = StateSnapshotManager(devices, self.workdir)
+        with patch.object(state_snapshot_manager, "STATUS_MAX_AGE", 0.5), patch.object(
+            state_snapshot_manager, "VERIFY_MARGIN", 0.1
+        ), patch.object(state_snapshot_manager, "VERIFY_DELAY", 0):
+            state_manager.start()
+            await asyncio.sleep(0.3)
+            # The restored value is not old enough to request
+            assert not refreshed
+            assert device.groups[1].is_stale
+
+            await asyncio.sleep(0.5)
+            assert refreshed == [address]
+            assert not device.groups[1].is_stale
+        await state_manager.async_close()
@@ -6,6 +6,7 @@ import unittest
 from unittest.mock import AsyncMock
 
 from pyinsteon.constants import ResponseStatus
+from pyinsteon.groups.on_level import OnLevel
 from pyinsteon.managers.status_manager import StatusManager
 from pyinsteon.utils import subscribe_topic, unsubscribe_topic
 
@@ -120,3 +121,38 @@ class TestStatusManager(unittest.TestCase):
         await status_manager.async_status()
         await asyncio.sleep(5)
         assert handler.call_count == 2
+
+    @async_case
+    async def test_status_max_age(self):
+        """Test status requests are skipped when the status is fresh."""
+        address = random_address()
+        group = OnLevel("on_level", address, group=1)
+        status_manager = StatusManager(address=address, groups={1: group})
+        responses = []
+
+        def handle_on_level(db_version, status):
+            responses.append(status)
+            group.set_value(status)
+
+        status_manager.add_status_type(status_type=0, callback_function=handle_on_level)
+
+        result = await status_manager.async_status(max_age=0.5)
+        assert result == ResponseStatus.SUCCESS
+        assert len(responses) == 1
+        assert group.value == 0x33
+
+        # The status is fresh
+        result = await status_manager.async_status(max_age=0.5)
+        assert result == ResponseStatus.SUCCESS
+        assert len(responses) == 1
+
+        # The status is stale until the group value is received again
+        await asyncio.sleep(0.6)
+        assert not status_manager.is_fresh(0, 0.5)
+        group.set_value(0x33)
+        await status_manager.async_status(max_age=0.5)
+        assert len(responses) == 1
+
+        # No max_age always sends the status request
+        await status_manager.async_status()
+        assert len(responses) == 2
@@ -0,0 +1,95 @@
+"""Test the shared timer manager."""
+
+import asyncio
+import unittest
+
+from pyinsteon.managers.timer_manager import TimerManager
+
+from tests.utils import async_case
+
+
+class TestTimerManager(unittest.TestCase):
+    """Test the shared timer manager."""
+
+    def setUp(self):
+        """Set up the test."""
+        self.calls = []
+
+    def _callback(self, name):
+        """Record a timer callback."""
+        self.calls.append(name)
+
+    async def _async_callback(self, name):
+        """Record a timer coroutine callback."""
+        self.calls.append(name)
+
+    @async_case
+    async def test_call_later_order(self):
+        """Test timers run in deadline order."""
+        manager = TimerManager()
+        manager.call_later(0.2, self._callback, "second")
+        manager.call_later(0.1, self._callback, "first")
+        manager.call_later(0.3, self._async_callback, "third")
+        assert len(manager) == 3
+        await asyncio.sleep(0.4)
+        assert self.calls == ["first", "second", "third"]
+        assert len(manager) == 0
+
+    @async_case
+    async def test_cancel(self):
+        """Test a cancelled timer does not run."""
+        manager = TimerManager()
+        timer = manager.call_later(0.1, self._callback, "cancelled")
+        manager.call_later(0.1, self._callback, "run")
+        timer.cancel()
+        assert not timer.active
+        await asyncio.sleep(0.2)
+        assert self.calls == ["run"]
+
+    @async_case
+    async def test_rearm(self):
+        """Test a timer can be moved later, earlier and reactivated."""
+        manager = TimerManager()
+        timer = manager.call_later(0.1, self._callback, "rearm")
+        timer.rearm(0.3)
+        await asyncio.sleep(0.2)
+        assert not self.calls
+        timer.rearm(0.05)
+        await asyncio.sleep(0.1)
+        assert self.calls == ["rearm"]
+        assert not timer.active
+
+        timer.rearm(0.05)
+        timer.cancel()
+        timer.rearm(0.1)
+        await asyncio.sleep(0.2)
+        assert self.calls == ["rearm", "rearm"]
+        assert len(manager) == 0
+
+    @async_case
+    async def test_self_rearm(self):
+        """Test a timer can reschedule itself from its callback."""
+        manager = TimerManager()
+        timer = None
+
+        def _callback():
+            self.calls.append("tick")
+            if len(self.calls) < 3:
+                timer.rearm(0.05)
+
+        timer = manager.call_later(0.05, _callback)
+        await asyncio.sleep(0.3)
+        assert self.calls == ["tick", "tick", "tick"]
+
+    @async_case
+    async def test_coroutine_error_logged(self):
+        """Test an exception raised by a timer coroutine is logged."""
+        manager = TimerManager()
+
+        async def _async_callback():
+            raise ValueError("timer failed")
+
+        manager.call_later(0.05, _async_callback)
+        with self.assertLogs("pyinsteon.managers.timer_manager", "ERROR") as logs:
+            await asyncio.sleep(0.1)
+        assert any("timer failed" in line for line in logs.output)
@@ -0,0 +1,146 @@
+"""Test the battery device wake command manager."""
+
+import unittest
+
+from pyinsteon.constants import ResponseStatus
+from pyinsteon.device_types.general_controller import GeneralController_RemoteLinc
+from pyinsteon.managers.wake_manager import WAKE_WINDOW, WakeCommandManager
+
+from tests.utils import async_case, random_address
+
+
+class MockBatteryDevice:
+    """Mock battery device commands."""
+
+    def __init__(self):
+        """Init the MockBatteryDevice class."""
+        self.calls = []
+
+    async def async_status(self, group=None):
+        """Mock the status command."""
+        self.calls.append(("async_status", group))
+        return ResponseStatus.SUCCESS
+
+    async def async_read_op_flags(self):
+        """Mock the read operating flags command."""
+        self.calls.append(("async_read_op_flags",))
+        return ResponseStatus.SUCCESS
+
+    async def async_load_on_wake(self, mem_addr=0, num_recs=0, refresh=False):
+        """Mock the ALDB load command."""
+        self.calls.append(("async_load_on_wake", mem_addr, num_recs, refresh))
+        return ResponseStatus.SUCCESS
+
+    async def async_set_heat_set_point(self, temperature):
+        """Mock the set heat set point command."""
+        self.calls.append(("async_set_heat_set_point", temperature))
+        return ResponseStatus.SUCCESS
+
+
+class TestWakeCommandManager(unittest.TestCase):
+    """Test the battery device wake command manager."""
+
+    def test_merge_redundant_commands(self):
+        """Test redundant requests are merged."""
+        device = MockBatteryDevice()
+        manager = WakeCommandManager()
+        manager.add(device.async_read_op_flags)
+        manager.add(device.async_read_op_flags, retries=5)
+        manager.add(device.async_load_on_wake, mem_addr=0, num_recs=0, refresh=False)
+        manager.add(device.async_load_on_wake, mem_addr=0, num_recs=0, refresh=True)
+        manager.add(device.async_status, group=1)
+        manager.add(device.async_status, group=2)
+        assert len(manager) == 4
+
+        batch = manager.pop_batch()
+        assert not manager
+        op_flags = [cmd for cmd in batch if cmd.name == "async_read_op_flags"][0]
+        assert op_flags.retries == 5
+        load = [cmd for cmd in batch if cmd.name == "async_load_on_wake"][0]
+        assert load.kwargs["refresh"]
+
+    def test_set_commands_keyed_by_arguments(self):
+        """Test set commands are only merged when their arguments match."""
+        device = MockBatteryDevice()
+        manager = WakeCommandManager()
+        manager.add(device.async_set_heat_set_point, temperature=68)
+        manager.add(device.async_set_heat_set_point, temperature=70)
+        manager.add(device.async_set_heat_set_point, temperature=70)
+        batch = manager.pop_batch()
+        assert [cmd.kwargs for cmd in batch] == [
+            {"temperature": 68},
+            {"temperature": 70},
+        ]
+
+    def test_order_and_estimate(self):
+        """Test commands are ordered by value and the duration is estimated."""
+        device = MockBatteryDevice()
+        manager = WakeCommandManager()
+        manager.add(device.async_load_on_wake)
+        manager.add(device.async_read_op_flags)
+        manager.add(device.async_set_heat_set_point, temperature=70)
+        manager.add(device.async_status)
+        assert manager.pending == [
+            "async_status",
+            "async_set_heat_set_point",
+            "async_read_op_flags",
+            "async_load_on_wake",
+        ]
+        assert manager.estimated_duration == 1 + 1 + 3 + 15
+        assert manager.fits_wake_window
+        manager = WakeCommandManager(wake_window=10)
+        manager.add(device.async_load_on_wake)
+        assert not manager.fits_wake_window
+
+    def test_requeue(self):
+        """Test failed commands are requeued until retries run out."""
+        device = MockBatteryDevice()
+        manager = WakeCommandManager()
+        manager.add(device.async_read_op_flags, retries=1)
+        wake_cmd = manager.pop_batch()[0]
+        manager.requeue(wake_cmd)
+        assert len(manager) == 1
+        wake_cmd = manager.pop_batch()[0]
+        manager.requeue(wake_cmd)
+        assert not manager
+        assert manager.wake_window == WAKE_WINDOW
+
+    @async_case
+    async def test_run_commands(self):
+        """Test running the commands passes the merged arguments."""
+        device = MockBatteryDevice()
+        manager = WakeCommandManager()
+        manager.add(device.async_load_on_wake, refresh=False)
+        manager.add(device.async_load_on_wake, refresh=True)
+        manager.add(device.async_status, group=3)
+        for wake_cmd in manager.pop_batch():
+            assert await wake_cmd.async_run() == ResponseStatus.SUCCESS
+        assert device.calls == [
+            ("async_status", 3),
+            ("async_load_on_wake", 0, 0, True),
+        ]
+
+    @async_case
+    async def test_run_commands_after_error(self):
+        """Test a command error does not drop the rest of the batch."""
+        device = GeneralController_RemoteLinc(random_address(), 0x00, 0x00)
+        mock_device = MockBatteryDevice()
+
+        async def _async_keep_awake(awake_time=0xFF):
+            return ResponseStatus.SUCCESS
+
+        async def async_read_op_flags():
+            raise ValueError("Command failed")
+
+        device.async_keep_awake = _async_keep_awake
+        device._wake_commands.add(mock_device.async_status, group=1)
+        device._wake_commands.add(async_read_op_flags, retries=2)
+        device._wake_commands.add(mock_device.async_load_on_wake)
+        await device._run_commands()
+
+        assert mock_device.calls == [
+            ("async_status", 1),
+            ("async_load_on_wake", 0, 0, False),
+        ]
+        # The failed command is requeued for the next wake up
+        assert device._wake_commands.pending == ["async_read_op_flags"]
@@ -35,7 +35,7 @@ class OutboundBase:
             self.topic = "send_extended"
         self.kwargs = kwargs
 
-    def write_message(self, msg, priority=5):
+    def write_message(self, msg, priority=5, token=None):
         """Set the message from the outbound publisher."""
         self.msg = msg
 
@@ -43,7 +43,7 @@ class TestOuboundCommands(TestCase):
         outbound_write_manager.protocol_write = self.receive_message
         set_log_levels(logger_topics=True)
 
-    def receive_message(self, msg, priority):
+    def receive_message(self, msg, priority, token=None):
         """Receive the outbound message."""
         self.msg = msg
         self.call_count += 1
@@ -1,11 +1,13 @@
 """Test loading the IM ALDB."""
 import asyncio
 import unittest
+from unittest.mock import patch
 
 from pyinsteon import pub
 from pyinsteon.address import Address
 from pyinsteon.aldb.modem_aldb import ModemALDB
 from pyinsteon.constants import ReadWriteMode
+from pyinsteon.managers import aldb_im_read_manager
 from pyinsteon.data_types.all_link_record_flags import AllLinkRecordFlags
 from pyinsteon.topics import (
     ALL_LINK_RECORD_RESPONSE,
@@ -262,6 +264,59 @@ class TestModemALDBLoad(unittest.TestCase):
             assert len(aldb) == 9  # Includes HWM record
             pub.unsubscribe(self.send_standard_response, SEND_READ_EEPROM_TOPIC)
 
+    @async_case
+    async def test_load_eeprom_pipelined(self):
+        """Test EEPROM reads are pipelined, reordered and retried."""
+        records = {item.kwargs["mem_addr"]: item for item in self.topics_eeprom}
+        requested = []
+        pending = set()
+        max_pending = 0
+        dropped = 0x1FEF
+        loop = asyncio.get_event_loop()
+
+        def send_record(mem_addr):
+            pending.discard(mem_addr)
+            rec_item = records.get(mem_addr)
+            if rec_item is None:
+                # Read past the HWM before the HWM was received
+                return
+            pub.sendMessage(rec_item.topic, **rec_item.kwargs)
+
+        def send_pipelined_response(mem_hi, mem_low):
+            nonlocal max_pending
+            mem_addr = (mem_hi << 8) + mem_low + 7
+            requested.append(mem_addr)
+            pub.sendMessage(ACK_EEPROM_TOPIC, mem_hi=mem_hi, mem_low=mem_low)
+            if mem_addr == dropped and requested.count(mem_addr) == 1:
+                return
+            pending.add(mem_addr)
+            max_pending = max(max_pending, len(pending))
+            # Later addresses respond first
+            delay = 0.05 if mem_addr % 16 == 7 else 0.01
+            loop.call_later(delay, send_record, mem_addr)
+
+        async with LOCK:
+            mgr = pub.getDefaultTopicMgr()
+            mgr.delTopic(ALL_LINK_RECORD_RESPONSE)
+            pub.subscribe(send_pipelined_response, SEND_READ_EEPROM_TOPIC)
+
+            aldb = ModemALDB(random_address())
+            aldb.read_write_mode = ReadWriteMode.EEPROM
+            with patch.object(aldb_im_read_manager, "TIMEOUT", 0.3):
+                await aldb.async_load()
+            pub.unsubscribe(send_pipelined_response, SEND_READ_EEPROM_TOPIC)
+
+        assert aldb.is_loaded
+        assert len(aldb) == 9
+        assert list(aldb) == sorted(records, reverse=True)
+        assert 1 < max_pending <= aldb_im_read_manager.EEPROM_WINDOW
+        assert requested.count(dropped) == 2
+        assert all(
+            requested.count(mem_addr) == 1
+            for mem_addr in records
+            if mem_addr != dropped
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
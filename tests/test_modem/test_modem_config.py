@@ -151,3 +151,21 @@ class TestModemConfig(TestCase):
         assert modem.configuration[MONITOR_MODE].new_value is None
         assert modem.configuration[AUTO_LED].new_value is None
         assert modem.configuration[DEADMAN].new_value is None
+
+    def test_load_config(self):
+        """Test loading cached modem flags."""
+        disable_auto_linking = random_bool()
+        monitor_mode = random_bool()
+        auto_led = random_bool()
+        deadman = random_bool()
+        modem = ModemBase()
+        modem.load_configuration(
+            disable_auto_linking=disable_auto_linking,
+            monitor_mode=monitor_mode,
+            auto_led=auto_led,
+            deadman=deadman,
+        )
+        assert modem.disable_auto_linking == disable_auto_linking
+        assert modem.monitor_mode == monitor_mode
+        assert modem.auto_led == auto_led
+        assert modem.deadman == deadman
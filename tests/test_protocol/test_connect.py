@@ -1,5 +1,6 @@
 """Test the connect method."""
 import asyncio
+from time import monotonic
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -7,6 +8,7 @@ import pyinsteon
 import pyinsteon.protocol.http_transport
 import pyinsteon.protocol.serial_transport
 from pyinsteon.constants import ResponseStatus
+from pyinsteon.managers.device_id_manager import DeviceId
 from pyinsteon.protocol import async_modem_connect
 from pyinsteon.subscriber_base import SubscriberBase
 from tests.utils import MockSerial, async_case, random_address
@@ -180,6 +182,54 @@ class TestConnectMethod(TestCase):
             modem.protocol.close()
             await asyncio.sleep(0.01)
 
+    @async_case
+    async def test_fast_connect(self):
+        """Test a fast connection does not wait between steps."""
+
+        mock_serial = MockSerial()
+        device = "some_device_path"
+        with patch.object(
+            pyinsteon.protocol.serial_transport, "serial", mock_serial
+        ), patch.object(pyinsteon.protocol, "GetImInfoHandler", MockGetImInfoSuccess):
+            start = monotonic()
+            modem = await async_modem_connect(device=device, fast_connect=True)
+            assert monotonic() - start < 0.5
+            assert modem.cat == 0x03
+            modem.protocol.close()
+            await asyncio.sleep(0.01)
+
+    @async_case
+    async def test_fast_connect_cached_modem_id(self):
+        """Test a fast connection uses the cached modem ID and verifies it."""
+
+        sent = 0
+
+        class MockGetImInfoCount(MockGetImInfoSuccess):
+            """Mock Get IM Info command counting the requests."""
+
+            async def async_send(self):
+                """Send the mock command."""
+                nonlocal sent
+                sent += 1
+                return await super().async_send()
+
+        mock_serial = MockSerial()
+        device = "some_device_path"
+        modem_id = DeviceId(random_address(), 0x03, 0x01, 0x02)
+        with patch.object(
+            pyinsteon.protocol.serial_transport, "serial", mock_serial
+        ), patch.object(pyinsteon.protocol, "GetImInfoHandler", MockGetImInfoCount):
+            modem = await async_modem_connect(
+                device=device, fast_connect=True, modem_id=modem_id
+            )
+            assert modem.address == modem_id.address
+            assert sent == 0
+            await asyncio.sleep(0.2)
+            assert sent == 1
+            assert not pyinsteon.protocol._VERIFY_TASKS
+            modem.protocol.close()
+            await asyncio.sleep(0.01)
+
     @async_case
     async def test_invalid_params(self):
         """Test creating a serial modem connection."""
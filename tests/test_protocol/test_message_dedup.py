@@ -0,0 +1,123 @@
+"""Test the inbound duplicate message filter."""
+
+import unittest
+from unittest.mock import patch
+
+from pyinsteon.constants import MessageFlagType
+from pyinsteon.protocol import message_dedup
+from pyinsteon.protocol.message_dedup import MessageDeduplicator
+from pyinsteon.protocol.messages.inbound import create
+
+from tests.utils import create_std_ext_msg, random_address
+
+# All-Link broadcast flags with max hops 3
+ALL_LINK_BROADCAST = 0xC0
+ALL_LINK_CLEANUP = 0x40
+DIRECT = 0x00
+
+
+def _create_msg(address, flags, hops_left, cmd1=0x11, cmd2=0x00, target="000001"):
+    """Create an inbound standard message."""
+    flags = flags | (hops_left << 2) | 3
+    msg, _ = create(
+        bytearray(create_std_ext_msg(address, flags, cmd1, cmd2, target=target))
+    )
+    return msg
+
+
+class TestMessageDedup(unittest.TestCase):
+    """Test the inbound duplicate message filter."""
+
+    def setUp(self):
+        """Set up the test."""
+        self.curr_time = 100.0
+
+    def _monotonic(self):
+        """Return the mocked time."""
+        return self.curr_time
+
+    def test_hop_reduction_is_duplicate(self):
+        """Test repeated broadcasts with fewer hops left are duplicates."""
+        dedup = MessageDeduplicator()
+        address = random_address()
+        with patch.object(message_dedup, "monotonic", self._monotonic):
+            assert not dedup.is_duplicate(_create_msg(address, ALL_LINK_BROADCAST, 3))
+            self.curr_time += 0.1
+            assert dedup.is_duplicate(_create_msg(address, ALL_LINK_BROADCAST, 2))
+            self.curr_time += 0.1
+            assert dedup.is_duplicate(_create_msg(address, ALL_LINK_BROADCAST, 1))
+        assert dedup.received == 3
+        assert dedup.suppressed == 2
+        assert dedup.suppressed_by_type == {MessageFlagType.ALL_LINK_BROADCAST: 2}
+
+    def test_new_events(self):
+        """Test new events are not suppressed."""
+        dedup = MessageDeduplicator()
+        address = random_address()
+        with patch.object(message_dedup, "monotonic", self._monotonic):
+            assert not dedup.is_duplicate(_create_msg(address, ALL_LINK_BROADCAST, 2))
+
+            # More hops left means a new button press
+            self.curr_time += 0.1
+            assert not dedup.is_duplicate(_create_msg(address, ALL_LINK_BROADCAST, 3))
+
+            # Same hops after MIN_DUP
+            self.curr_time += message_dedup.MIN_DUP + 0.1
+            assert not dedup.is_duplicate(_create_msg(address, ALL_LINK_BROADCAST, 3))
+
+            # Fewer hops after MAX_DUP
+            self.curr_time += message_dedup.MAX_DUP
+            assert not dedup.is_duplicate(_create_msg(address, ALL_LINK_BROADCAST, 2))
+
+            # Different command
+            assert not dedup.is_duplicate(
+                _create_msg(address, ALL_LINK_BROADCAST, 2, cmd1=0x13)
+            )
+
+            # Different group
+            assert not dedup.is_duplicate(
+                _create_msg(address, ALL_LINK_BROADCAST, 2, target="000002")
+            )
+        assert dedup.suppressed == 0
+
+    def test_cleanup_messages(self):
+        """Test repeated cleanup messages are duplicates of each other only."""
+        dedup = MessageDeduplicator()
+        address = random_address()
+        modem = random_address()
+        with patch.object(message_dedup, "monotonic", self._monotonic):
+            assert not dedup.is_duplicate(_create_msg(address, ALL_LINK_BROADCAST, 3))
+            self.curr_time += 0.1
+            assert not dedup.is_duplicate(
+                _create_msg(address, ALL_LINK_CLEANUP, 3, cmd2=0x01, target=modem)
+            )
+            self.curr_time += 0.1
+            assert dedup.is_duplicate(
+                _create_msg(address, ALL_LINK_CLEANUP, 3, cmd2=0x01, target=modem)
+            )
+        assert dedup.suppressed_by_type == {MessageFlagType.ALL_LINK_CLEANUP: 1}
+
+    def test_direct_messages_ignored(self):
+        """Test direct messages are never suppressed."""
+        dedup = MessageDeduplicator()
+        address = random_address()
+        modem = random_address()
+        with patch.object(message_dedup, "monotonic", self._monotonic):
+            assert not dedup.is_duplicate(_create_msg(address, DIRECT, 3, target=modem))
+            assert not dedup.is_duplicate(_create_msg(address, DIRECT, 3, target=modem))
+        assert dedup.received == 0
+
+    def test_table_purge(self):
+        """Test expired entries are purged when the table is full."""
+        dedup = MessageDeduplicator()
+        with patch.object(message_dedup, "monotonic", self._monotonic), patch.object(
+            message_dedup, "MAX_ENTRIES", 5
+        ):
+            for _ in range(5):
+                dedup.is_duplicate(_create_msg(random_address(), ALL_LINK_BROADCAST, 3))
+            self.curr_time += message_dedup.MAX_DUP
+            address = random_address()
+            dedup.is_duplicate(_create_msg(address, ALL_LINK_BROADCAST, 3))
+            assert len(dedup._table) == 1  # pylint: disable=protected-access
+            self.curr_time += 0.1
+            assert dedup.is_duplicate(_create_msg(address, ALL_LINK_BROADCAST, 2))
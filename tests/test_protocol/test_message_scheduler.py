@@ -0,0 +1,117 @@
+"""Test scheduling the messages queued to the modem."""
+
+import asyncio
+from itertools import count
+from types import SimpleNamespace
+import unittest
+
+from pyinsteon.protocol.message_scheduler import (
+    TRAFFIC_BULK,
+    TRAFFIC_INTERACTIVE,
+    FairScheduler,
+    MessageQueue,
+    PriorityScheduler,
+)
+
+from tests.utils import async_case, random_address
+
+SEQUENCE = count()
+
+
+def _item(address, priority, name=None):
+    """Return a queue entry of a message to a device."""
+    msg = SimpleNamespace(address=address, name=name)
+    return (priority, next(SEQUENCE), msg, None)
+
+
+class TestMessageScheduler(unittest.TestCase):
+    """Test scheduling the messages queued to the modem."""
+
+    def test_interactive_during_aldb_load(self):
+        """Test an interactive message is sent next during a bulk ALDB load."""
+        scheduler = FairScheduler()
+        aldb_device = random_address()
+        for _ in range(20):
+            scheduler.push(_item(aldb_device, 10))
+        scheduler.pop()
+        scheduler.push(_item(random_address(), 3, "on"))
+
+        assert scheduler.pop()[2].name == "on"
+        assert len(scheduler) == 19
+
+    def test_devices_in_turn(self):
+        """Test the devices in a traffic class are sent to in turn."""
+        scheduler = FairScheduler()
+        address_a = random_address()
+        address_b = random_address()
+        for _ in range(5):
+            scheduler.push(_item(address_a, 10))
+        scheduler.push(_item(address_b, 10))
+
+        sent = [scheduler.pop()[2].address for _ in range(3)]
+        assert sent == [address_a, address_b, address_a]
+
+    def test_no_starvation(self):
+        """Test bulk messages are sent while interactive messages are queued."""
+        scheduler = FairScheduler()
+        address = random_address()
+        for _ in range(4):
+            scheduler.push(_item(address, 10, "bulk"))
+        for _ in range(40):
+            scheduler.push(_item(random_address(), 3, "on"))
+
+        sent = [scheduler.pop()[2].name for _ in range(27)]
+        assert sent.count("bulk") == 3
+
+        # The priority scheduler sends all interactive messages first
+        scheduler = PriorityScheduler()
+        for _ in range(4):
+            scheduler.push(_item(address, 10, "bulk"))
+        for _ in range(40):
+            scheduler.push(_item(random_address(), 3, "on"))
+        sent = [scheduler.pop()[2].name for _ in range(27)]
+        assert "bulk" not in sent
+
+    def test_prune(self):
+        """Test removing queued messages."""
+        scheduler = FairScheduler()
+        address = random_address()
+        for priority in [3, 7, 10, 10]:
+            scheduler.push(_item(address, priority))
+
+        assert scheduler.prune(lambda item: item[0] == 10) == 2
+        assert [scheduler.pop()[0] for _ in range(len(scheduler))] == [3, 7]
+
+    @async_case
+    async def test_metrics(self):
+        """Test the queue wait metrics by traffic class."""
+        queue = MessageQueue()
+        address = random_address()
+        queue.put_nowait(_item(address, 10))
+        queue.put_nowait(_item(address, 3))
+        await asyncio.sleep(0.05)
+        await queue.get()
+        await queue.get()
+
+        assert queue.empty()
+        interactive = queue.metrics[TRAFFIC_INTERACTIVE]
+        bulk = queue.metrics[TRAFFIC_BULK]
+        assert interactive.count == 1
+        assert bulk.count == 1
+        assert interactive.max_wait >= 0.05
+        assert bulk.average_wait >= interactive.average_wait
+
+    @async_case
+    async def test_stop_sentinel_first(self):
+        """Test the writer stop sentinel is returned before scheduled messages."""
+        queue = MessageQueue()
+        for _ in range(20):
+            queue.put_nowait(_item(random_address(), 3))
+        queue.put_nowait(_item(random_address(), 10, "bulk"))
+        for _ in range(8):
+            await queue.get()
+
+        await queue.put((0, next(SEQUENCE), None, None))
+        assert queue.qsize() == 14
+        assert (await queue.get())[2] is None
+        assert (await queue.get())[2].name == "bulk"
@@ -1,12 +1,16 @@
 """Test the protocol class."""
+
 import asyncio
 from binascii import unhexlify
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from pyinsteon import pub
 from pyinsteon.address import Address
-from pyinsteon.topics import ON
+from pyinsteon.protocol.message_scheduler import TRAFFIC_BULK, TRAFFIC_CONFIG
+from pyinsteon.protocol.protocol import PRUNE_QUEUE_SIZE, PRUNE_WRITE_COUNT
+from pyinsteon.send_token import SendToken
+from pyinsteon.topics import EXTENDED_READ_WRITE_ALDB, GET_FIRST_ALL_LINK_RECORD, ON
 
 from tests import set_log_levels
 from tests.utils import (
@@ -209,3 +213,80 @@ class TestProtocol(unittest.TestCase):
             protocol.resume_writing()
             await asyncio.sleep(0.1)
             assert protocol.message_queue.empty()
+
+    @async_case
+    async def test_expired_messages_dropped(self):
+        """Test expired and cancelled messages are not written."""
+        write_queue = asyncio.Queue()
+        on_sent = Mock()
+        async with async_protocol_manager(
+            auto_ack=False, write_queue=write_queue
+        ) as protocol:
+            await asyncio.sleep(0.1)
+            cancelled = SendToken(60, on_sent=on_sent)
+            protocol.write(
+                unhexlify("02620a0b0c09110b"), token=SendToken(60, on_sent=on_sent)
+            )
+            protocol.write(
+                unhexlify("02620a0b0c09120b"), token=SendToken(-1, on_sent=on_sent)
+            )
+            protocol.write(unhexlify("02620a0b0c09130b"), token=cancelled)
+            protocol.write(unhexlify("02620a0b0c09140b"))
+            cancelled.cancel()
+            await asyncio.sleep(0.2)
+
+            written = []
+            while not write_queue.empty():
+                written.append(bytes(write_queue.get_nowait()).hex())
+            assert written == ["02620a0b0c09110b", "02620a0b0c09140b"]
+            # Only the written message is marked as sent
+            on_sent.assert_called_once_with()
+
+    @async_case
+    async def test_prune_after_write_count(self):
+        """Test a full queue is pruned once every `PRUNE_WRITE_COUNT` writes."""
+        async with async_protocol_manager(auto_ack=False) as protocol:
+            await asyncio.sleep(0.1)
+            protocol.pause_writing()
+            await asyncio.sleep(0.1)
+            token = SendToken(60)
+            with patch.object(
+                protocol,
+                "_prune_message_queue",
+                wraps=protocol._prune_message_queue,
+            ) as prune:
+                for _ in range(PRUNE_QUEUE_SIZE + PRUNE_WRITE_COUNT * 2):
+                    protocol.write(unhexlify("02620a0b0c09110b"), token=token)
+                assert prune.call_count == 2
+
+            token.cancel()
+            protocol.resume_writing()
+            await asyncio.sleep(0.1)
+            assert protocol.message_queue.empty()
+
+    @async_case
+    async def test_device_aldb_read_is_bulk(self):
+        """Test a device ALDB read is scheduled as bulk traffic."""
+        async with async_protocol_manager() as protocol:
+            await asyncio.sleep(0.1)
+            pub.sendMessage(
+                f"send.{EXTENDED_READ_WRITE_ALDB}.direct",
+                address=random_address(),
+                action=0x00,
+                mem_addr=0x0FFF,
+                num_recs=1,
+            )
+            await asyncio.sleep(0.2)
+
+            assert protocol.message_queue.metrics[TRAFFIC_BULK].count == 1
+            assert protocol.message_queue.metrics[TRAFFIC_CONFIG].count == 0
+
+    @async_case
+    async def test_modem_aldb_read_is_bulk(self):
+        """Test a modem ALDB read is scheduled as bulk traffic."""
+        async with async_protocol_manager() as protocol:
+            await asyncio.sleep(0.1)
+            pub.sendMessage(f"send.{GET_FIRST_ALL_LINK_RECORD}")
+            await asyncio.sleep(0.2)
+
+            assert protocol.message_queue.metrics[TRAFFIC_BULK].count == 1